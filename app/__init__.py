@@ -93,10 +93,22 @@ def create_app(config_class=Config):
     # WebSocket 초기화 (CORS 설정 포함)
     # REST API와 동일한 도메인만 허용
     # async_mode='gevent': 프로덕션에서 gevent worker 사용 (Python 3.12 호환)
+    # message_queue: 설정 시 모든 워커/인스턴스가 큐를 통해 같은 경기 방에 브로드캐스트
+    message_queue = app.config.get('SOCKETIO_MESSAGE_QUEUE')
     socketio.init_app(app,
         cors_allowed_origins=cors_origins,
-        async_mode='gevent'
+        async_mode='gevent',
+        message_queue=message_queue
     )
+    print(f"[WebSocket] Message queue: {message_queue or 'disabled (single worker)'}")
+
+    # 경기 이벤트 순번/재전송 버퍼 (멀티 워커 모드에서는 Redis 공유)
+    from app.routes.game.event_log import game_event_log
+    game_event_log.init_app(app)
+
+    # 방 이름/명단 캐시 무효화를 다른 워커에도 전달 (멀티 워커 모드)
+    from app import ttl_cache
+    ttl_cache.init_app(app)
 
     # Blueprint 등록
     from app.routes import commands
@@ -145,25 +157,95 @@ def create_app(config_class=Config):
         db.create_all()
         print("[OK] PostgreSQL tables created")
 
-        # lineup_snapshot 컬럼 추가 (마이그레이션)
+        # 누락된 컬럼 추가 (마이그레이션)
+        # (테이블, 컬럼, 컬럼 정의)
+        column_migrations = [
+            ('quarters', 'lineup_snapshot', 'JSON'),
+            ('games', 'version', 'INTEGER NOT NULL DEFAULT 1'),
+            ('lineups', 'version', 'INTEGER NOT NULL DEFAULT 1'),
+            ('quarters', 'version', 'INTEGER NOT NULL DEFAULT 1'),
+            ('scheduled_messages', 'days_mask', 'INTEGER NOT NULL DEFAULT 0'),
+        ]
+
         try:
             from sqlalchemy import inspect, text
             inspector = inspect(db.engine)
 
-            # quarters 테이블에 lineup_snapshot 컬럼이 있는지 확인
-            columns = [col['name'] for col in inspector.get_columns('quarters')]
-
-            if 'lineup_snapshot' not in columns:
-                print("[Migration] Adding lineup_snapshot column to quarters table...")
-                db.session.execute(text(
-                    "ALTER TABLE quarters ADD COLUMN lineup_snapshot JSON"
-                ))
-                db.session.commit()
-                print("[OK] lineup_snapshot column added")
-            else:
-                print("[OK] lineup_snapshot column already exists")
+            for table, column, definition in column_migrations:
+                # 테이블에 컬럼이 있는지 확인
+                columns = [col['name'] for col in inspector.get_columns(table)]
+
+                if column not in columns:
+                    print(f"[Migration] Adding {column} column to {table} table...")
+                    db.session.execute(text(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+                    ))
+                    db.session.commit()
+                    print(f"[OK] {table}.{column} column added")
+                else:
+                    print(f"[OK] {table}.{column} column already exists")
         except Exception as e:
             print(f"[WARNING] Migration check failed: {e}")
             db.session.rollback()
 
+        # 누락된 인덱스 추가 (기존 테이블에는 create_all이 인덱스를 만들지 않음)
+        try:
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(db.engine, checkfirst=True)
+            print("[OK] Indexes checked")
+        except Exception as e:
+            print(f"[WARNING] Index migration check failed: {e}")
+
+        # unique_lineup 제약을 DEFERRABLE로 변경 (PostgreSQL, 순번 일괄 재정렬용)
+        if db.engine.dialect.name == 'postgresql':
+            try:
+                from sqlalchemy import text
+                deferrable = db.session.execute(text(
+                    "SELECT condeferrable FROM pg_constraint WHERE conname = 'unique_lineup'"
+                )).scalar()
+
+                if deferrable is False:
+                    print("[Migration] Making unique_lineup constraint deferrable...")
+                    db.session.execute(text("ALTER TABLE lineups DROP CONSTRAINT unique_lineup"))
+                    db.session.execute(text(
+                        "ALTER TABLE lineups ADD CONSTRAINT unique_lineup "
+                        "UNIQUE (game_id, team, number) DEFERRABLE INITIALLY IMMEDIATE"
+                    ))
+                    db.session.commit()
+                    print("[OK] unique_lineup constraint is now deferrable")
+                else:
+                    print("[OK] unique_lineup constraint already deferrable")
+            except Exception as e:
+                print(f"[WARNING] Constraint migration check failed: {e}")
+                db.session.rollback()
+
+        # scheduled_messages.days_of_week 배열 → days_mask 비트마스크 백필 (PostgreSQL)
+        if db.engine.dialect.name == 'postgresql':
+            try:
+                from sqlalchemy import inspect, text
+                legacy_column = next((
+                    col for col in inspect(db.engine).get_columns('scheduled_messages')
+                    if col['name'] == 'days_of_week'
+                ), None)
+
+                # 백필 후에는 NOT NULL을 해제하므로 NOT NULL이면 아직 백필하지 않은 상태
+                if legacy_column is not None and not legacy_column['nullable']:
+                    print("[Migration] Backfilling scheduled_messages.days_mask...")
+                    db.session.execute(text(
+                        "UPDATE scheduled_messages SET days_mask = COALESCE(("
+                        "SELECT bit_or(1 << (day - 1)) FROM unnest(days_of_week) AS day "
+                        "WHERE day BETWEEN 1 AND 7), 0)"
+                    ))
+                    db.session.execute(text(
+                        "ALTER TABLE scheduled_messages ALTER COLUMN days_of_week DROP NOT NULL"
+                    ))
+                    db.session.commit()
+                    print("[OK] scheduled_messages.days_mask backfilled")
+                else:
+                    print("[OK] scheduled_messages.days_mask already backfilled")
+            except Exception as e:
+                print(f"[WARNING] days_mask migration check failed: {e}")
+                db.session.rollback()
+
     return app
@@ -0,0 +1,220 @@
+"""
+예약 메시지 전달 기록 (Delivery Ledger)
+
+봇이 같은 분에 /pending을 다시 호출하거나 봇을 여러 개 띄워도 예약 메시지가 한 번만
+전달되도록 발송 회차(message_id + 날짜/시각)마다 먼저 가져간 요청 하나만 선점합니다.
+
+    선점: scheduled_message_deliveries에 INSERT ... ON CONFLICT DO NOTHING RETURNING으로
+          기록하여 DB가 결정 (여러 워커에서도 한 요청만 성공)
+    메모리: 이미 선점된 것으로 확인한 메시지는 DB를 다시 조회하지 않고 바로 제외
+    DB 장애: 메모리에서 선점하고 FLUSH_INTERVAL마다 다시 저장을 시도
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from sqlalchemy import delete, insert as insert_plain
+from sqlalchemy.exc import IntegrityError
+from app.models import db, ScheduledMessageDelivery
+
+# DB 장애로 메모리에서만 선점한 기록을 다시 저장하는 주기 (초)
+FLUSH_INTERVAL = 2
+
+# 메모리에 보관할 최대 회차 수 (LRU 방식으로 오래된 회차부터 제거)
+MAX_CACHED_OCCURRENCES = 120
+
+# DB 기록 보관 기간
+LEDGER_RETENTION = timedelta(days=7)
+
+# 오래된 DB 기록 정리 주기 (초)
+PURGE_INTERVAL = 60 * 60
+
+
+def occurrence_of(day_date, scheduled_time):
+    """발송 회차 (날짜 + 예약 시각, 분 단위)"""
+    return datetime.combine(day_date, scheduled_time).replace(second=0, microsecond=0)
+
+
+def occurrence_date(day, today=None):
+    """
+    요청한 요일(1=월요일, 7=일요일)의 발송 날짜
+
+    봇과 서버의 날짜가 자정 무렵 어긋날 수 있으므로 오늘과 가장 가까운(앞뒤 3일 이내) 그 요일 날짜를 사용합니다.
+    """
+    today = today or date.today()
+    offset = (day - (today.weekday() + 1)) % 7
+    if offset > 3:
+        offset -= 7
+    return today + timedelta(days=offset)
+
+
+class DeliveryLedger:
+    """발송 회차별 메시지 선점 기록 (스레드 안전)"""
+
+    def __init__(self):
+        # 회차 → 선점된 것으로 확인한 message_id 집합
+        self._claims = OrderedDict()
+        # DB 장애로 아직 저장하지 못한 선점 기록
+        self._pending_writes = []
+        self._last_purge = time.monotonic()
+        self._flusher_started = False
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def claim_many(self, occurrence, message_ids, claimed_by=None):
+        """
+        회차의 메시지들을 선점 (앱 컨텍스트 필요)
+
+        Args:
+            occurrence: 발송 회차 (occurrence_of() 결과)
+            message_ids: 선점할 메시지 ID들
+            claimed_by: 선점한 봇 (기록용)
+
+        Returns:
+            이번 호출에서 새로 선점한 message_id 집합 (이미 선점된 메시지는 제외)
+        """
+        with self._lock:
+            taken = self._claims.setdefault(occurrence, set())
+            self._claims.move_to_end(occurrence)
+            candidates = [message_id for message_id in dict.fromkeys(message_ids) if message_id not in taken]
+            self._evict()
+
+        if not candidates:
+            return set()
+
+        rows = [{
+            'message_id': message_id,
+            'occurrence': occurrence,
+            'claimed_by': claimed_by,
+            'claimed_at': datetime.utcnow()
+        } for message_id in candidates]
+
+        try:
+            claimed = self._insert(rows)
+        except Exception as e:
+            # DB에 저장할 수 없으면 메모리에서 선점하고 나중에 다시 저장
+            print(f"[DeliveryLedger] Failed to claim {len(rows)} messages, claiming in memory: {e}")
+            with self._lock:
+                rows = [row for row in rows if row['message_id'] not in taken]
+                taken.update(row['message_id'] for row in rows)
+                self._pending_writes.extend(rows)
+            return {row['message_id'] for row in rows}
+
+        with self._lock:
+            # 다른 요청이 먼저 선점한 메시지도 이제 선점된 것으로 기억
+            taken.update(candidates)
+
+        return claimed
+
+    def claim(self, occurrence, message_id, claimed_by=None):
+        """메시지 하나 선점 (새로 선점했으면 True)"""
+        return message_id in self.claim_many(occurrence, [message_id], claimed_by)
+
+    def start_flusher(self, app):
+        """재저장/정리 greenlet 시작 (처음 한 번만)"""
+        with self._lock:
+            if self._flusher_started:
+                return
+            self._flusher_started = True
+
+        from app import socketio
+        socketio.start_background_task(self._run_flusher, app)
+        print("[DeliveryLedger] Flusher started")
+
+    def _run_flusher(self, app):
+        from app import socketio
+
+        while True:
+            socketio.sleep(FLUSH_INTERVAL)
+            try:
+                with app.app_context():
+                    self.flush()
+                    if time.monotonic() - self._last_purge > PURGE_INTERVAL:
+                        self.purge()
+            except Exception as e:
+                print(f"[DeliveryLedger] Flush error: {e}")
+
+    def flush(self):
+        """
+        DB 장애로 메모리에서만 선점한 기록을 다시 저장 (앱 컨텍스트 필요)
+
+        Returns:
+            저장한 기록 수 (다른 워커가 먼저 선점한 기록은 제외)
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows = self._pending_writes
+                self._pending_writes = []
+
+            if not rows:
+                return 0
+
+            try:
+                saved = self._insert(rows)
+            except Exception as e:
+                # 다음 주기에 다시 시도
+                print(f"[DeliveryLedger] Failed to persist {len(rows)} claims: {e}")
+                with self._lock:
+                    self._pending_writes[:0] = rows
+                return 0
+
+            lost = len(rows) - len(saved)
+            if lost:
+                print(f"[DeliveryLedger] {lost} in-memory claims were already taken by another worker")
+            return len(saved)
+
+    def purge(self):
+        """보관 기간이 지난 DB 기록 삭제 (앱 컨텍스트 필요)"""
+        self._last_purge = time.monotonic()
+        with db.engine.begin() as connection:
+            result = connection.execute(
+                delete(ScheduledMessageDelivery).where(
+                    ScheduledMessageDelivery.occurrence < datetime.now() - LEDGER_RETENTION
+                )
+            )
+        if result.rowcount:
+            print(f"[DeliveryLedger] Purged {result.rowcount} old deliveries")
+
+    def _evict(self):
+        while len(self._claims) > MAX_CACHED_OCCURRENCES:
+            self._claims.popitem(last=False)
+
+    @staticmethod
+    def _insert(rows):
+        """
+        선점 기록 저장 (이미 있는 기록은 무시)
+
+        요청의 트랜잭션과 섞이지 않도록 별도 연결에서 커밋합니다.
+
+        Returns:
+            새로 저장된 기록의 message_id 집합
+        """
+        table = ScheduledMessageDelivery.__table__
+
+        with db.engine.begin() as connection:
+            dialect = connection.dialect.name
+            if dialect in ('postgresql', 'sqlite'):
+                if dialect == 'postgresql':
+                    from sqlalchemy.dialects.postgresql import insert
+                else:
+                    from sqlalchemy.dialects.sqlite import insert
+                stmt = (
+                    insert(table).values(rows)
+                    .on_conflict_do_nothing(index_elements=['message_id', 'occurrence'])
+                    .returning(table.c.message_id)
+                )
+                return set(connection.execute(stmt).scalars())
+
+        # ON CONFLICT를 지원하지 않는 DB는 한 건씩 저장
+        saved = set()
+        for row in rows:
+            try:
+                with db.engine.begin() as connection:
+                    connection.execute(insert_plain(table), row)
+            except IntegrityError:
+                continue
+            saved.add(row['message_id'])
+        return saved
+
+
+delivery_ledger = DeliveryLedger()
@@ -3,10 +3,20 @@ PostgreSQL 데이터 모델 (경기 데이터)
 """
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.ext.compiler import compiles
 
 db = SQLAlchemy()
 
 
+@compiles(UniqueConstraint, 'sqlite')
+def _compile_unique_constraint_sqlite(constraint, compiler, **kw):
+    """SQLite는 UNIQUE 제약의 DEFERRABLE 구문을 지원하지 않으므로 생략 (항상 즉시 검사)"""
+    if len(constraint) == 0:
+        return ''
+    return compiler.define_constraint_preamble(constraint, **kw) + compiler.define_unique_body(constraint, **kw)
+
+
 class Room(db.Model):
     """방 정보"""
     __tablename__ = 'rooms'
@@ -102,10 +112,20 @@ class Game(db.Model):
     final_score_away = db.Column(db.Integer)
     winner = db.Column(db.String(10))  # home, away, 무승부
     parent_game_id = db.Column(db.String(8), db.ForeignKey('games.game_id', ondelete='SET NULL'), nullable=True)  # 이어하기 시 원본 경기
+    version = db.Column(db.Integer, nullable=False, default=1)  # 낙관적 동시성 제어 (변경 시마다 증가)
 
     # 관계 (CASCADE DELETE)
     lineups = db.relationship('Lineup', backref='game', cascade='all, delete-orphan', lazy=True)
     quarters = db.relationship('Quarter', backref='game', cascade='all, delete-orphan', lazy=True)
+    score_events = db.relationship('ScoreEvent', backref='game', cascade='all, delete-orphan', lazy=True)
+
+    __table_args__ = (
+        # 경기 목록 커서 페이지네이션 ((created_at, game_id) 내림차순)
+        db.Index('idx_game_created_at_id', 'created_at', 'game_id'),
+        db.Index('idx_game_room_created_at_id', 'room_id', 'created_at', 'game_id'),
+    )
+
+    __mapper_args__ = {'version_id_col': version}
 
     def to_dict(self):
         """딕셔너리 변환"""
@@ -127,7 +147,8 @@ class Game(db.Model):
                 'away': self.final_score_away
             } if self.final_score_home is not None else None,
             'winner': self.winner,
-            'parent_game_id': self.parent_game_id
+            'parent_game_id': self.parent_game_id,
+            'version': self.version
         }
 
 
@@ -152,12 +173,18 @@ class Lineup(db.Model):
     arrived = db.Column(db.Boolean, default=True)
     arrived_at = db.Column(db.DateTime, default=datetime.utcnow)
     playing_status = db.Column(db.String(10), default='playing')  # playing, bench
+    version = db.Column(db.Integer, nullable=False, default=1)  # 낙관적 동시성 제어 (변경 시마다 증가)
 
     __table_args__ = (
-        db.UniqueConstraint('game_id', 'team', 'number', name='unique_lineup'),
+        # 순번 일괄 재정렬(CASE UPDATE)은 문장 끝에서 검사해야 하므로 DEFERRABLE (PostgreSQL)
+        # (기존 테이블은 create_app 마이그레이션에서 변경)
+        db.UniqueConstraint('game_id', 'team', 'number', name='unique_lineup',
+                            deferrable=True, initially='IMMEDIATE'),
         db.Index('idx_lineup_game_team', 'game_id', 'team'),
     )
 
+    __mapper_args__ = {'version_id_col': version}
+
     def to_dict(self):
         """딕셔너리 변환"""
         return {
@@ -169,7 +196,8 @@ class Lineup(db.Model):
             'number': self.number,
             'arrived': self.arrived,
             'arrived_at': self.arrived_at.isoformat() + 'Z' if self.arrived_at else None,
-            'playing_status': self.playing_status or 'playing'
+            'playing_status': self.playing_status or 'playing',
+            'version': self.version
         }
 
 
@@ -190,12 +218,15 @@ class Quarter(db.Model):
     score_away = db.Column(db.Integer, default=0)
     started_at = db.Column(db.DateTime, default=datetime.utcnow)
     ended_at = db.Column(db.DateTime)
+    version = db.Column(db.Integer, nullable=False, default=1)  # 낙관적 동시성 제어 (변경 시마다 증가)
 
     __table_args__ = (
         db.UniqueConstraint('game_id', 'quarter_number', name='unique_quarter'),
         db.Index('idx_quarter_game', 'game_id'),
     )
 
+    __mapper_args__ = {'version_id_col': version}
+
     def to_dict(self):
         """딕셔너리 변환"""
         return {
@@ -215,7 +246,43 @@ class Quarter(db.Model):
                 'away': self.score_away
             },
             'started_at': self.started_at.isoformat() + 'Z' if self.started_at else None,
-            'ended_at': self.ended_at.isoformat() + 'Z' if self.ended_at else None
+            'ended_at': self.ended_at.isoformat() + 'Z' if self.ended_at else None,
+            'version': self.version
+        }
+
+
+class ScoreEvent(db.Model):
+    """
+    득점 기록 (append-only)
+
+    쿼터 점수(Quarter.score_home/score_away)는 이전 쿼터부터 이어지는 누적 점수이므로,
+    득점이 기록되면 해당 쿼터와 이후 쿼터의 점수가 points만큼 함께 증가합니다.
+    잘못 기록된 득점은 삭제하지 않고 음수 points로 정정합니다.
+    """
+    __tablename__ = 'score_events'
+
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.String(8), db.ForeignKey('games.game_id', ondelete='CASCADE'), nullable=False)
+    quarter_number = db.Column(db.Integer, nullable=False)
+    team = db.Column(db.String(10), nullable=False)  # home, away
+    points = db.Column(db.Integer, nullable=False)  # 1, 2, 3 (정정 시 음수)
+    lineup_id = db.Column(db.Integer, db.ForeignKey('lineups.id', ondelete='SET NULL'), nullable=True)  # 득점 선수 (선택)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('idx_score_event_game_quarter', 'game_id', 'quarter_number'),
+    )
+
+    def to_dict(self):
+        """딕셔너리 변환"""
+        return {
+            'id': self.id,
+            'game_id': self.game_id,
+            'quarter': self.quarter_number,
+            'team': self.team,
+            'points': self.points,
+            'lineup_id': self.lineup_id,
+            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None
         }
 
 
@@ -262,6 +329,19 @@ class MemberTag(db.Model):
     )
 
 
+def days_to_mask(days):
+    """요일 리스트 → 비트마스크 (1=월요일 → 1, 7=일요일 → 64)"""
+    mask = 0
+    for day in days or []:
+        mask |= 1 << (day - 1)
+    return mask
+
+
+def mask_to_days(mask):
+    """비트마스크 → 요일 리스트 (오름차순)"""
+    return [day for day in range(1, 8) if mask & (1 << (day - 1))]
+
+
 class ScheduledMessage(db.Model):
     """예약 메시지"""
     __tablename__ = 'scheduled_messages'
@@ -270,16 +350,47 @@ class ScheduledMessage(db.Model):
     room_id = db.Column(db.String(8), db.ForeignKey('rooms.room_id', ondelete='CASCADE'), nullable=False)
     message = db.Column(db.Text, nullable=False)
     scheduled_time = db.Column(db.Time, nullable=False)
-    days_of_week = db.Column(db.ARRAY(db.Integer), nullable=False)
+    # 보낼 요일 비트마스크 (bit 0=월요일 ... bit 6=일요일)
+    # 기존 days_of_week INTEGER[] 컬럼은 마이그레이션 후 사용하지 않음
+    days_mask = db.Column(db.Integer, nullable=False, default=0)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_by = db.Column(db.String(100))
 
     __table_args__ = (
         db.Index('idx_scheduled_message_room', 'room_id'),
-        db.Index('idx_scheduled_message_active', 'is_active'),
+        db.Index('idx_scheduled_message_active_time', 'is_active', 'scheduled_time'),
     )
 
+    @property
+    def days_of_week(self):
+        """보낼 요일 리스트 (1=월요일, 7=일요일)"""
+        return mask_to_days(self.days_mask or 0)
+
+    @days_of_week.setter
+    def days_of_week(self, days):
+        self.days_mask = days_to_mask(days)
+
+    @classmethod
+    def query_pending(cls, day=None, scheduled_time=None):
+        """
+        보낼 활성 예약 메시지 쿼리 (SQL에서 모두 필터링)
+
+        (is_active, scheduled_time) 인덱스로 시각을 찾고 요일은 비트 AND로 거릅니다.
+
+        Args:
+            day: 요일 (1=월요일, 7=일요일, 생략 시 요일이 하나라도 있는 메시지)
+            scheduled_time: datetime.time (분 단위, 생략 시 모든 시각)
+        """
+        conditions = [cls.is_active == True]
+        if scheduled_time is not None:
+            conditions.append(cls.scheduled_time == scheduled_time)
+        if day is not None:
+            conditions.append(cls.days_mask.op('&')(1 << (day - 1)) != 0)
+        else:
+            conditions.append(cls.days_mask != 0)
+        return cls.query.filter(*conditions)
+
     def to_dict(self):
         """딕셔너리 변환"""
         return {
@@ -292,3 +403,19 @@ class ScheduledMessage(db.Model):
             'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
             'created_by': self.created_by
         }
+
+
+class ScheduledMessageDelivery(db.Model):
+    """예약 메시지 전달 기록 (발송 회차별로 한 번만 전달)"""
+    __tablename__ = 'scheduled_message_deliveries'
+
+    id = db.Column(db.Integer, primary_key=True)
+    message_id = db.Column(db.Integer, db.ForeignKey('scheduled_messages.id', ondelete='CASCADE'), nullable=False)
+    occurrence = db.Column(db.DateTime, nullable=False)  # 발송 회차 (날짜 + 예약 시각, 분 단위)
+    claimed_by = db.Column(db.String(100))  # 메시지를 받아 간 봇
+    claimed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('message_id', 'occurrence', name='unique_message_occurrence'),
+        db.Index('idx_scheduled_message_delivery_occurrence', 'occurrence'),
+    )
@@ -0,0 +1,274 @@
+"""
+예약 메시지 전송함 (Long-poll Outbox)
+
+봇이 1분마다 /pending을 호출하는 대신 봇별 전송함을 long-poll로 기다립니다.
+서버의 디스패처 greenlet이 매 분 정각에 깨어나 예약 시간 인덱스에서 해당 분의 메시지를 찾아
+그 방을 맡은 봇들의 전송함에 넣고, 기다리던 요청을 즉시 깨웁니다.
+
+흐름:
+    1. 봇: GET /api/scheduled-messages/outbox?bot_id=...&rooms=...&timeout=30
+       → 전송할 메시지가 생기거나 timeout이 지날 때까지 대기
+    2. 봇: 메시지 전송 후 POST /api/scheduled-messages/outbox/ack 로 delivery_id 확인
+    3. 확인하지 않은 메시지는 REDELIVERY_TIMEOUT이 지나면 다시 전달,
+       DELIVERY_TTL이 지나면 폐기 (지난 예약 메시지는 보내지 않음)
+
+중복 방지:
+    같은 봇에는 (message_id, 발송 분) 조합을 한 번만 넣으므로
+    디스패처가 같은 분에 여러 번 실행되거나 봇이 다시 등록해도 중복 전달되지 않습니다.
+    같은 방을 맡은 봇이 여럿이면 처음 전달할 때 delivery_ledger로 회차를 선점하여
+    먼저 가져간 봇 하나만 받습니다. (/pending 조회와 같은 기록을 사용)
+
+gevent:
+    gunicorn gevent 워커는 threading을 monkey patch 하므로 threading.Event 대기는
+    greenlet만 멈추고 워커는 다른 요청을 계속 처리합니다.
+
+멀티 워커:
+    전송함은 워커 메모리에 있으므로 봇의 long-poll과 ack는 같은 워커로 가야 합니다.
+    (워커 1개 또는 sticky session, README의 멀티 워커 안내 참고)
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# long-poll 최대 대기 시간 (초)
+MAX_POLL_TIMEOUT = 55
+
+# 확인(ack)되지 않은 메시지를 다시 전달하기까지의 시간 (초)
+REDELIVERY_TIMEOUT = 60
+
+# 전달하지 못한 메시지를 보관하는 시간 (초)
+DELIVERY_TTL = 5 * 60
+
+# 이 시간 동안 poll 하지 않은 봇은 전송함 제거 (초)
+BOT_IDLE_TIMEOUT = 10 * 60
+
+
+class BotOutbox:
+    """봇 하나의 전송함"""
+
+    def __init__(self, bot_id):
+        self.bot_id = bot_id
+        self.rooms = None  # None이면 모든 방
+        self.deliveries = OrderedDict()  # delivery_id → delivery
+        self.delivered_keys = {}  # (message_id, 발송 분) → 넣은 시각 (중복 방지)
+        self.event = threading.Event()
+        self.last_seen = time.monotonic()
+
+    def wants(self, room_name):
+        return self.rooms is None or room_name in self.rooms
+
+
+class OutboxRegistry:
+    """봇별 전송함 레지스트리 + 매 분 디스패처 (스레드 안전)"""
+
+    def __init__(self):
+        self._outboxes = {}
+        self._lock = threading.Lock()
+        self._dispatcher_started = False
+
+    def start_dispatcher(self, app):
+        """디스패처 greenlet 시작 (처음 한 번만)"""
+        with self._lock:
+            if self._dispatcher_started:
+                return
+            self._dispatcher_started = True
+
+        from app import socketio
+        socketio.start_background_task(self._run_dispatcher, app)
+        print("[Outbox] Dispatcher started")
+
+    def _run_dispatcher(self, app):
+        from app import socketio
+
+        while True:
+            try:
+                with app.app_context():
+                    self.dispatch(datetime.now())
+            except Exception as e:
+                print(f"[Outbox] Dispatch error: {e}")
+
+            # 다음 분 정각까지 대기
+            now = datetime.now()
+            next_minute = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+            socketio.sleep(max((next_minute - now).total_seconds(), 0.05))
+
+    def dispatch(self, now, bot_ids=None):
+        """
+        now가 속한 분에 예약된 메시지를 봇 전송함에 넣기 (앱 컨텍스트 필요)
+
+        Args:
+            now: 기준 시각
+            bot_ids: 대상 봇 (없으면 등록된 모든 봇)
+
+        Returns:
+            전송함에 넣은 메시지 수
+        """
+        from sqlalchemy import select
+        from app.models import db, Room
+        from app.schedule_index import schedule_index
+
+        self._evict_idle()
+
+        minute = now.strftime('%H:%M')
+        occurrence_at = now.replace(second=0, microsecond=0)
+        occurrence = occurrence_at.strftime('%Y-%m-%d %H:%M')
+        by_room_id = schedule_index.pending_all(now.weekday() + 1, minute)
+        if not by_room_id:
+            return 0
+
+        room_names = dict(db.session.execute(
+            select(Room.room_id, Room.name).where(Room.room_id.in_(by_room_id.keys()))
+        ).all())
+
+        queued = 0
+        with self._lock:
+            outboxes = [
+                outbox for bot_id, outbox in self._outboxes.items()
+                if bot_ids is None or bot_id in bot_ids
+            ]
+            for outbox in outboxes:
+                added = False
+                for room_id, messages in by_room_id.items():
+                    room_name = room_names.get(room_id)
+                    if room_name is None or not outbox.wants(room_name):
+                        continue
+                    for message in messages:
+                        key = (message['id'], occurrence)
+                        if key in outbox.delivered_keys:
+                            continue
+                        outbox.delivered_keys[key] = time.monotonic()
+                        delivery_id = uuid.uuid4().hex[:12]
+                        outbox.deliveries[delivery_id] = {
+                            'delivery_id': delivery_id,
+                            'room': room_name,
+                            'occurrence': occurrence,
+                            'occurrence_at': occurrence_at,
+                            'message': message,
+                            'queued_at': time.monotonic(),
+                            'sent_at': None
+                        }
+                        queued += 1
+                        added = True
+                if added:
+                    outbox.event.set()
+
+        if queued:
+            print(f"[Outbox] Queued {queued} deliveries for {minute}")
+        return queued
+
+    def register(self, bot_id, rooms):
+        """
+        봇 전송함 조회/생성 및 담당 방 갱신
+
+        Returns:
+            새로 등록된 봇이면 True
+        """
+        with self._lock:
+            outbox = self._outboxes.get(bot_id)
+            created = outbox is None
+            if created:
+                outbox = self._outboxes[bot_id] = BotOutbox(bot_id)
+            outbox.rooms = set(rooms) if rooms else None
+            outbox.last_seen = time.monotonic()
+            return created
+
+    def poll(self, bot_id, timeout):
+        """
+        전송할 메시지가 생길 때까지 대기 후 반환 (최대 timeout초, 앱 컨텍스트 필요)
+
+        Returns:
+            전달할 delivery 리스트 (없으면 빈 리스트)
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._lock:
+                outbox = self._outboxes.get(bot_id)
+                if outbox is None:
+                    return []
+                outbox.last_seen = time.monotonic()
+                ready, first_sent = self._take_ready(outbox)
+                if not ready:
+                    outbox.event.clear()
+
+            if ready:
+                ready = self._claim_first_sent(outbox, ready, first_sent)
+                if ready:
+                    return ready
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            outbox.event.wait(remaining)
+
+    def ack(self, bot_id, delivery_ids):
+        """
+        전달 확인 (확인된 메시지는 다시 전달하지 않음)
+
+        Returns:
+            확인 처리된 delivery 수
+        """
+        with self._lock:
+            outbox = self._outboxes.get(bot_id)
+            if outbox is None:
+                return 0
+            outbox.last_seen = time.monotonic()
+            return sum(1 for delivery_id in delivery_ids if outbox.deliveries.pop(delivery_id, None))
+
+    def _take_ready(self, outbox):
+        """전달할 메시지 선택 (처음 보내거나 재전달 시간이 지난 것, 오래된 것은 폐기)"""
+        now = time.monotonic()
+        ready = []
+        first_sent = []
+
+        for delivery_id, delivery in list(outbox.deliveries.items()):
+            if now - delivery['queued_at'] > DELIVERY_TTL:
+                del outbox.deliveries[delivery_id]
+                continue
+            if delivery['sent_at'] is None or now - delivery['sent_at'] > REDELIVERY_TIMEOUT:
+                if delivery['sent_at'] is None:
+                    first_sent.append(delivery)
+                delivery['sent_at'] = now
+                ready.append({
+                    'delivery_id': delivery_id,
+                    'room': delivery['room'],
+                    'occurrence': delivery['occurrence'],
+                    'message': delivery['message']
+                })
+
+        # 중복 방지 기록은 보관 기간이 지나면 정리
+        for key, queued_at in list(outbox.delivered_keys.items()):
+            if now - queued_at > DELIVERY_TTL:
+                del outbox.delivered_keys[key]
+
+        return ready, first_sent
+
+    def _claim_first_sent(self, outbox, ready, first_sent):
+        """처음 전달하는 메시지의 회차 선점 (다른 봇이 먼저 가져간 메시지는 전송함에서 제거)"""
+        from app.delivery_ledger import delivery_ledger
+
+        lost = set()
+        for delivery in first_sent:
+            if not delivery_ledger.claim(delivery['occurrence_at'], delivery['message']['id'], outbox.bot_id):
+                lost.add(delivery['delivery_id'])
+
+        if not lost:
+            return ready
+
+        with self._lock:
+            for delivery_id in lost:
+                outbox.deliveries.pop(delivery_id, None)
+        return [delivery for delivery in ready if delivery['delivery_id'] not in lost]
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        with self._lock:
+            for bot_id in [b for b, o in self._outboxes.items() if now - o.last_seen > BOT_IDLE_TIMEOUT]:
+                del self._outboxes[bot_id]
+                print(f"[Outbox] Evicted idle bot: {bot_id}")
+
+
+outbox_registry = OutboxRegistry()
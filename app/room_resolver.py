@@ -0,0 +1,41 @@
+"""
+방 이름 → room_id 변환 캐시
+
+방을 생성/삭제/이름 변경하면 커밋 후 room_resolver.invalidate(name)
+(여러 방이면 clear())를 호출합니다. 없는 방은 캐시하지 않습니다.
+"""
+from sqlalchemy import select
+from app.models import db, Room
+from app.ttl_cache import TTLCache
+
+# 캐시 항목 유효기간 (초, 다른 워커의 변경 반영용)
+ROOM_CACHE_TTL = 300
+
+# 캐시에 보관할 최대 방 수
+ROOM_CACHE_MAX_SIZE = 1024
+
+
+def load_room_id(name):
+    """DB에서 방 이름으로 room_id 조회"""
+    return db.session.execute(
+        select(Room.room_id).where(Room.name == name)
+    ).scalar_one_or_none()
+
+
+class RoomResolver(TTLCache):
+    """방 이름별 room_id 캐시"""
+
+    def __init__(self, ttl=ROOM_CACHE_TTL, max_size=ROOM_CACHE_MAX_SIZE):
+        super().__init__(load_room_id, ttl, max_size, cache_none=False, name='room_resolver')
+
+    def resolve(self, name):
+        """
+        방 이름으로 room_id 조회
+
+        Returns:
+            room_id, 방이 없으면 None
+        """
+        return self.get(name)
+
+
+room_resolver = RoomResolver()
@@ -0,0 +1,69 @@
+"""
+방별 명단 스냅샷 캐시 (멤버/팀 조회 명령어용)
+
+멤버/팀/팀 배정을 변경하면 커밋 후 roster_cache.invalidate(room_id)
+(여러 방이면 clear())를 호출합니다. 스냅샷은 여러 요청이 공유하므로 수정하지 않습니다.
+"""
+from collections import namedtuple
+from types import MappingProxyType
+from app.models import db, Member, Team
+from app.ttl_cache import TTLCache
+
+# 스냅샷 유효기간 (초, 다른 워커의 변경 반영용)
+ROSTER_CACHE_TTL = 60
+
+# 캐시에 보관할 최대 방 수
+MAX_CACHED_ROOMS = 256
+
+RosterMember = namedtuple('RosterMember', ['member_id', 'name', 'team_id', 'team_name'])
+RosterTeam = namedtuple('RosterTeam', ['team_id', 'name'])
+
+
+class RosterSnapshot:
+    """
+    방 하나의 명단 스냅샷 (만든 뒤 변경하지 않음)
+
+    Attributes:
+        members: 방의 모든 멤버 (DB 조회 순서)
+        teams: 방의 모든 팀 (DB 조회 순서)
+        members_by_id: member_id → 멤버
+        members_by_name: 이름 → 같은 이름의 멤버들 (동명이인 포함)
+        teams_by_name: 팀 이름 → 팀
+        members_by_team: team_id → 팀에 배정된 멤버들
+    """
+
+    def __init__(self, members, teams):
+        self.members = tuple(members)
+        self.teams = tuple(teams)
+
+        by_name = {}
+        by_team = {}
+        for member in self.members:
+            by_name.setdefault(member.name, []).append(member)
+            if member.team_id:
+                by_team.setdefault(member.team_id, []).append(member)
+
+        self.members_by_id = MappingProxyType({member.member_id: member for member in self.members})
+        self.members_by_name = MappingProxyType({name: tuple(items) for name, items in by_name.items()})
+        self.teams_by_name = MappingProxyType({team.name: team for team in self.teams})
+        self.members_by_team = MappingProxyType({team_id: tuple(items) for team_id, items in by_team.items()})
+
+
+def build_roster(room_id):
+    """DB에서 방 명단 조회 후 스냅샷 생성 (쿼리 2회)"""
+    member_rows = db.session.query(Member.member_id, Member.name, Member.team_id, Team.name)\
+        .outerjoin(Team, Team.team_id == Member.team_id)\
+        .filter(Member.room_id == room_id)\
+        .all()
+
+    team_rows = db.session.query(Team.team_id, Team.name)\
+        .filter(Team.room_id == room_id)\
+        .all()
+
+    return RosterSnapshot(
+        members=[RosterMember(*row) for row in member_rows],
+        teams=[RosterTeam(*row) for row in team_rows]
+    )
+
+
+roster_cache = TTLCache(build_roster, ROSTER_CACHE_TTL, MAX_CACHED_ROOMS, name='roster_cache')
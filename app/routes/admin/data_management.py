@@ -3,8 +3,14 @@ Admin 데이터 관리 API - Import/Export
 """
 from flask import Blueprint, request, jsonify, send_file, current_app
 from app.routes.admin.auth import require_admin
-from app.models import db, Room, Team, Member
+from app.models import db, Room, Team, Member, Game
 from app.utils import generate_member_id, generate_team_id
+from app.routes.game.state_cache import game_state_cache
+from app.routes.game.event_log import game_event_log
+from app.routes.game.commands import emit_game_update
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+from app.schedule_index import schedule_index
 from datetime import datetime
 import pandas as pd
 import io
@@ -185,11 +191,27 @@ def import_data():
 
             # PostgreSQL 전체 삭제 (CASCADE로 members, teams도 함께 삭제됨)
             try:
+                # 방과 함께 CASCADE로 삭제될 경기 (커밋 후 삭제 이벤트로 순번을 올리기 위해 미리 조회)
+                deleted_game_ids = [row[0] for row in db.session.query(Game.game_id).all()]
+
                 deleted_members = db.session.query(Member).delete()
                 deleted_teams = db.session.query(Team).delete()
                 deleted_rooms = db.session.query(Room).delete()
                 db.session.commit()
 
+                # 방 삭제 시 경기도 CASCADE로 삭제되므로 경기 상태 캐시 비우기
+                game_state_cache.clear()
+
+                # 경기 삭제(delete_game)와 같이 순번을 올리고 로그를 지워
+                # 다른 워커의 경기 상태 캐시도 삭제된 경기를 반환하지 않도록 함
+                for game_id in deleted_game_ids:
+                    emit_game_update(game_id, 'game_deleted', {'game_id': game_id})
+                    game_event_log.drop(game_id)
+
+                room_resolver.clear()
+                roster_cache.clear()
+                schedule_index.invalidate()
+
                 stats['deleted_members'] = deleted_members
                 stats['deleted_teams'] = deleted_teams
                 stats['deleted_rooms'] = deleted_rooms
@@ -239,6 +261,8 @@ def import_data():
             # PostgreSQL 커밋
             try:
                 db.session.commit()
+                if stats['rooms_created']:
+                    room_resolver.clear()
             except Exception as e:
                 db.session.rollback()
                 logger.error(f"[IMPORT] Room creation failed: {str(e)}")
@@ -326,6 +350,7 @@ def import_data():
         # Teams 커밋
         try:
             db.session.commit()
+            roster_cache.clear()
         except Exception as e:
             db.session.rollback()
             logger.error(f"[IMPORT] Team creation failed: {str(e)}")
@@ -438,6 +463,7 @@ def import_data():
         # Members 커밋
         try:
             db.session.commit()
+            roster_cache.clear()
         except Exception as e:
             db.session.rollback()
             logger.error(f"[IMPORT] Member creation failed: {str(e)}")
@@ -1,4 +1,9 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, url_for
+from sqlalchemy.orm import Session
+from app.models import db
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+from app.ttl_cache import defer_invalidations, apply_invalidations
 
 bp = Blueprint('commands', __name__, url_prefix='/api/commands')
 
@@ -17,3 +22,195 @@ def echo_command():
         'success': True,
         'response': message
     }), 200
+
+
+# 배치로 실행할 수 있는 명령어 → (HTTP 메서드, 엔드포인트)
+BATCH_COMMANDS = {
+    'member.get': ('GET', 'member_commands.member_get_command'),
+    'member.list': ('GET', 'member_commands.member_list_command'),
+    'member.create': ('POST', 'member_commands.member_post_command'),
+    'member.delete': ('DELETE', 'member_commands.member_delete_command'),
+    'team.get': ('GET', 'team_commands.team_get_command'),
+    'team.list': ('GET', 'team_commands.team_list_command'),
+    'team.create': ('POST', 'team_commands.team_post_command'),
+    'team.delete': ('DELETE', 'team_commands.team_delete_command'),
+    'member_team.get': ('GET', 'member_team_commands.member_team_get_command'),
+    'member_team.assign': ('POST', 'member_team_commands.member_team_post_command'),
+    'member_team.unassign': ('DELETE', 'member_team_commands.member_team_delete_command'),
+    'room.get': ('GET', 'room.get_room_by_name'),
+    'scheduled_message.pending': ('GET', 'scheduled_messages.get_pending_messages'),
+    'scheduled_message.pending_all': ('GET', 'scheduled_messages.get_pending_messages_all'),
+    'game.get': ('GET', 'game.get_game'),
+    'game.arrival': ('POST', 'game.player_arrival'),
+    'game.arrival_bulk': ('POST', 'game.bulk_player_arrival'),
+}
+
+# 한 번에 실행할 수 있는 최대 명령어 수
+MAX_BATCH_COMMANDS = 20
+
+
+def run_batch_command(method, endpoint, params):
+    """
+    기존 명령어 핸들러를 현재 앱 컨텍스트 안에서 실행
+
+    하위 요청 컨텍스트를 만들어 핸들러를 직접 호출하므로 HTTP 왕복, CORS/HTTPS 처리 없이
+    원래 요청의 Authorization 헤더로 인증 데코레이터를 그대로 거칩니다.
+
+    Returns:
+        (상태 코드, 응답 JSON)
+    """
+    rule = next(
+        r for r in current_app.url_map.iter_rules(endpoint)
+        if method in r.methods
+    )
+    params = dict(params)
+    view_args = {name: params.pop(name) for name in rule.arguments if name in params}
+    missing = rule.arguments - set(view_args)
+    if missing:
+        return 400, {'success': False, 'error': f'{", ".join(sorted(missing))} is required'}
+
+    headers = {}
+    if request.headers.get('Authorization'):
+        headers['Authorization'] = request.headers['Authorization']
+
+    request_options = {'query_string': params} if method == 'GET' else {'json': params}
+    path = url_for(endpoint, **view_args)
+
+    with current_app.test_request_context(path, method=method, headers=headers, **request_options):
+        response = current_app.make_response(current_app.view_functions[endpoint](**view_args))
+
+    return response.status_code, response.get_json(silent=True)
+
+
+@bp.route('/batch', methods=['POST'])
+def batch_command():
+    """
+    여러 명령어를 한 번의 HTTP 요청으로 실행
+    Body: {
+        "commands": [
+            {"command": "member.get", "params": {"room": "방 이름", "member": "홍길동"}},
+            {"command": "game.arrival", "params": {"game_id": "ABCD1234", "team": "home", "member": "홍길동"}},
+            ...
+        ],
+        "transaction": false  (optional, true면 모든 명령어를 한 트랜잭션으로 실행)
+    }
+
+    명령어는 순서대로 실행하며, 결과도 같은 순서의 배열로 반환합니다.
+    transaction 모드에서는 실패(4xx/5xx)한 명령어가 있으면 이후 명령어를 실행하지 않고
+    앞선 변경도 모두 롤백합니다. (경기 명령어는 WebSocket 이벤트를 보내므로 사용할 수 없음)
+    transaction 모드는 PostgreSQL에서만 지원합니다. (pysqlite는 핸들러의 커밋이 SAVEPOINT가 아닌
+    실제 커밋이 되어 전체 롤백이 보장되지 않음)
+    """
+    data = request.get_json(silent=True) or {}
+    commands = data.get('commands')
+    transaction = bool(data.get('transaction', False))
+
+    if not isinstance(commands, list) or not commands:
+        return jsonify({'success': False, 'error': 'commands must be a non-empty list'}), 400
+
+    if len(commands) > MAX_BATCH_COMMANDS:
+        return jsonify({'success': False, 'error': f'Too many commands (max {MAX_BATCH_COMMANDS})'}), 400
+
+    if transaction and db.engine.dialect.name != 'postgresql':
+        return jsonify({'success': False, 'error': 'transaction mode requires PostgreSQL'}), 400
+
+    for index, item in enumerate(commands):
+        name = item.get('command') if isinstance(item, dict) else None
+        if name not in BATCH_COMMANDS:
+            return jsonify({'success': False, 'error': f'commands[{index}]: unknown command {name}'}), 400
+        if not isinstance(item.get('params', {}), dict):
+            return jsonify({'success': False, 'error': f'commands[{index}].params must be an object'}), 400
+        if transaction and name.startswith('game.'):
+            return jsonify({'success': False, 'error': f'commands[{index}]: {name} cannot run in a transaction'}), 400
+
+    print(f"[BATCH] {len(commands)} commands (transaction={transaction}): {[item['command'] for item in commands]}")
+
+    if transaction:
+        results, committed = run_batch_transaction(commands)
+    else:
+        results = [execute_batch_item(index, item) for index, item in enumerate(commands)]
+        committed = None
+
+    response = {
+        'success': all(result['status'] < 400 for result in results),
+        'data': {
+            'results': results,
+            'count': len(results)
+        }
+    }
+    if transaction:
+        response['data']['committed'] = committed
+
+    return jsonify(response), 200
+
+
+def execute_batch_item(index, item):
+    """명령어 하나 실행 후 결과 항목 생성"""
+    name = item['command']
+    method, endpoint = BATCH_COMMANDS[name]
+
+    try:
+        status, body = run_batch_command(method, endpoint, item.get('params', {}))
+    except Exception as e:
+        db.session.rollback()
+        print(f"[BATCH] {name} error: {e}")
+        status, body = 500, {'success': False, 'error': str(e)}
+
+    return {
+        'index': index,
+        'command': name,
+        'status': status,
+        'body': body
+    }
+
+
+def run_batch_transaction(commands):
+    """
+    모든 명령어를 하나의 트랜잭션으로 실행
+
+    바깥 트랜잭션을 연 연결에 join_transaction_mode='create_savepoint' 세션을 묶어
+    요청 세션 자리에 넣습니다. 핸들러의 commit()/rollback()은 SAVEPOINT 단위로만 동작하고,
+    모든 명령어가 성공하면 바깥 트랜잭션을 커밋, 하나라도 실패하면 전체를 롤백합니다.
+    핸들러의 명단/방 캐시 무효화는 바깥 커밋 후에 반영합니다.
+
+    Returns:
+        (결과 리스트, 커밋 여부)
+    """
+    results = []
+    original_session = db.session.registry()
+    connection = db.engine.connect()
+    outer = connection.begin()
+    batch_session = Session(bind=connection, join_transaction_mode='create_savepoint')
+    db.session.registry.set(batch_session)
+
+    committed = False
+
+    try:
+        with defer_invalidations() as invalidations:
+            for index, item in enumerate(commands):
+                result = execute_batch_item(index, item)
+                results.append(result)
+                if result['status'] >= 400:
+                    break
+
+        if all(result['status'] < 400 for result in results):
+            outer.commit()
+            committed = True
+        else:
+            outer.rollback()
+    except Exception:
+        outer.rollback()
+        raise
+    finally:
+        batch_session.close()
+        connection.close()
+        db.session.registry.set(original_session)
+
+        if committed:
+            apply_invalidations(invalidations)
+        else:
+            # 배치 도중 커밋 전 값으로 만든 명단/방 캐시가 남지 않도록 비움
+            room_resolver.clear()
+            roster_cache.clear()
+
+    return results, committed
@@ -3,14 +3,29 @@
 """
 from flask import Blueprint, request, jsonify, current_app
 from datetime import datetime, date
-from app.models import db, Game, Lineup, Quarter, Room
+from sqlalchemy import insert, select, update, exists, case, func, or_, false
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
+from app.models import db, Game, Lineup, Quarter, Room, ScoreEvent, Member, Team
 from app import socketio
-from app.utils import generate_guest_id
+from app.utils import generate_guest_id, paginate_games_by_cursor
+from app.room_resolver import room_resolver
 from app.routes.admin.auth import require_admin
+from app.routes.game.state_cache import game_state_cache
+from app.routes.game.event_log import game_event_log
+from app.routes.game.locks import game_locks, with_game_lock
 import uuid
 
 bp = Blueprint('game', __name__, url_prefix='/api/game')
 
+# 동시 도착으로 번호가 충돌했을 때 다시 시도하는 횟수
+LINEUP_NUMBER_RETRIES = 5
+
+# 순번 재정렬 시 임시 번호 오프셋 (-(id + offset), 미도착 명단 행의 음수 번호와 겹치지 않도록)
+LINEUP_TEMP_NUMBER_OFFSET = 1000000
+
 
 def generate_game_id():
     """8자리 고유 게임 ID 생성"""
@@ -25,13 +40,14 @@ def generate_room_id():
 def get_or_create_room(room_name):
     """
     방 이름으로 방을 조회하거나 없으면 생성
+    (새로 만든 방은 호출한 쪽에서 커밋 후 room_resolver.invalidate(room_name) 호출)
     Returns: room_id (str)
     """
     # 기존 방 조회
-    room = Room.query.filter_by(name=room_name).first()
+    room_id = room_resolver.resolve(room_name)
 
-    if room:
-        return room.room_id
+    if room_id:
+        return room_id
 
     # 새 방 생성
     room_id = generate_room_id()
@@ -50,16 +66,353 @@ def get_or_create_room(room_name):
 
 
 def emit_game_update(game_id, event_type, data):
-    """WebSocket으로 게임 업데이트 브로드캐스트"""
-    print(f'[WebSocket] Broadcasting to room {game_id}: {event_type}')
-    socketio.emit('game_update', {
+    """
+    WebSocket으로 게임 업데이트 브로드캐스트
+    모든 이벤트에 경기별 순번(seq)을 붙이고 재전송 버퍼에 보관합니다. (resume_game 참고)
+    """
+    event = game_event_log.append(game_id, {
         'game_id': game_id,
         'type': event_type,
         'data': data
-    }, to=game_id)
+    })
+    print(f'[WebSocket] Broadcasting to room {game_id}: {event_type} (seq {event["seq"]})')
+    socketio.emit('game_update', event, to=game_id)
     print(f'[WebSocket] Broadcast sent to room {game_id}')
 
 
+class InvalidVersionError(ValueError):
+    """요청의 version 값이 정수가 아닌 경우"""
+
+
+@bp.errorhandler(InvalidVersionError)
+def handle_invalid_version(e):
+    db.session.rollback()
+    return jsonify({'success': False, 'error': str(e)}), 400
+
+
+def parse_version(value):
+    """
+    요청 body의 version 값 파싱 (정수 또는 숫자 문자열)
+
+    Returns:
+        int, 보내지 않았으면 None
+
+    Raises:
+        InvalidVersionError: 정수로 해석할 수 없는 경우 (400 응답)
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise InvalidVersionError('version must be an integer')
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    raise InvalidVersionError('version must be an integer')
+
+
+def is_stale(obj, expected_version):
+    """클라이언트가 보낸 version이 현재 version과 다른지 확인 (보내지 않았으면 검사하지 않음)"""
+    expected_version = parse_version(expected_version)
+    return expected_version is not None and expected_version != obj.version
+
+
+def parse_score(value):
+    """
+    요청 body의 점수 값 파싱 (정수 또는 숫자 문자열)
+
+    Returns:
+        int, 정수로 해석할 수 없으면 None
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def conflict_response(game_id, error='Conflict: modified by another request'):
+    """
+    동시 수정 충돌 응답 (409)
+
+    다른 기기가 먼저 변경한 경우 최신 경기 상태를 함께 보내
+    클라이언트가 별도 조회 없이 다시 시도할 수 있도록 합니다.
+    """
+    db.session.rollback()
+    game_state_cache.invalidate(game_id)
+
+    return jsonify({
+        'success': False,
+        'error': error,
+        'data': game_state_cache.get(game_id)
+    }), 409
+
+
+def next_lineup_number(game_id, team):
+    """
+    팀의 다음 번호를 계산하는 서브쿼리 (COALESCE(MAX(number), 0) + 1)
+
+    미도착 명단 행은 음수 번호를 쓰므로 제외합니다.
+    UPDATE 안에서도 쓸 수 있도록 별칭 테이블에서 조회합니다. (바깥 lineups와 상관되지 않도록)
+    """
+    other = aliased(Lineup)
+
+    return select(
+        func.coalesce(func.max(other.number), 0) + 1
+    ).where(
+        other.game_id == game_id,
+        other.team == team,
+        other.number > 0
+    ).scalar_subquery()
+
+
+def execute_with_number_retry(game_id, team, stmt):
+    """
+    번호를 배정하는 문장 실행 (충돌 시 savepoint로 되돌린 뒤 재시도)
+
+    Returns:
+        RETURNING 결과 Lineup (대상 행이 없으면 None)
+
+    Raises:
+        IntegrityError: 재시도 횟수를 넘겨도 번호를 배정하지 못한 경우
+    """
+    for attempt in range(LINEUP_NUMBER_RETRIES):
+        try:
+            with db.session.begin_nested():
+                return db.session.execute(stmt).scalar_one_or_none()
+        except IntegrityError:
+            if attempt == LINEUP_NUMBER_RETRIES - 1:
+                raise
+            print(f'[Lineup] Number collision in {game_id}/{team}, retrying ({attempt + 1})')
+
+
+def insert_lineup_with_next_number(game_id, team, **values):
+    """
+    팀의 다음 번호로 라인업 추가 (INSERT ... SELECT MAX + 1 ... RETURNING 1회)
+
+    번호를 먼저 조회한 뒤 INSERT하면 동시에 도착한 두 선수가 같은 번호를 받아
+    unique_lineup 충돌이 나므로, 번호 계산을 INSERT 문 안에서 합니다.
+    그래도 동시에 실행되면 한쪽이 충돌하므로 savepoint로 되돌린 뒤 다시 시도합니다.
+
+    Returns:
+        추가된 Lineup
+    """
+    stmt = insert(Lineup).values(
+        game_id=game_id,
+        team=team,
+        number=next_lineup_number(game_id, team),
+        **values
+    ).returning(Lineup)
+
+    return execute_with_number_retry(game_id, team, stmt)
+
+
+def mark_roster_lineup_arrived(lineup, arrived_at, team=None):
+    """
+    미도착 명단 행을 도착 처리 (UPDATE ... RETURNING 1회)
+
+    명단 행은 음수 번호로 만들어 두었다가 도착하는 순간 다음 번호를 받으므로
+    번호는 계속 도착 순서를 따릅니다.
+    team이 명단 행의 팀과 다르면 그 팀으로 옮겨서 도착 처리합니다.
+
+    Returns:
+        도착 처리된 Lineup
+
+    Raises:
+        StaleDataError: 그 사이 다른 요청이 먼저 도착 처리한 경우
+    """
+    team = team or lineup.team
+
+    stmt = update(Lineup).where(
+        Lineup.id == lineup.id,
+        Lineup.arrived == False
+    ).values(
+        team=team,
+        arrived=True,
+        arrived_at=arrived_at,
+        number=next_lineup_number(lineup.game_id, team),
+        version=Lineup.version + 1
+    ).returning(Lineup).execution_options(synchronize_session=False, populate_existing=True)
+
+    arrived_lineup = execute_with_number_retry(lineup.game_id, team, stmt)
+
+    if arrived_lineup is None:
+        raise StaleDataError('Lineup was modified by another request')
+
+    return arrived_lineup
+
+
+def create_roster_lineups(game):
+    """
+    경기 팀 명단 전체를 미도착 라인업으로 등록 (조인 쿼리 1회 + INSERT 1회)
+
+    team_home / team_away 팀에 속한 멤버를 arrived=False, 음수 번호(-1, -2, ...)로 추가합니다.
+    이후 도착 처리는 INSERT 대신 해당 행의 arrived만 바꾸면 됩니다.
+    이미 이 경기 라인업에 있는 멤버는 제외합니다.
+
+    Returns:
+        추가된 Lineup 목록
+    """
+    sides = {game.team_home: 'home', game.team_away: 'away'}
+
+    members = db.session.query(
+        Member.member_id, Member.name, Team.team_id, Team.name
+    ).join(
+        Team, Member.team_id == Team.team_id
+    ).filter(
+        Team.room_id == game.room_id,
+        Team.name.in_(list(sides)),
+        ~exists().where(
+            Lineup.game_id == game.game_id,
+            Lineup.member_id == Member.member_id
+        )
+    ).order_by(Team.name, Member.name).all()
+
+    if not members:
+        return []
+
+    placeholder_numbers = {'home': 0, 'away': 0}
+    rows = []
+    for member_id, member_name, team_id, team_name in members:
+        team = sides[team_name]
+        placeholder_numbers[team] -= 1
+
+        rows.append({
+            'game_id': game.game_id,
+            'member_id': member_id,
+            'is_guest': False,
+            'team_id_snapshot': team_id,
+            'team': team,
+            'member': member_name,
+            'number': placeholder_numbers[team],
+            'arrived': False,
+            'arrived_at': None
+        })
+
+    return db.session.execute(
+        insert(Lineup).values(rows).returning(Lineup)
+    ).scalars().all()
+
+
+def apply_lineup_positions(lineups, positions):
+    """
+    라인업 팀/번호 일괄 변경 (set 기반 UPDATE)
+
+    선수마다 UPDATE를 두 번(임시 번호 → 최종 번호) 보내는 대신
+    CASE 식으로 바뀌는 선수 전체를 한 번에 옮깁니다.
+        - PostgreSQL: unique_lineup이 DEFERRABLE이므로 문장 끝에서 검사 → UPDATE 1회
+        - 그 외(SQLite 등): UNIQUE를 행마다 검사하므로 임시 번호로 옮긴 뒤 최종 번호로 → UPDATE 2회
+
+    Args:
+        lineups: 조회한 Lineup 객체 목록 (조회 시점 version으로 동시 수정 검사, 변경 후 값으로 갱신됨)
+        positions: {lineup_id: (team, number)} 최종 위치
+
+    Raises:
+        StaleDataError: 조회 이후 다른 요청이 라인업을 변경한 경우
+    """
+    changed = [l for l in lineups if positions.get(l.id, (l.team, l.number)) != (l.team, l.number)]
+
+    if not changed:
+        return
+
+    ids = [l.id for l in changed]
+    guard = [
+        Lineup.id.in_(ids),
+        Lineup.version == case({l.id: l.version for l in changed}, value=Lineup.id)
+    ]
+
+    if db.engine.dialect.name != 'postgresql':
+        result = db.session.execute(
+            update(Lineup).where(*guard).values(number=-(Lineup.id + LINEUP_TEMP_NUMBER_OFFSET))
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != len(ids):
+            raise StaleDataError('Lineup was modified by another request')
+        guard = [Lineup.id.in_(ids)]
+
+    result = db.session.execute(
+        update(Lineup).where(*guard).values(
+            team=case({l.id: positions[l.id][0] for l in changed}, value=Lineup.id),
+            number=case({l.id: positions[l.id][1] for l in changed}, value=Lineup.id),
+            version=Lineup.version + 1
+        ).execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(ids):
+        raise StaleDataError('Lineup was modified by another request')
+
+    # 메모리의 객체도 DB와 같게 맞춤 (커밋 후 다시 조회하지 않고 그대로 직렬화할 수 있도록)
+    for l in changed:
+        team, number = positions[l.id]
+        set_committed_value(l, 'team', team)
+        set_committed_value(l, 'number', number)
+        set_committed_value(l, 'version', l.version + 1)
+
+
+def apply_playing_status(lineups, playing_home, playing_away):
+    """
+    출전/벤치 상태 일괄 변경 (UPDATE ... RETURNING 1회)
+
+    선수마다 UPDATE를 보내는 대신 CASE 식으로 양 팀을 한 번에 변경합니다.
+    playing 목록에 있는 번호는 'playing', 나머지는 'bench'가 됩니다.
+
+    Args:
+        lineups: 조회한 Lineup 객체 목록 (조회 시점 version으로 동시 수정 검사)
+        playing_home, playing_away: 출전 선수 번호 목록
+
+    Returns:
+        변경된 Lineup 목록 (RETURNING 결과, 브로드캐스트에 그대로 사용)
+
+    Raises:
+        StaleDataError: 조회 이후 다른 요청이 라인업을 변경한 경우
+    """
+    if not lineups:
+        return []
+
+    updated_lineups = db.session.execute(
+        update(Lineup)
+        .where(
+            Lineup.id.in_([l.id for l in lineups]),
+            Lineup.version == case({l.id: l.version for l in lineups}, value=Lineup.id)
+        )
+        .values(
+            playing_status=case(
+                ((Lineup.team == 'home') & Lineup.number.in_(list(playing_home)), 'playing'),
+                ((Lineup.team == 'away') & Lineup.number.in_(list(playing_away)), 'playing'),
+                else_='bench'
+            ),
+            version=Lineup.version + 1
+        )
+        .returning(Lineup)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).scalars().all()
+
+    if len(updated_lineups) != len(lineups):
+        raise StaleDataError('Lineup was modified by another request')
+
+    return updated_lineups
+
+
+def build_quarter_transition(action, quarter, home_lineups, away_lineups):
+    """
+    쿼터 시작/종료 브로드캐스트 payload 생성
+    작업 단위(unit of work)에 이미 로드된 객체로 만들며 커밋 전에 호출합니다.
+    (커밋 후에는 객체가 만료되어 다시 조회되므로)
+    """
+    return {
+        'action': action,  # started, ended
+        'quarter': quarter.to_dict(),
+        'lineups': {
+            'home': [l.to_dict() for l in sorted(home_lineups, key=lambda l: l.number)],
+            'away': [l.to_dict() for l in sorted(away_lineups, key=lambda l: l.number)]
+        }
+    }
+
+
 def get_frontend_url():
     """프론트엔드 URL 가져오기 (https:// 자동 추가)"""
     frontend_url = current_app.config['FRONTEND_URL']
@@ -127,7 +480,13 @@ def create_game():
         )
 
         db.session.add(game)
+        db.session.flush()
+
+        # 커밋 후 다시 조회하지 않도록 커밋 전에 직렬화
+        game_data = game.to_dict()
+
         db.session.commit()
+        room_resolver.invalidate(room)
 
         # 게임 URL 생성 (환경 변수에서 프론트엔드 URL 가져오기)
         frontend_url = get_frontend_url()
@@ -138,7 +497,7 @@ def create_game():
             'data': {
                 'game_id': game_id,
                 'url': game_url,
-                'game': game.to_dict()
+                'game': game_data
             }
         }), 201
 
@@ -175,6 +534,7 @@ def create_game():
 
                 db.session.add(new_game)
                 db.session.commit()
+                room_resolver.invalidate(room)
 
                 frontend_url = get_frontend_url()
                 game_url = f"{frontend_url}/game/{game_id}"
@@ -212,6 +572,8 @@ def get_all_games():
         - limit: 페이지당 항목 수 (기본값: 10, 최대: 100)
         - room: 특정 방의 경기만 필터링 (선택사항)
         - days: 최근 N일 이내 경기만 필터링 (선택사항, 예: 7)
+        - cursor: 커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor 값 전달)
+        - with_total: 커서 모드에서 전체 항목 수 포함 여부 (기본값: false)
     """
     try:
         # 쿼리 파라미터 파싱
@@ -219,6 +581,8 @@ def get_all_games():
         limit = request.args.get('limit', 10, type=int)
         room = request.args.get('room', None)
         days = request.args.get('days', None, type=int)
+        cursor = request.args.get('cursor', None)
+        with_total = request.args.get('with_total', 'false').lower() == 'true'
 
         # 디버깅 로그
         print(f"[/api/game/all] Query params - page: {page}, limit: {limit}, room: {room}, days: {days}")
@@ -235,8 +599,10 @@ def get_all_games():
         query = Game.query
 
         # room 필터링 (선택사항)
+        # 방 이름을 room_id로 바꿔 (room_id, created_at) 인덱스로 조회 (Game.room은 인덱스 없음)
         if room:
-            query = query.filter(Game.room == room)
+            room_id = room_resolver.resolve(room)
+            query = query.filter(Game.room_id == room_id) if room_id else query.filter(false())
 
         # days 필터링 (선택사항)
         if days and days > 0:
@@ -244,22 +610,38 @@ def get_all_games():
             cutoff_date = date.today() - timedelta(days=days)
             query = query.filter(Game.date >= cutoff_date)
 
-        # 최신순 정렬
-        query = query.order_by(Game.created_at.desc())
-
-        # 페이지네이션
-        pagination = query.paginate(
-            page=page,
-            per_page=limit,
-            error_out=False
-        )
+        if cursor is not None:
+            # 커서 페이지네이션 (OFFSET 스캔 없음, COUNT는 with_total일 때만)
+            try:
+                games, pagination_data = paginate_games_by_cursor(query, limit, cursor, with_total)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+        else:
+            # 최신순 정렬
+            query = query.order_by(Game.created_at.desc())
+
+            # 페이지네이션
+            pagination = query.paginate(
+                page=page,
+                per_page=limit,
+                error_out=False
+            )
+            games = pagination.items
+            pagination_data = {
+                'page': pagination.page,
+                'limit': limit,
+                'total_items': pagination.total,
+                'total_pages': pagination.pages,
+                'has_next': pagination.has_next,
+                'has_prev': pagination.has_prev
+            }
 
         # 프론트엔드 URL
         frontend_url = get_frontend_url()
 
         # 경기 데이터 변환
         games_data = []
-        for game in pagination.items:
+        for game in games:
             games_data.append({
                 'game_id': game.game_id,
                 'url': f"{frontend_url}/game/{game.game_id}",
@@ -283,14 +665,7 @@ def get_all_games():
             'success': True,
             'data': {
                 'games': games_data,
-                'pagination': {
-                    'page': pagination.page,
-                    'limit': limit,
-                    'total_items': pagination.total,
-                    'total_pages': pagination.pages,
-                    'has_next': pagination.has_next,
-                    'has_prev': pagination.has_prev
-                }
+                'pagination': pagination_data
             }
         }), 200
 
@@ -347,47 +722,49 @@ def get_rooms():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    경기 변경 잠금 대기 시간 통계 (현재 워커 기준)
+    """
+    return jsonify({
+        'success': True,
+        'data': {
+            'game_locks': game_locks.stats()
+        }
+    }), 200
+
+
 @bp.route('/<game_id>', methods=['GET'])
 def get_game(game_id):
     """
     경기 조회
     """
-    game = Game.query.filter_by(game_id=game_id).first()
+    state = game_state_cache.get(game_id)
 
-    if not game:
+    if not state:
         return jsonify({'success': False, 'error': 'Game not found'}), 404
 
-    # 라인업 조회
-    lineups = Lineup.query.filter_by(game_id=game_id).order_by(Lineup.team, Lineup.number).all()
-    lineups_data = {
-        'home': [l.to_dict() for l in lineups if l.team == 'home'],
-        'away': [l.to_dict() for l in lineups if l.team == 'away']
-    }
-
-    # 쿼터 조회
-    quarters = Quarter.query.filter_by(game_id=game_id).order_by(Quarter.quarter_number).all()
-    quarters_data = [q.to_dict() for q in quarters]
-
     return jsonify({
         'success': True,
-        'data': {
-            'game': game.to_dict(),
-            'lineups': lineups_data,
-            'quarters': quarters_data
-        }
+        'data': state
     }), 200
 
 
 @bp.route('/<game_id>/start', methods=['POST'])
+@with_game_lock
 def start_game(game_id):
     """
     경기 시작
     Body (required): {
         "team_home": "1팀",
-        "team_away": "2팀"
+        "team_away": "2팀",
+        "roster": true (optional, 두 팀 명단 전체를 미도착 라인업으로 등록),
+        "version": 3 (optional, 클라이언트가 알고 있는 경기 version)
     }
 
     주의: 경기 시작 후에는 팀 정보를 변경할 수 없습니다.
+    roster를 켜면 이후 명단에 있는 선수의 도착 처리는 기존 행의 arrived만 바꿉니다.
     """
     game = Game.query.filter_by(game_id=game_id).first()
 
@@ -398,6 +775,10 @@ def start_game(game_id):
         return jsonify({'success': False, 'error': f'Game is already {game.status}'}), 400
 
     data = request.get_json() or {}
+
+    if is_stale(game, data.get('version')):
+        return conflict_response(game_id)
+
     team_home = data.get('team_home')
     team_away = data.get('team_away')
 
@@ -432,25 +813,47 @@ def start_game(game_id):
             game.team_home = team_home
             game.team_away = team_away
 
+        # 팀 명단 전체를 미도착 라인업으로 등록
+        roster_lineups = create_roster_lineups(game) if data.get('roster') else []
+        roster_data = [l.to_dict() for l in roster_lineups]
+
+        # 커밋 후 다시 조회하지 않도록 커밋 전에 직렬화 (flush로 새 version 반영)
+        db.session.flush()
+        game_data = game.to_dict()
+
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
-        emit_game_update(game_id, 'game_started', game.to_dict())
+        emit_game_update(game_id, 'game_started', game_data)
+
+        if roster_data:
+            emit_game_update(game_id, 'roster_created', {
+                'roster': roster_data
+            })
 
         return jsonify({
             'success': True,
-            'data': game.to_dict()
+            'data': game_data,
+            'roster_created': len(roster_data)
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/end', methods=['POST'])
+@with_game_lock
 def end_game(game_id):
     """
     경기 종료
+    Body (optional): {
+        "version": 3 (클라이언트가 알고 있는 경기 version)
+    }
     """
     game = Game.query.filter_by(game_id=game_id).first()
 
@@ -460,6 +863,11 @@ def end_game(game_id):
     if game.status == '종료':
         return jsonify({'success': False, 'error': 'Game already ended'}), 400
 
+    data = request.get_json(silent=True) or {}
+
+    if is_stale(game, data.get('version')):
+        return conflict_response(game_id)
+
     try:
         # 마지막 쿼터의 누적 점수 (쿼터 번호 순으로 정렬 후 마지막)
         quarters = Quarter.query.filter_by(game_id=game_id).order_by(Quarter.quarter_number.asc()).all()
@@ -485,16 +893,24 @@ def end_game(game_id):
         game.final_score_away = total_away
         game.winner = winner
 
+        # 커밋 후 다시 조회하지 않도록 커밋 전에 직렬화 (flush로 새 version 반영)
+        db.session.flush()
+        game_data = game.to_dict()
+
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
-        emit_game_update(game_id, 'game_ended', game.to_dict())
+        emit_game_update(game_id, 'game_ended', game_data)
 
         return jsonify({
             'success': True,
-            'data': game.to_dict()
+            'data': game_data
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -502,6 +918,7 @@ def end_game(game_id):
 
 @bp.route('/<game_id>', methods=['DELETE'])
 @require_admin
+@with_game_lock
 def delete_game(game_id):
     """
     경기 삭제 (CASCADE로 연관 데이터 모두 삭제)
@@ -514,15 +931,20 @@ def delete_game(game_id):
     try:
         db.session.delete(game)
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
         emit_game_update(game_id, 'game_deleted', {'game_id': game_id})
+        game_event_log.drop(game_id)
 
         return jsonify({
             'success': True,
             'message': 'Game deleted successfully'
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -543,8 +965,10 @@ def copy_game(game_id):
 
     # 원본 라인업 조회 (모든 선수 - arrived 상태 무시)
     # 이어하기는 이전 경기의 라인업을 그대로 이어받으므로 모든 선수를 복사
-    original_lineups = Lineup.query.filter_by(
-        game_id=game_id
+    # (단, 끝까지 도착하지 않은 명단 행(음수 번호)은 제외)
+    original_lineups = Lineup.query.filter(
+        Lineup.game_id == game_id,
+        Lineup.number > 0
     ).order_by(Lineup.team, Lineup.number).all()
 
     if not original_lineups:
@@ -604,6 +1028,9 @@ def copy_game(game_id):
             )
             db.session.add(new_lineup)
 
+        db.session.flush()
+        game_data = new_game.to_dict()
+
         db.session.commit()
 
         # 게임 URL 생성
@@ -615,7 +1042,7 @@ def copy_game(game_id):
             'data': {
                 'game_id': new_game_id,
                 'url': game_url,
-                'game': new_game.to_dict(),
+                'game': game_data,
                 'copied_players': len(original_lineups)
             }
         }), 201
@@ -626,6 +1053,7 @@ def copy_game(game_id):
 
 
 @bp.route('/<game_id>/lineup/arrival', methods=['POST'])
+@with_game_lock
 def player_arrival(game_id):
     """
     선수 도착 처리
@@ -654,12 +1082,19 @@ def player_arrival(game_id):
         return jsonify({'success': False, 'error': 'member is required'}), 400
 
     # 중복 체크: member_id가 있으면 member_id로, 없으면 이름으로
+    # (member_id로 찾을 때는 미도착 명단 행도 함께 조회)
+    roster_lineup = None
     if member_id:
-        existing_player = Lineup.query.filter_by(
+        member_lineups = Lineup.query.filter_by(
             game_id=game_id,
-            member_id=member_id,
-            arrived=True
-        ).first()
+            member_id=member_id
+        ).all()
+        existing_player = next((l for l in member_lineups if l.arrived), None)
+        # 다른 팀 명단에 있던 선수도 그 행을 옮겨서 도착 처리 (명단 행이 남지 않도록)
+        roster_lineup = next(
+            (l for l in sorted(member_lineups, key=lambda l: l.team != team) if not l.arrived),
+            None
+        )
     else:
         existing_player = Lineup.query.filter_by(
             game_id=game_id,
@@ -685,49 +1120,242 @@ def player_arrival(game_id):
         if is_guest:
             member_id = generate_guest_id()
 
-        # 해당 팀의 다음 번호 계산
-        last_lineup = Lineup.query.filter_by(
-            game_id=game_id,
-            team=team
-        ).order_by(Lineup.number.desc()).first()
+        if roster_lineup:
+            # 명단에 있는 선수는 기존 행의 도착 여부만 변경 (다른 팀 명단이면 팀도 변경)
+            lineup = mark_roster_lineup_arrived(roster_lineup, datetime.utcnow(), team=team)
+        else:
+            # 라인업 추가 (다음 번호는 INSERT 안에서 계산)
+            lineup = insert_lineup_with_next_number(
+                game_id=game_id,
+                member_id=member_id,
+                is_guest=is_guest,
+                team_id_snapshot=team_id,
+                team=team,
+                member=member_name,
+                arrived=True,
+                arrived_at=datetime.utcnow()
+            )
 
-        next_number = (last_lineup.number + 1) if last_lineup else 1
+        # RETURNING으로 받은 값으로 직렬화 (커밋 후 다시 조회하지 않음)
+        lineup_data = lineup.to_dict()
 
-        # 라인업 추가
-        lineup = Lineup(
-            game_id=game_id,
-            member_id=member_id,
-            is_guest=is_guest,
-            team_id_snapshot=team_id,
-            team=team,
-            member=member_name,
-            number=next_number,
-            arrived=True,
-            arrived_at=datetime.utcnow()
-        )
-
-        db.session.add(lineup)
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
         emit_game_update(game_id, 'player_arrived', {
-            'lineup': lineup.to_dict()
+            'lineup': lineup_data
         })
 
         return jsonify({
             'success': True,
-            'data': lineup.to_dict()
+            'data': lineup_data
+        }), 201
+
+    except StaleDataError:
+        return conflict_response(game_id)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/<game_id>/lineup/arrival/bulk', methods=['POST'])
+@with_game_lock
+def bulk_player_arrival(game_id):
+    """
+    여러 선수 한 번에 도착 처리 (출석 명단 일괄 등록)
+    Body: {
+        "players": [
+            {
+                "team": "home" or "away",
+                "member": "선수 이름",
+                "member_id": "MEM_X7Y2K9P3" (optional, 프리셋 멤버인 경우),
+                "team_id": "TEAM_X7Y2K9P3" (optional, 멤버의 팀 ID)
+            },
+            ...
+        ]
+    }
+
+    이미 출석한 선수는 건너뛰고 skipped로 알려줍니다. (같은 명단을 다시 보내도 안전)
+    미도착 명단 행(경기 시작 시 roster)이 있는 선수는 새로 추가하지 않고 도착 처리만 합니다.
+    번호는 팀별로 요청 순서대로 배정되며, 한 번 커밋하고 player_arrived_bulk 이벤트 하나만 보냅니다.
+    """
+    game = Game.query.filter_by(game_id=game_id).first()
+
+    if not game:
+        return jsonify({'success': False, 'error': 'Game not found'}), 404
+
+    data = request.get_json() or {}
+    players = data.get('players')
+
+    if not isinstance(players, list) or not players:
+        return jsonify({'success': False, 'error': 'players must be a non-empty list'}), 400
+
+    # 요청 내 유효성 검사 및 중복 확인 (member_id가 있으면 member_id로, 없으면 이름으로)
+    seen = set()
+    for index, player in enumerate(players):
+        if not isinstance(player, dict):
+            return jsonify({'success': False, 'error': f'players[{index}] must be an object'}), 400
+
+        if player.get('team') not in ['home', 'away']:
+            return jsonify({'success': False, 'error': f'players[{index}].team must be "home" or "away"'}), 400
+
+        if not player.get('member'):
+            return jsonify({'success': False, 'error': f'players[{index}].member is required'}), 400
+
+        key = ('id', player['member_id']) if player.get('member_id') else ('name', player['member'])
+        if key in seen:
+            return jsonify({'success': False, 'error': f'{player["member"]}님이 명단에 중복되었습니다.'}), 400
+        seen.add(key)
+
+    # 이미 출석한 선수와 미도착 명단 행 조회 (한 번에)
+    member_ids = [p['member_id'] for p in players if p.get('member_id')]
+    names = [p['member'] for p in players if not p.get('member_id')]
+
+    existing_players = Lineup.query.filter(
+        Lineup.game_id == game_id,
+        or_(Lineup.member_id.in_(member_ids), Lineup.member.in_(names))
+    ).all()
+
+    arrived_ids = {l.member_id for l in existing_players if l.arrived and l.member_id}
+    arrived_names = {l.member for l in existing_players if l.arrived}
+    # 멤버별 미도착 명단 행 (다른 팀 명단에 있던 선수는 그 행을 옮겨서 도착 처리)
+    roster_lineups = {}
+    for l in existing_players:
+        if not l.arrived and l.member_id:
+            roster_lineups.setdefault(l.member_id, []).append(l)
+
+    new_players = []
+    skipped = []
+    for player in players:
+        if player.get('member_id'):
+            already_arrived = player['member_id'] in arrived_ids
+        else:
+            already_arrived = player['member'] in arrived_names
+
+        if already_arrived:
+            skipped.append({'team': player['team'], 'member': player['member'], 'member_id': player.get('member_id')})
+        else:
+            new_players.append(player)
+
+    try:
+        if new_players:
+            for attempt in range(LINEUP_NUMBER_RETRIES):
+                try:
+                    with db.session.begin_nested():
+                        # 팀별 마지막 번호 (한 번에 조회, 미도착 명단 행의 음수 번호 제외)
+                        last_numbers = dict(
+                            db.session.query(Lineup.team, func.max(Lineup.number))
+                            .filter(Lineup.game_id == game_id, Lineup.number > 0)
+                            .group_by(Lineup.team)
+                            .all()
+                        )
+
+                        now = datetime.utcnow()
+                        rows = []
+                        roster_numbers = {}
+                        roster_teams = {}
+                        for player in new_players:
+                            team = player['team']
+                            last_numbers[team] = (last_numbers.get(team) or 0) + 1
+
+                            # 명단에 있는 선수는 기존 행에 번호(와 팀)만 배정
+                            candidates = roster_lineups.get(player.get('member_id'), [])
+                            roster_lineup = next(
+                                iter(sorted(candidates, key=lambda l: l.team != team)),
+                                None
+                            )
+                            if roster_lineup:
+                                roster_numbers[roster_lineup.id] = last_numbers[team]
+                                roster_teams[roster_lineup.id] = team
+                                continue
+
+                            # 게스트인 경우 임시 ID 발급
+                            member_id = player.get('member_id')
+                            is_guest = not bool(member_id)
+
+                            rows.append({
+                                'game_id': game_id,
+                                'member_id': member_id or generate_guest_id(),
+                                'is_guest': is_guest,
+                                'team_id_snapshot': player.get('team_id'),
+                                'team': team,
+                                'member': player['member'],
+                                'number': last_numbers[team],
+                                'arrived': True,
+                                'arrived_at': now
+                            })
+
+                        lineups = []
+
+                        # 명단 행은 UPDATE 한 번으로 도착 처리
+                        if roster_numbers:
+                            lineups += db.session.execute(
+                                update(Lineup).where(
+                                    Lineup.id.in_(list(roster_numbers)),
+                                    Lineup.arrived == False
+                                ).values(
+                                    team=case(roster_teams, value=Lineup.id),
+                                    arrived=True,
+                                    arrived_at=now,
+                                    number=case(roster_numbers, value=Lineup.id),
+                                    version=Lineup.version + 1
+                                ).returning(Lineup)
+                                .execution_options(synchronize_session=False, populate_existing=True)
+                            ).scalars().all()
+
+                            if len(lineups) != len(roster_numbers):
+                                raise StaleDataError('Lineup was modified by another request')
+
+                        # 나머지는 INSERT 한 번으로 추가
+                        if rows:
+                            lineups += db.session.execute(
+                                insert(Lineup).values(rows).returning(Lineup)
+                            ).scalars().all()
+                    break
+                except IntegrityError:
+                    # 그 사이 다른 도착 요청이 번호를 가져갔으면 다시 배정
+                    if attempt == LINEUP_NUMBER_RETRIES - 1:
+                        raise
+                    print(f'[Lineup] Number collision in {game_id} (bulk), retrying ({attempt + 1})')
+
+            lineups_data = [l.to_dict() for l in sorted(lineups, key=lambda l: (l.team, l.number))]
+
+            db.session.commit()
+            game_state_cache.invalidate(game_id)
+
+            # WebSocket 브로드캐스트 (선수마다가 아니라 한 번만)
+            emit_game_update(game_id, 'player_arrived_bulk', {
+                'lineups': lineups_data
+            })
+        else:
+            lineups_data = []
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'lineups': lineups_data,
+                'skipped': skipped
+            }
         }), 201
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/lineup/<int:lineup_id>', methods=['DELETE'])
+@with_game_lock
 def remove_player(game_id, lineup_id):
     """
     선수 제거 (조퇴)
+    Body (optional): {
+        "version": 2 (클라이언트가 알고 있는 라인업 version)
+    }
     """
     game = Game.query.filter_by(game_id=game_id).first()
 
@@ -752,45 +1380,47 @@ def remove_player(game_id, lineup_id):
     if not lineup:
         return jsonify({'success': False, 'error': 'Lineup not found'}), 404
 
+    data = request.get_json(silent=True) or {}
+
+    if is_stale(lineup, data.get('version')):
+        return conflict_response(game_id)
+
     try:
         team = lineup.team
         number = lineup.number
         member_name = lineup.member
 
-        db.session.delete(lineup)
-        db.session.flush()
-
-        # 뒤의 번호들 재정렬 (2단계 업데이트로 unique constraint 회피)
-        later_lineups = Lineup.query.filter(
-            Lineup.game_id == game_id,
-            Lineup.team == team,
-            Lineup.number > number
+        team_lineups = Lineup.query.filter_by(
+            game_id=game_id,
+            team=team
         ).order_by(Lineup.number).all()
 
-        # 1단계: 모두 임시 음수로 변경
-        for i, l in enumerate(later_lineups):
-            l.number = -(i + 1)
-        db.session.flush()
+        # 미도착 명단 행(음수 번호)은 도착 순번에 없으므로 재정렬하지 않음
+        later_lineups = [l for l in team_lineups if l.number > number] if number > 0 else []
 
-        # 2단계: 정상 번호로 변경 (삭제된 번호부터 시작)
-        for i, l in enumerate(later_lineups):
-            l.number = number + i
+        db.session.delete(lineup)
         db.session.flush()
 
-        db.session.commit()
+        # 뒤의 번호들 재정렬 (삭제된 번호부터 연속으로, 일괄 UPDATE)
+        apply_lineup_positions(later_lineups, {
+            l.id: (team, number + i) for i, l in enumerate(later_lineups)
+        })
 
-        # 업데이트된 팀 라인업 조회
-        updated_lineups = Lineup.query.filter_by(
-            game_id=game_id,
-            team=team,
-            arrived=True
-        ).order_by(Lineup.number).all()
+        # 업데이트된 팀 라인업 (메모리의 객체로 직렬화, 커밋 후 다시 조회하지 않음)
+        updated_lineups = sorted(
+            (l for l in team_lineups if l.arrived and l.id != lineup_id),
+            key=lambda l: l.number
+        )
+        lineups_data = [l.to_dict() for l in updated_lineups]
+
+        db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
         emit_game_update(game_id, 'player_removed', {
             'lineup_id': lineup_id,
             'team': team,
-            'lineups': [l.to_dict() for l in updated_lineups]
+            'lineups': lineups_data
         })
 
         return jsonify({
@@ -798,15 +1428,22 @@ def remove_player(game_id, lineup_id):
             'message': 'Player removed successfully'
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/lineup/<int:lineup_id>/toggle-status', methods=['PUT'])
+@with_game_lock
 def toggle_playing_status(game_id, lineup_id):
     """
     출전/벤치 상태 토글
+    Body (optional): {
+        "version": 2 (클라이언트가 알고 있는 라인업 version)
+    }
     """
     game = Game.query.filter_by(game_id=game_id).first()
 
@@ -827,36 +1464,50 @@ def toggle_playing_status(game_id, lineup_id):
     if not lineup:
         return jsonify({'success': False, 'error': 'Lineup not found'}), 404
 
+    data = request.get_json(silent=True) or {}
+
+    if is_stale(lineup, data.get('version')):
+        return conflict_response(game_id)
+
     try:
         # 상태 토글
         lineup.playing_status = 'bench' if lineup.playing_status == 'playing' else 'playing'
-        db.session.commit()
 
-        # 업데이트된 팀의 전체 라인업 조회
+        # 업데이트된 팀의 전체 라인업 조회 (autoflush로 토글이 먼저 반영됨)
+        # 커밋 후 다시 조회하지 않도록 커밋 전에 직렬화
         team = lineup.team
         updated_lineups = Lineup.query.filter_by(
             game_id=game_id,
             team=team,
             arrived=True
         ).order_by(Lineup.number).all()
+        lineups_data = [l.to_dict() for l in updated_lineups]
+        lineup_data = lineup.to_dict()
+
+        db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트 (전체 라인업 업데이트)
         emit_game_update(game_id, 'lineup_updated', {
             'team': team,
-            'lineups': [l.to_dict() for l in updated_lineups]
+            'lineups': lineups_data
         })
 
         return jsonify({
             'success': True,
-            'data': lineup.to_dict()
+            'data': lineup_data
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/lineup/swap', methods=['PUT'])
+@with_game_lock
 def swap_lineup_numbers(game_id):
     """
     순번 교체 (드래그앤드롭) - 같은 팀 또는 다른 팀 간 교체 지원
@@ -864,7 +1515,9 @@ def swap_lineup_numbers(game_id):
         "from_team": "home",
         "from_number": 5,
         "to_team": "away",
-        "to_number": 3
+        "to_number": 3,
+        "from_version": 2 (optional, 옮기는 선수의 라인업 version),
+        "to_version": 1 (optional, 교체 대상 선수의 라인업 version)
     }
 
     또는 기존 호환성을 위한 형식:
@@ -918,50 +1571,53 @@ def swap_lineup_numbers(game_id):
     if from_team == to_team and from_number == to_number:
         return jsonify({'success': False, 'error': 'Cannot swap player with itself'}), 400
 
+    # version 형식 오류는 아래 try에서 500으로 바뀌지 않도록 먼저 검증 (400)
+    from_version = parse_version(data.get('from_version'))
+    to_version = parse_version(data.get('to_version'))
+
     # 경기 상태에 따라 arrived 필터 결정
     # 준비중: 모든 라인업 대상 (이어하기 경기 지원)
     # 진행중/종료: arrived=True만 대상
     use_arrived_filter = game.status != '준비중'
 
     try:
-        # 두 선수 찾기
-        player_from = Lineup.query.filter_by(
-            game_id=game_id,
-            team=from_team,
-            number=from_number
-        ).first()
+        # 영향받는 팀의 라인업을 한 번에 조회
+        team_lineups = Lineup.query.filter(
+            Lineup.game_id == game_id,
+            Lineup.team.in_({from_team, to_team})
+        ).order_by(Lineup.number).all()
 
-        player_to = Lineup.query.filter_by(
-            game_id=game_id,
-            team=to_team,
-            number=to_number
-        ).first()
+        # 두 선수 찾기
+        player_from = next((l for l in team_lineups if l.team == from_team and l.number == from_number), None)
+        player_to = next((l for l in team_lineups if l.team == to_team and l.number == to_number), None)
 
         if not player_from:
             return jsonify({'success': False, 'error': f'Player {from_team} #{from_number} not found'}), 404
 
-        # player_to가 없으면 단순 이동 (빈 자리로 이동)
-        if not player_to:
-            # 목적지 번호가 이미 사용중인지 확인
-            existing = Lineup.query.filter_by(
-                game_id=game_id,
-                team=to_team,
-                number=to_number
-            ).first()
+        # 클라이언트가 본 이후 두 선수 중 하나라도 변경되었으면 충돌
+        if is_stale(player_from, from_version) or \
+                (player_to and is_stale(player_to, to_version)):
+            return conflict_response(game_id)
+
+        # 최종 위치를 계산한 뒤 일괄 반영
+        positions = {l.id: (l.team, l.number) for l in team_lineups}
 
-            if existing:
-                return jsonify({'success': False, 'error': f'Number {to_number} is already taken in {to_team}'}), 400
+        def lineups_in(team, condition, arrived_only):
+            """계산 중인 위치 기준으로 팀 라인업 조회 (번호순)"""
+            matched = [
+                l for l in team_lineups
+                if positions[l.id][0] == team
+                and condition(positions[l.id][1])
+                and (l.arrived or not arrived_only)
+            ]
+            return sorted(matched, key=lambda l: positions[l.id][1])
 
+        # player_to가 없으면 단순 이동 (빈 자리로 이동)
+        if not player_to:
             # 같은 팀 내에서 이동하는 경우 번호 재정렬
             if from_team == to_team:
                 # 팀에 선수가 1명뿐이면 이동할 필요 없음
-                query = Lineup.query.filter_by(
-                    game_id=game_id,
-                    team=from_team
-                )
-                if use_arrived_filter:
-                    query = query.filter_by(arrived=True)
-                team_player_count = query.count()
+                team_player_count = len(lineups_in(from_team, lambda n: True, use_arrived_filter))
 
                 if team_player_count == 1:
                     return jsonify({
@@ -972,156 +1628,64 @@ def swap_lineup_numbers(game_id):
                 old_number = player_from.number
                 new_number = to_number
 
-                # 임시 번호로 변경 (unique constraint 회피)
-                player_from.number = -1
-                db.session.flush()
+                # 임시 위치로 빼두고 사이의 선수들을 밀기
+                positions[player_from.id] = (from_team, -1)
 
                 if old_number < new_number:
-                    # 뒤로 이동: old_number+1 ~ new_number 사이의 선수들을 -1
-                    middle_players = Lineup.query.filter(
-                        Lineup.game_id == game_id,
-                        Lineup.team == from_team,
-                        Lineup.number > old_number,
-                        Lineup.number <= new_number
-                    ).order_by(Lineup.number).all()
-
-                    # 1단계: 모두 임시 음수로 변경
+                    # 뒤로 이동: old_number+1 ~ new_number 사이의 선수들을 -1 (old_number부터 시작)
+                    middle_players = lineups_in(from_team, lambda n: old_number < n <= new_number, False)
                     for i, p in enumerate(middle_players):
-                        p.number = -(i + 2)  # -2부터 시작 (-1은 player_from이 사용중)
-                    db.session.flush()
-
-                    # 2단계: 정상 번호로 변경 (old_number부터 시작)
-                    for i, p in enumerate(middle_players):
-                        p.number = old_number + i
-                    db.session.flush()
+                        positions[p.id] = (from_team, old_number + i)
                 else:
-                    # 앞으로 이동: new_number ~ old_number-1 사이의 선수들을 +1
-                    middle_players = Lineup.query.filter(
-                        Lineup.game_id == game_id,
-                        Lineup.team == from_team,
-                        Lineup.number >= new_number,
-                        Lineup.number < old_number
-                    ).order_by(Lineup.number).all()
-
-                    # 1단계: 모두 임시 음수로 변경
+                    # 앞으로 이동: new_number ~ old_number-1 사이의 선수들을 +1 (new_number+1부터 시작)
+                    middle_players = lineups_in(from_team, lambda n: new_number <= n < old_number, False)
                     for i, p in enumerate(middle_players):
-                        p.number = -(i + 2)
-                    db.session.flush()
-
-                    # 2단계: 정상 번호로 변경 (new_number+1부터 시작)
-                    for i, p in enumerate(middle_players):
-                        p.number = new_number + i + 1
-                    db.session.flush()
+                        positions[p.id] = (from_team, new_number + i + 1)
 
                 # 최종 위치로 이동
-                player_from.number = new_number
-                db.session.flush()
+                positions[player_from.id] = (from_team, new_number)
 
                 # 같은 팀 내에서도 번호를 1부터 재정렬 (빈 순번 방지)
-                query = Lineup.query.filter_by(
-                    game_id=game_id,
-                    team=from_team
-                )
-                if use_arrived_filter:
-                    query = query.filter_by(arrived=True)
-                team_lineups = query.order_by(Lineup.number).all()
-
-                # 1단계: 모두 임시 음수로 변경
-                for i, l in enumerate(team_lineups):
-                    l.number = -(i + 100)
-                db.session.flush()
-
-                # 2단계: 1부터 연속적으로 재정렬
-                for i, l in enumerate(team_lineups):
-                    l.number = i + 1
-                db.session.flush()
-
-                db.session.commit()
+                for i, l in enumerate(lineups_in(from_team, lambda n: True, use_arrived_filter)):
+                    positions[l.id] = (from_team, i + 1)
             else:
                 # 다른 팀으로 이동하는 경우
                 old_team = player_from.team
                 old_number = player_from.number
 
                 # 1단계: player_from을 임시 위치로 이동
-                player_from.team = to_team
-                player_from.number = -1
-                db.session.flush()
+                positions[player_from.id] = (to_team, -1)
 
                 # 2단계: 원래 팀에서 뒤의 번호들 -1 (빈 공간 메우기)
-                query = Lineup.query.filter(
-                    Lineup.game_id == game_id,
-                    Lineup.team == old_team,
-                    Lineup.number > old_number
-                )
-                if use_arrived_filter:
-                    query = query.filter(Lineup.arrived == True)
-                later_lineups = query.order_by(Lineup.number).all()
-
-                for i, l in enumerate(later_lineups):
-                    l.number = -(i + 2)
-                db.session.flush()
-
+                later_lineups = lineups_in(old_team, lambda n: n > old_number, use_arrived_filter)
                 for i, l in enumerate(later_lineups):
-                    l.number = old_number + i
-                db.session.flush()
-
-                # 3단계: 새 팀에서 to_number 이상인 선수들을 임시 음수로 변경 후 +1
-                query = Lineup.query.filter(
-                    Lineup.game_id == game_id,
-                    Lineup.team == to_team,
-                    Lineup.number >= to_number
-                )
-                if use_arrived_filter:
-                    query = query.filter(Lineup.arrived == True)
-                new_team_later_lineups = query.order_by(Lineup.number).all()
-
-                # 임시 음수로 변경
-                for i, l in enumerate(new_team_later_lineups):
-                    l.number = -(i + 100)
-                db.session.flush()
+                    positions[l.id] = (old_team, old_number + i)
 
-                # +1 하여 공간 만들기
+                # 3단계: 새 팀에서 to_number 이상인 선수들을 +1 하여 공간 만들기
+                new_team_later_lineups = lineups_in(to_team, lambda n: n >= to_number, use_arrived_filter)
                 for i, l in enumerate(new_team_later_lineups):
-                    l.number = to_number + i + 1
-                db.session.flush()
+                    positions[l.id] = (to_team, to_number + i + 1)
 
                 # 4단계: player_from을 최종 위치로 이동
-                player_from.number = to_number
-                db.session.flush()
-
-                db.session.commit()
+                positions[player_from.id] = (to_team, to_number)
         else:
-            # 순번 및 팀 교체 (unique constraint 회피를 위해 임시 값 사용)
-            # 1. player_from을 임시 번호로 변경
-            temp_number = -1
-            temp_team = player_from.team
-            player_from.number = temp_number
-            db.session.flush()
-
-            # 2. player_to를 player_from의 원래 위치로 변경
-            player_to.team = from_team
-            player_to.number = from_number
-            db.session.flush()
-
-            # 3. player_from을 player_to의 원래 위치로 변경
-            player_from.team = to_team
-            player_from.number = to_number
+            # 순번 및 팀 교체
+            positions[player_to.id] = (from_team, from_number)
+            positions[player_from.id] = (to_team, to_number)
 
-            db.session.commit()
+        apply_lineup_positions(team_lineups, positions)
 
-        # 업데이트된 라인업 조회 (영향받은 팀들)
+        # 업데이트된 라인업 (영향받은 팀들, 메모리의 객체로 직렬화)
         affected_teams = {from_team, to_team}
-        updated_lineups = {}
+        updated_lineups = {
+            team: [l.to_dict() for l in lineups_in(team, lambda n: True, use_arrived_filter)]
+            for team in affected_teams
+        }
+        from_member = player_from.member
+        to_member = player_to.member if player_to else None
 
-        for team in affected_teams:
-            query = Lineup.query.filter_by(
-                game_id=game_id,
-                team=team
-            )
-            if use_arrived_filter:
-                query = query.filter_by(arrived=True)
-            lineups = query.order_by(Lineup.number).all()
-            updated_lineups[team] = [l.to_dict() for l in lineups]
+        db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트 (한 번에 모든 영향받은 팀의 라인업 전송)
         emit_game_update(game_id, 'lineup_swapped', {
@@ -1142,18 +1706,22 @@ def swap_lineup_numbers(game_id):
         # player_to가 있는 경우에만 swapped 정보 추가
         if player_to:
             response_data['data']['swapped'] = {
-                'from': {'team': from_team, 'number': from_number, 'member': player_to.member},
-                'to': {'team': to_team, 'number': to_number, 'member': player_from.member}
+                'from': {'team': from_team, 'number': from_number, 'member': to_member},
+                'to': {'team': to_team, 'number': to_number, 'member': from_member}
             }
 
         return jsonify(response_data), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/quarter/start', methods=['POST'])
+@with_game_lock
 def start_quarter(game_id):
     """
     쿼터 시작 (수동 선택 필수)
@@ -1162,7 +1730,8 @@ def start_quarter(game_id):
         "playing_home": [1,2,3,4,5] (required),
         "bench_home": [6,7,8] (optional),
         "playing_away": [1,2,3,4,5] (required),
-        "bench_away": [6,7,8] (optional)
+        "bench_away": [6,7,8] (optional),
+        "version": 3 (optional, 클라이언트가 알고 있는 경기 version)
     }
     """
     game = Game.query.filter_by(game_id=game_id).first()
@@ -1174,6 +1743,10 @@ def start_quarter(game_id):
         return jsonify({'success': False, 'error': 'Game must be started first'}), 400
 
     data = request.get_json() or {}
+
+    if is_stale(game, data.get('version')):
+        return conflict_response(game_id)
+
     quarter_number = data.get('quarter_number', game.current_quarter + 1)
 
     # 이미 존재하는 쿼터인지 확인
@@ -1205,18 +1778,14 @@ def start_quarter(game_id):
                 'error': 'Each team must have exactly 5 playing players'
             }), 400
 
-        # 현재 라인업 조회
-        home_lineups = Lineup.query.filter_by(
+        # 현재 라인업 조회 (양 팀 한 번에)
+        lineups = Lineup.query.filter_by(
             game_id=game_id,
-            team='home',
             arrived=True
         ).all()
 
-        away_lineups = Lineup.query.filter_by(
-            game_id=game_id,
-            team='away',
-            arrived=True
-        ).all()
+        home_lineups = [l for l in lineups if l.team == 'home']
+        away_lineups = [l for l in lineups if l.team == 'away']
 
         # 유효성 검사 - 각 팀에 최소 5명 이상 있는지 확인
         if len(home_lineups) < 5:
@@ -1285,65 +1854,45 @@ def start_quarter(game_id):
         db.session.add(quarter)
         game.current_quarter = quarter_number
 
-        # 쿼터 시작 시 라인업의 playing_status 업데이트
-        playing_numbers_home = set(playing_home)
-        playing_numbers_away = set(playing_away)
-
-        # home팀 업데이트
-        for lineup in home_lineups:
-            if lineup.number in playing_numbers_home:
-                lineup.playing_status = 'playing'
-            else:
-                lineup.playing_status = 'bench'
+        # 쿼터 시작 시 라인업의 playing_status 일괄 업데이트
+        updated_lineups = apply_playing_status(lineups, playing_home, playing_away)
 
-        # away팀 업데이트
-        for lineup in away_lineups:
-            if lineup.number in playing_numbers_away:
-                lineup.playing_status = 'playing'
-            else:
-                lineup.playing_status = 'bench'
+        # 새 version이 payload에 반영되도록 flush 후 생성
+        db.session.flush()
+        transition = build_quarter_transition(
+            'started',
+            quarter,
+            [l for l in updated_lineups if l.team == 'home'],
+            [l for l in updated_lineups if l.team == 'away']
+        )
 
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
-        # WebSocket 브로드캐스트 (쿼터 시작)
-        emit_game_update(game_id, 'quarter_started', quarter.to_dict())
-
-        # WebSocket 브로드캐스트 (라인업 업데이트)
-        updated_home = Lineup.query.filter_by(
-            game_id=game_id,
-            team='home',
-            arrived=True
-        ).order_by(Lineup.number).all()
-
-        updated_away = Lineup.query.filter_by(
-            game_id=game_id,
-            team='away',
-            arrived=True
-        ).order_by(Lineup.number).all()
-
-        emit_game_update(game_id, 'lineup_updated', {
-            'team': 'home',
-            'lineups': [l.to_dict() for l in updated_home]
-        })
-        emit_game_update(game_id, 'lineup_updated', {
-            'team': 'away',
-            'lineups': [l.to_dict() for l in updated_away]
-        })
+        # WebSocket 브로드캐스트 (쿼터 + 양 팀 라인업을 한 번에)
+        emit_game_update(game_id, 'quarter_transition', transition)
 
         return jsonify({
             'success': True,
-            'data': quarter.to_dict()
+            'data': transition['quarter']
         }), 201
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/quarter/<int:quarter_number>/end', methods=['POST'])
+@with_game_lock
 def end_quarter(game_id, quarter_number):
     """
     쿼터 종료
+    Body (optional): {
+        "version": 2 (클라이언트가 알고 있는 쿼터 version)
+    }
     """
     quarter = Quarter.query.filter_by(
         game_id=game_id,
@@ -1356,82 +1905,64 @@ def end_quarter(game_id, quarter_number):
     if quarter.status == '종료':
         return jsonify({'success': False, 'error': 'Quarter already ended'}), 400
 
+    data = request.get_json(silent=True) or {}
+
+    if is_stale(quarter, data.get('version')):
+        return conflict_response(game_id)
+
     try:
         quarter.status = '종료'
         quarter.ended_at = datetime.utcnow()
 
-        # 쿼터 종료 후 출전/벤치 상태 업데이트
+        # 쿼터 종료 후 출전/벤치 상태 일괄 업데이트
         # playing_home, playing_away에 있던 선수들은 'playing'으로, 나머지는 'bench'로 업데이트
-        playing_numbers_home = set(quarter.playing_home or [])
-        playing_numbers_away = set(quarter.playing_away or [])
-
-        # home팀 업데이트
-        home_lineups = Lineup.query.filter_by(
+        lineups = Lineup.query.filter_by(
             game_id=game_id,
-            team='home',
             arrived=True
         ).all()
 
-        for lineup in home_lineups:
-            if lineup.number in playing_numbers_home:
-                lineup.playing_status = 'playing'
-            else:
-                lineup.playing_status = 'bench'
-
-        # away팀 업데이트
-        away_lineups = Lineup.query.filter_by(
-            game_id=game_id,
-            team='away',
-            arrived=True
-        ).all()
+        updated_lineups = apply_playing_status(
+            lineups,
+            quarter.playing_home or [],
+            quarter.playing_away or []
+        )
 
-        for lineup in away_lineups:
-            if lineup.number in playing_numbers_away:
-                lineup.playing_status = 'playing'
-            else:
-                lineup.playing_status = 'bench'
+        # 새 version이 payload에 반영되도록 flush 후 생성
+        db.session.flush()
+        transition = build_quarter_transition(
+            'ended',
+            quarter,
+            [l for l in updated_lineups if l.team == 'home'],
+            [l for l in updated_lineups if l.team == 'away']
+        )
 
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
-        # WebSocket 브로드캐스트 (쿼터 종료)
-        emit_game_update(game_id, 'quarter_ended', quarter.to_dict())
-
-        # WebSocket 브로드캐스트 (라인업 업데이트)
-        updated_home = Lineup.query.filter_by(
-            game_id=game_id,
-            team='home',
-            arrived=True
-        ).order_by(Lineup.number).all()
-
-        updated_away = Lineup.query.filter_by(
-            game_id=game_id,
-            team='away',
-            arrived=True
-        ).order_by(Lineup.number).all()
-
-        emit_game_update(game_id, 'lineup_updated', {
-            'team': 'home',
-            'lineups': [l.to_dict() for l in updated_home]
-        })
-        emit_game_update(game_id, 'lineup_updated', {
-            'team': 'away',
-            'lineups': [l.to_dict() for l in updated_away]
-        })
+        # WebSocket 브로드캐스트 (쿼터 + 양 팀 라인업을 한 번에)
+        emit_game_update(game_id, 'quarter_transition', transition)
 
         return jsonify({
             'success': True,
-            'data': quarter.to_dict()
+            'data': transition['quarter']
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/quarter/<int:quarter_number>/cancel', methods=['DELETE'])
+@with_game_lock
 def cancel_quarter(game_id, quarter_number):
     """
     쿼터 취소 (진행중인 쿼터만 취소 가능)
+    Body (optional): {
+        "version": 2 (클라이언트가 알고 있는 쿼터 version)
+    }
     """
     game = Game.query.filter_by(game_id=game_id).first()
 
@@ -1450,20 +1981,32 @@ def cancel_quarter(game_id, quarter_number):
     if quarter.status != '진행중':
         return jsonify({'success': False, 'error': 'Only ongoing quarters can be cancelled'}), 400
 
+    data = request.get_json(silent=True) or {}
+
+    if is_stale(quarter, data.get('version')):
+        return conflict_response(game_id)
+
     try:
-        # 쿼터 삭제
+        # 쿼터 삭제 (해당 쿼터의 득점 기록도 함께 삭제)
         db.session.delete(quarter)
+        ScoreEvent.query.filter_by(
+            game_id=game_id,
+            quarter_number=quarter_number
+        ).delete(synchronize_session=False)
 
         # 현재 쿼터 번호 조정 (이전 쿼터로 되돌림)
         if game.current_quarter == quarter_number:
             game.current_quarter = quarter_number - 1
 
+        current_quarter = game.current_quarter
+
         db.session.commit()
+        game_state_cache.invalidate(game_id)
 
         # WebSocket 브로드캐스트
         emit_game_update(game_id, 'quarter_cancelled', {
             'quarter_number': quarter_number,
-            'current_quarter': game.current_quarter
+            'current_quarter': current_quarter
         })
 
         return jsonify({
@@ -1471,18 +2014,23 @@ def cancel_quarter(game_id, quarter_number):
             'message': f'Quarter {quarter_number} cancelled successfully'
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @bp.route('/<game_id>/quarter/<int:quarter_number>/score', methods=['PUT'])
+@with_game_lock
 def update_score(game_id, quarter_number):
     """
     쿼터 점수 업데이트
     Body: {
         "score_home": 10,
-        "score_away": 8
+        "score_away": 8,
+        "version": 2 (optional, 클라이언트가 알고 있는 쿼터 version)
     }
     """
     quarter = Quarter.query.filter_by(
@@ -1500,23 +2048,332 @@ def update_score(game_id, quarter_number):
     if score_home is None or score_away is None:
         return jsonify({'success': False, 'error': 'Both score_home and score_away are required'}), 400
 
+    score_home = parse_score(score_home)
+    score_away = parse_score(score_away)
+
+    if score_home is None or score_away is None:
+        return jsonify({'success': False, 'error': 'score_home and score_away must be integers'}), 400
+
+    # 절대값으로 덮어쓰므로 그 사이 다른 기록원이 점수를 바꿨으면 충돌
+    if is_stale(quarter, data.get('version')):
+        return conflict_response(game_id)
+
+    try:
+        # 절대값 입력도 득점 기록에 정정(차이값)으로 남기고, 같은 차이값을 score/events와
+        # 같은 방식(이후 쿼터 누적 점수까지 증가)으로 반영하여 기록을 다시 합산한 점수와 일치시킴
+        # (종료된 경기의 최종 점수 정정은 기존처럼 허용)
+        changed = {}
+        for team, new_score, old_score in (('home', score_home, quarter.score_home or 0),
+                                           ('away', score_away, quarter.score_away or 0)):
+            if new_score == old_score:
+                continue
+
+            db.session.add(ScoreEvent(
+                game_id=game_id,
+                quarter_number=quarter_number,
+                team=team,
+                points=new_score - old_score
+            ))
+            rows = apply_score_points(game_id, quarter_number, team, new_score - old_score,
+                                      include_ended=True)
+
+            # 조회 후 그 사이에 쿼터가 취소된 경우
+            if rows is None:
+                db.session.rollback()
+                return jsonify({'success': False, 'error': 'Quarter not found'}), 409
+
+            # 쿼터별 마지막 RETURNING 값 (두 팀 모두 바뀌면 두 번째 UPDATE 결과)
+            changed.update((row.quarter_number, row) for row in rows)
+
+            # 증가된 누적 점수를 메모리의 쿼터에 반영 (RETURNING 값, 커밋 후 다시 조회하지 않음)
+            scores = rows[0]
+            set_committed_value(quarter, 'score_home', scores.score_home)
+            set_committed_value(quarter, 'score_away', scores.score_away)
+            set_committed_value(quarter, 'version', scores.version)
+
+        quarter_data = quarter.to_dict()
+
+        db.session.commit()
+        game_state_cache.invalidate(game_id)
+
+        # WebSocket 브로드캐스트 (누적 점수가 바뀐 이후 쿼터 포함)
+        emit_game_update(game_id, 'score_updated', {
+            'quarter': quarter_number,
+            'score_home': quarter_data['score']['home'],
+            'score_away': quarter_data['score']['away'],
+            'quarters': score_rows_data(sorted(changed.values(), key=lambda row: row.quarter_number)) or [{
+                'quarter': quarter_number,
+                'score_home': quarter_data['score']['home'],
+                'score_away': quarter_data['score']['away'],
+                'version': quarter_data['version']
+            }]
+        })
+
+        return jsonify({
+            'success': True,
+            'data': quarter_data
+        }), 200
+
+    except StaleDataError:
+        return conflict_response(game_id)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def apply_score_points(game_id, quarter_number, team, points, include_ended=False):
+    """
+    쿼터 누적 점수에 득점 반영 (UPDATE ... RETURNING 1회)
+
+    쿼터 점수는 이전 쿼터부터 이어지는 누적 점수이므로
+    해당 쿼터와 이후 쿼터를 함께 증가시킵니다. (SQL에서 증가하므로 동시 기록에도 유실 없음)
+    종료된 경기의 쿼터는 include_ended가 아니면 변경하지 않습니다.
+    ORM을 거치지 않으므로 version도 직접 증가시킵니다.
+
+    Returns:
+        변경된 쿼터들의 변경 후 값 (quarter_number, score_home, score_away, version) 리스트
+        (quarter_number 순, 첫 항목이 해당 쿼터), 쿼터가 없거나 경기가 종료되었으면 None
+    """
+    score_column = Quarter.score_home if team == 'home' else Quarter.score_away
+
+    conditions = [Quarter.game_id == game_id, Quarter.quarter_number >= quarter_number]
+    if not include_ended:
+        conditions.append(exists().where(Game.game_id == Quarter.game_id, Game.status != '종료'))
+
+    rows = db.session.execute(
+        update(Quarter)
+        .where(*conditions)
+        .values({score_column: score_column + points, Quarter.version: Quarter.version + 1})
+        .returning(Quarter.quarter_number, Quarter.score_home, Quarter.score_away, Quarter.version)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    rows.sort(key=lambda row: row.quarter_number)
+    if not rows or rows[0].quarter_number != quarter_number:
+        return None
+
+    return rows
+
+
+def score_rows_data(rows):
+    """apply_score_points() 결과를 브로드캐스트용으로 직렬화 (이후 쿼터 누적 점수 포함)"""
+    return [{
+        'quarter': row.quarter_number,
+        'score_home': row.score_home,
+        'score_away': row.score_away,
+        'version': row.version
+    } for row in rows]
+
+
+@bp.route('/<game_id>/quarter/<int:quarter_number>/score/events', methods=['POST'])
+@with_game_lock
+def add_score_event(game_id, quarter_number):
+    """
+    득점 기록 추가 (append-only)
+    Body: {
+        "team": "home" or "away",
+        "points": 2 (정정 시 음수, 예: -2),
+        "lineup_id": 12 (optional, 득점 선수)
+    }
+
+    기존 점수를 덮어쓰지 않고 points만큼 증가시키므로
+    여러 기록원이 동시에 기록해도 점수가 유실되지 않습니다.
+    """
+    data = request.get_json() or {}
+    team = data.get('team')
+    points = data.get('points')
+    lineup_id = data.get('lineup_id')
+
+    if team not in ['home', 'away']:
+        return jsonify({'success': False, 'error': 'team must be "home" or "away"'}), 400
+
+    if not isinstance(points, int) or isinstance(points, bool) or points == 0:
+        return jsonify({'success': False, 'error': 'points must be a non-zero integer'}), 400
+
+    game = Game.query.filter_by(game_id=game_id).first()
+
+    if not game:
+        return jsonify({'success': False, 'error': 'Game not found'}), 404
+
+    # 종료된 경기는 최종 점수가 확정되었으므로 기록 불가
+    if game.status == '종료':
+        return jsonify({'success': False, 'error': 'Cannot add score after game ended'}), 400
+
+    quarter = Quarter.query.filter_by(
+        game_id=game_id,
+        quarter_number=quarter_number
+    ).first()
+
+    if not quarter:
+        return jsonify({'success': False, 'error': 'Quarter not found'}), 404
+
+    if lineup_id is not None:
+        lineup = Lineup.query.filter_by(id=lineup_id, game_id=game_id).first()
+        if not lineup:
+            return jsonify({'success': False, 'error': 'Lineup not found'}), 404
+        if lineup.team != team:
+            return jsonify({'success': False, 'error': f'Lineup {lineup_id} is not in {team} team'}), 400
+
+    try:
+        event = ScoreEvent(
+            game_id=game_id,
+            quarter_number=quarter_number,
+            team=team,
+            points=points,
+            lineup_id=lineup_id,
+            created_at=datetime.utcnow()
+        )
+        db.session.add(event)
+
+        rows = apply_score_points(game_id, quarter_number, team, points)
+
+        # 조회 후 그 사이에 경기가 종료/쿼터가 취소된 경우
+        if rows is None:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': 'Quarter not found or game ended'}), 409
+
+        scores = rows[0]
+
+        # 증가된 누적 점수를 메모리의 쿼터에 반영 (RETURNING 값, 커밋 후 다시 조회하지 않음)
+        set_committed_value(quarter, 'score_home', scores.score_home)
+        set_committed_value(quarter, 'score_away', scores.score_away)
+        set_committed_value(quarter, 'version', scores.version)
+        event_data = event.to_dict()
+        quarter_data = quarter.to_dict()
+
+        db.session.commit()
+        game_state_cache.invalidate(game_id)
+
+        # WebSocket 브로드캐스트
+        emit_game_update(game_id, 'score_updated', {
+            'quarter': quarter_number,
+            'score_home': scores.score_home,
+            'score_away': scores.score_away,
+            'quarters': score_rows_data(rows),
+            'event': event_data
+        })
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'event': event_data,
+                'quarter': quarter_data
+            }
+        }), 201
+
+    except StaleDataError:
+        return conflict_response(game_id)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/<game_id>/score/events', methods=['GET'])
+def get_score_events(game_id):
+    """
+    득점 기록 조회 (기록 순서)
+    Query Parameters:
+        - quarter: 특정 쿼터의 기록만 조회 (선택사항)
+    """
+    quarter_number = request.args.get('quarter', None, type=int)
+
+    query = ScoreEvent.query.filter_by(game_id=game_id)
+
+    if quarter_number is not None:
+        query = query.filter_by(quarter_number=quarter_number)
+
+    events = query.order_by(ScoreEvent.id).all()
+
+    return jsonify({
+        'success': True,
+        'data': {
+            'events': [event.to_dict() for event in events],
+            'count': len(events)
+        }
+    }), 200
+
+
+@bp.route('/<game_id>/quarter/<int:quarter_number>/score/delta', methods=['POST'])
+@with_game_lock
+def add_score_delta(game_id, quarter_number):
+    """
+    쿼터 점수 증감 (+N / -N)
+    Body: {
+        "team": "home" or "away",
+        "delta": 2 (감소는 음수, 예: -1)
+    }
+
+    현재 점수를 알 필요 없이 증감값만 보내면 되며, ORM 조회 없이
+    UPDATE ... RETURNING 한 번으로 처리되므로 동시에 눌러도 점수가 유실되지 않습니다.
+    같은 트랜잭션에서 득점 기록(score_events)도 남기므로 기록을 합산한 점수와 일치합니다.
+    (득점 선수를 남기려면 score/events를 사용하세요)
+    """
+    data = request.get_json() or {}
+    team = data.get('team')
+    delta = data.get('delta')
+
+    if team not in ['home', 'away']:
+        return jsonify({'success': False, 'error': 'team must be "home" or "away"'}), 400
+
+    if not isinstance(delta, int) or isinstance(delta, bool) or delta == 0:
+        return jsonify({'success': False, 'error': 'delta must be a non-zero integer'}), 400
+
     try:
-        quarter.score_home = score_home
-        quarter.score_away = score_away
+        rows = apply_score_points(game_id, quarter_number, team, delta)
+
+        if rows is None:
+            db.session.rollback()
+
+            # 실패한 경우에만 원인 확인용 조회
+            game = Game.query.filter_by(game_id=game_id).first()
+            if not game:
+                return jsonify({'success': False, 'error': 'Game not found'}), 404
+            if game.status == '종료':
+                return jsonify({'success': False, 'error': 'Cannot change score after game ended'}), 400
+            return jsonify({'success': False, 'error': 'Quarter not found'}), 404
+
+        # 점수 변경과 같은 트랜잭션으로 득점 기록 추가 (경기/쿼터 존재가 확인된 뒤 INSERT)
+        event = ScoreEvent(
+            game_id=game_id,
+            quarter_number=quarter_number,
+            team=team,
+            points=delta,
+            created_at=datetime.utcnow()
+        )
+        db.session.add(event)
+        db.session.flush()
+        event_data = event.to_dict()
+
         db.session.commit()
+        game_state_cache.invalidate(game_id)
+
+        score_home, score_away = rows[0].score_home, rows[0].score_away
 
         # WebSocket 브로드캐스트
         emit_game_update(game_id, 'score_updated', {
             'quarter': quarter_number,
             'score_home': score_home,
-            'score_away': score_away
+            'score_away': score_away,
+            'quarters': score_rows_data(rows),
+            'event': event_data
         })
 
         return jsonify({
             'success': True,
-            'data': quarter.to_dict()
+            'data': {
+                'quarter': quarter_number,
+                'score': {
+                    'home': score_home,
+                    'away': score_away
+                }
+            }
         }), 200
 
+    except StaleDataError:
+        return conflict_response(game_id)
+
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,249 @@
+"""
+경기 이벤트 순번 + 재전송 버퍼
+
+emit_game_update로 보내는 모든 game_update 이벤트에 경기별로 단조 증가하는
+순번(seq)을 붙이고, 최근 이벤트를 링 버퍼에 보관합니다.
+Wi-Fi가 잠깐 끊겼던 클라이언트는 resume_game 이벤트로 마지막으로 받은 seq를 보내면
+놓친 이벤트만 다시 받을 수 있습니다. (버퍼에 없을 만큼 오래되면 전체 상태로 대체)
+
+epoch:
+    경기 로그가 새로 만들어질 때마다 발급되는 식별자입니다. (첫 이벤트를 보낼 때 발급)
+    서버 재시작이나 LRU 제거로 seq가 처음부터 다시 시작된 경우
+    클라이언트가 가진 epoch와 달라지므로 전체 상태를 다시 받도록 합니다.
+    순번 조회는 로그를 만들지 않으므로 이벤트가 없는 경기는 (None, 0)입니다.
+
+백엔드:
+    - LocalEventBuffer: 프로세스 메모리 (단일 워커, 로컬 개발/테스트용 기본값)
+    - RedisEventBuffer: Redis (SOCKETIO_MESSAGE_QUEUE가 redis:// 인 멀티 워커/멀티 인스턴스 모드)
+      워커마다 순번이 따로 매겨지지 않도록 순번과 버퍼를 모든 워커가 공유합니다.
+"""
+import json
+import threading
+import uuid
+from collections import OrderedDict, deque
+
+# 경기별로 보관할 최근 이벤트 수
+REPLAY_BUFFER_SIZE = 100
+
+# 로그를 보관할 최대 경기 수 (LRU 방식으로 오래된 경기부터 제거, Local 백엔드)
+MAX_TRACKED_GAMES = 512
+
+# Redis 키 유효기간 (마지막 이벤트 이후 24시간, Redis 백엔드)
+REDIS_KEY_TTL = 24 * 60 * 60
+
+
+def _new_epoch():
+    return uuid.uuid4().hex[:8]
+
+
+def _epoch_matches(stored_epoch, epoch, last_seq):
+    """
+    클라이언트의 epoch가 현재 로그와 같은지 확인
+
+    epoch 없이(None) 받은 상태는 로그가 생기기 전 상태이므로 seq 0부터 이어받을 수 있습니다.
+    """
+    if stored_epoch is None:
+        return False
+    if epoch is None:
+        return last_seq == 0
+    return stored_epoch == epoch
+
+
+def _select_events(events, seq, last_seq):
+    """
+    버퍼에서 last_seq 이후 이벤트 선택
+
+    Returns:
+        놓친 이벤트 리스트, 버퍼에서 이미 밀려났으면 None
+    """
+    if last_seq >= seq:
+        return []
+
+    # 버퍼의 가장 오래된 이벤트보다 이전이면 재전송 불가
+    oldest_seq = events[0]['seq'] if events else seq + 1
+    if last_seq + 1 < oldest_seq:
+        return None
+
+    return [event for event in events if event['seq'] > last_seq]
+
+
+class _GameLog:
+    """경기 하나의 순번과 최근 이벤트"""
+
+    def __init__(self, buffer_size):
+        self.epoch = _new_epoch()
+        self.seq = 0
+        self.events = deque(maxlen=buffer_size)
+
+
+class LocalEventBuffer:
+    """프로세스 메모리 이벤트 버퍼 (스레드 안전)"""
+
+    def __init__(self, buffer_size=REPLAY_BUFFER_SIZE, max_games=MAX_TRACKED_GAMES):
+        self.buffer_size = buffer_size
+        self.max_games = max_games
+        self._logs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_log(self, game_id):
+        """경기 로그 조회 (없으면 생성, 이벤트 추가 시에만 lock을 잡은 상태에서 호출)"""
+        log = self._logs.get(game_id)
+        if log is None:
+            log = _GameLog(self.buffer_size)
+            self._logs[game_id] = log
+            while len(self._logs) > self.max_games:
+                self._logs.popitem(last=False)
+        else:
+            self._logs.move_to_end(game_id)
+        return log
+
+    def append(self, game_id, event):
+        with self._lock:
+            log = self._get_log(game_id)
+            log.seq += 1
+            event = dict(event, seq=log.seq, epoch=log.epoch)
+            log.events.append(event)
+            return event
+
+    def position(self, game_id):
+        with self._lock:
+            log = self._logs.get(game_id)
+            if log is None:
+                return None, 0
+            self._logs.move_to_end(game_id)
+            return log.epoch, log.seq
+
+    def events_since(self, game_id, epoch, last_seq):
+        with self._lock:
+            log = self._logs.get(game_id)
+            if log is None or not _epoch_matches(log.epoch, epoch, last_seq):
+                return None
+            return _select_events(list(log.events), log.seq, last_seq)
+
+    def drop(self, game_id):
+        with self._lock:
+            self._logs.pop(game_id, None)
+
+
+class RedisEventBuffer:
+    """Redis 이벤트 버퍼 (모든 워커/인스턴스가 순번과 버퍼를 공유)"""
+
+    KEY_PREFIX = 'game_events'
+
+    def __init__(self, redis_client, buffer_size=REPLAY_BUFFER_SIZE):
+        self.redis = redis_client
+        self.buffer_size = buffer_size
+
+    def _keys(self, game_id):
+        prefix = f'{self.KEY_PREFIX}:{game_id}'
+        return f'{prefix}:epoch', f'{prefix}:seq', f'{prefix}:events'
+
+    def _epoch(self, game_id):
+        """경기 epoch 조회 (없으면 발급, 이벤트 추가 시에만 호출)"""
+        epoch_key, _, _ = self._keys(game_id)
+        self.redis.set(epoch_key, _new_epoch(), nx=True, ex=REDIS_KEY_TTL)
+        return self.redis.get(epoch_key)
+
+    def append(self, game_id, event):
+        epoch_key, seq_key, events_key = self._keys(game_id)
+        epoch = self._epoch(game_id)
+        seq = self.redis.incr(seq_key)
+        event = dict(event, seq=seq, epoch=epoch)
+
+        pipe = self.redis.pipeline()
+        pipe.rpush(events_key, json.dumps(event))
+        pipe.ltrim(events_key, -self.buffer_size, -1)
+        for key in (epoch_key, seq_key, events_key):
+            pipe.expire(key, REDIS_KEY_TTL)
+        pipe.execute()
+
+        return event
+
+    def position(self, game_id):
+        epoch_key, seq_key, _ = self._keys(game_id)
+        epoch, seq = self.redis.mget(epoch_key, seq_key)
+        if epoch is None:
+            return None, 0
+        return epoch, int(seq or 0)
+
+    def events_since(self, game_id, epoch, last_seq):
+        epoch_key, seq_key, events_key = self._keys(game_id)
+
+        pipe = self.redis.pipeline()
+        pipe.get(epoch_key)
+        pipe.get(seq_key)
+        pipe.lrange(events_key, 0, -1)
+        stored_epoch, seq, raw_events = pipe.execute()
+
+        if not _epoch_matches(stored_epoch, epoch, last_seq):
+            return None
+
+        # 워커별로 INCR 후 RPUSH 하므로 리스트 순서가 seq 순서와 다를 수 있음
+        events = sorted((json.loads(raw) for raw in raw_events), key=lambda e: e['seq'])
+        return _select_events(events, int(seq or 0), last_seq)
+
+    def drop(self, game_id):
+        self.redis.delete(*self._keys(game_id))
+
+
+class GameEventLog:
+    """
+    경기별 이벤트 순번 발급 및 재전송 버퍼
+
+    init_app()에서 설정에 따라 백엔드를 선택하며, 설정 전에는 Local 백엔드를 사용합니다.
+    """
+
+    def __init__(self):
+        self.backend = LocalEventBuffer()
+
+    def init_app(self, app):
+        """SOCKETIO_MESSAGE_QUEUE 설정에 따라 백엔드 선택"""
+        message_queue = app.config.get('SOCKETIO_MESSAGE_QUEUE')
+
+        if message_queue and message_queue.startswith(('redis://', 'rediss://')):
+            import redis
+            client = redis.Redis.from_url(message_queue, decode_responses=True)
+            self.backend = RedisEventBuffer(client)
+            print('[GameEventLog] Using Redis event buffer (shared across workers)')
+        else:
+            self.backend = LocalEventBuffer()
+            print('[GameEventLog] Using in-process event buffer')
+
+    def append(self, game_id, event):
+        """
+        이벤트에 순번을 붙여 버퍼에 저장
+
+        Args:
+            game_id: 경기 ID
+            event: {'game_id': ..., 'type': ..., 'data': ...}
+
+        Returns:
+            seq, epoch가 추가된 이벤트 (브로드캐스트할 payload)
+        """
+        return self.backend.append(game_id, event)
+
+    def position(self, game_id):
+        """
+        현재 순번 조회
+
+        Returns:
+            (epoch, seq) - 아직 이벤트가 없으면 (None, 0) (조회만으로 로그를 만들지 않음)
+        """
+        return self.backend.position(game_id)
+
+    def events_since(self, game_id, epoch, last_seq):
+        """
+        last_seq 이후의 이벤트 조회
+
+        Returns:
+            놓친 이벤트 리스트 (없으면 빈 리스트)
+            epoch가 다르거나 버퍼에서 이미 밀려난 경우 None (전체 상태로 대체해야 함)
+        """
+        return self.backend.events_since(game_id, epoch, last_seq)
+
+    def drop(self, game_id):
+        """경기 로그 삭제 (경기 삭제 시)"""
+        self.backend.drop(game_id)
+
+
+game_event_log = GameEventLog()
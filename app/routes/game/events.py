@@ -65,28 +65,68 @@ def handle_request_game_state(data):
         emit('error', {'message': 'game_id is required'})
         return
 
-    from app.models import Game, Lineup, Quarter
+    emit_game_state(game_id)
 
-    game = Game.query.filter_by(game_id=game_id).first()
 
-    if not game:
+def emit_game_state(game_id):
+    """
+    현재 경기 전체 상태를 요청한 클라이언트에게 전송
+    상태와 함께 epoch/seq를 보내 이후 resume_game의 기준점으로 사용합니다.
+    """
+    from app.routes.game.state_cache import game_state_cache
+
+    state = game_state_cache.get(game_id)
+
+    if not state:
         emit('error', {'message': 'Game not found'})
         return
 
-    # 라인업 조회
-    lineups = Lineup.query.filter_by(game_id=game_id).order_by(Lineup.team, Lineup.number).all()
-    lineups_data = {
-        'home': [l.to_dict() for l in lineups if l.team == 'home'],
-        'away': [l.to_dict() for l in lineups if l.team == 'away']
-    }
+    # 현재 상태 전송
+    emit('game_state', state)
 
-    # 쿼터 조회
-    quarters = Quarter.query.filter_by(game_id=game_id).order_by(Quarter.quarter_number).all()
-    quarters_data = [q.to_dict() for q in quarters]
 
-    # 현재 상태 전송
-    emit('game_state', {
-        'game': game.to_dict(),
-        'lineups': lineups_data,
-        'quarters': quarters_data
+@socketio.on('resume_game')
+def handle_resume_game(data):
+    """
+    재연결 후 놓친 이벤트 재전송
+    data: {"game_id": "ABC12345", "epoch": "1a2b3c4d", "last_seq": 42}
+
+    버퍼에 남아있는 경우 last_seq 이후의 game_update 이벤트만 다시 보내고,
+    epoch가 다르거나 너무 오래되어 버퍼에 없으면 game_state(전체 상태)를 보냅니다.
+    방 참여 후 버퍼를 읽으므로 일부 이벤트가 중복 수신될 수 있으며,
+    클라이언트는 이미 적용한 seq 이하의 이벤트를 무시해야 합니다.
+    """
+    from flask import request
+    from app.routes.game.event_log import game_event_log
+
+    game_id = data.get('game_id')
+    if not game_id:
+        emit('error', {'message': 'game_id is required'})
+        return
+
+    # 재연결된 소켓은 방 정보가 없으므로 다시 참여
+    join_room(game_id)
+
+    try:
+        last_seq = int(data.get('last_seq', 0))
+    except (TypeError, ValueError):
+        last_seq = 0
+
+    events = game_event_log.events_since(game_id, data.get('epoch'), last_seq)
+
+    if events is None:
+        print(f'[WebSocket] Client {request.sid} resume gap too old for {game_id}, sending full state')
+        emit_game_state(game_id)
+        return
+
+    for event in events:
+        emit('game_update', event)
+
+    epoch, seq = game_event_log.position(game_id)
+    print(f'[WebSocket] Client {request.sid} resumed {game_id}: replayed {len(events)} events')
+    emit('game_resumed', {
+        'game_id': game_id,
+        'replayed': len(events),
+        'epoch': epoch,
+        'seq': seq
     })
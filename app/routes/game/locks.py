@@ -0,0 +1,144 @@
+"""
+경기별 변경 잠금 (In-process)
+
+같은 경기에 대한 swap / remove / 쿼터 시작 같은 변경 요청이 동시에 들어오면
+DB 제약 조건 위반이나 버전 충돌(409)로 뒤늦게 실패하고 롤백됩니다.
+변경 API를 경기 ID별 잠금으로 감싸 같은 경기의 요청은 프로세스 안에서 차례로 처리하고,
+서로 다른 경기의 요청은 그대로 병렬로 처리합니다.
+
+gevent:
+    gunicorn gevent 워커는 threading 모듈을 monkey patch 하므로 threading.Lock이
+    greenlet 단위로 동작합니다. 잠금을 기다리는 동안 다른 greenlet은 계속 실행됩니다.
+
+잠금 수명:
+    경기별 잠금은 참조 수(대기 + 보유 중인 요청 수)로 관리하고,
+    참조 수가 0이 되면 바로 레지스트리에서 제거합니다. (끝난 경기의 잠금이 쌓이지 않음)
+
+멀티 워커:
+    프로세스 내부 잠금이므로 다른 워커의 요청과는 직렬화되지 않습니다.
+    워커 간 충돌은 기존처럼 버전 검사(409)와 DB 제약 조건이 처리합니다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import jsonify
+
+# 잠금 대기 최대 시간 (초과하면 503 반환)
+GAME_LOCK_TIMEOUT = 10
+
+# 이 시간보다 오래 기다리면 로그 출력 (초)
+GAME_LOCK_SLOW_WAIT = 1
+
+
+class GameLockTimeout(Exception):
+    """경기 잠금 대기 시간 초과"""
+
+
+class _GameLockEntry:
+    """경기 하나의 잠금과 참조 수"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.refs = 0
+
+
+class GameLockRegistry:
+    """경기 ID별 잠금 레지스트리 (대기 시간 통계 포함, 스레드 안전)"""
+
+    def __init__(self, timeout=GAME_LOCK_TIMEOUT):
+        self.timeout = timeout
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        # 대기 시간 통계
+        self._acquired = 0
+        self._timeouts = 0
+        self._contended = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @contextmanager
+    def hold(self, game_id):
+        """
+        경기 잠금 획득 후 블록 실행
+
+        Raises:
+            GameLockTimeout: timeout 안에 잠금을 얻지 못한 경우
+        """
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                entry = self._entries[game_id] = _GameLockEntry()
+            entry.refs += 1
+
+        try:
+            started = time.monotonic()
+            acquired = entry.lock.acquire(timeout=self.timeout)
+            waited = time.monotonic() - started
+            self._record_wait(waited, acquired)
+
+            if not acquired:
+                print(f"[GameLock] {game_id} 잠금 대기 시간 초과 ({waited:.2f}s)")
+                raise GameLockTimeout(game_id)
+
+            if waited >= GAME_LOCK_SLOW_WAIT:
+                print(f"[GameLock] {game_id} 잠금 대기 {waited:.2f}s")
+
+            try:
+                yield
+            finally:
+                entry.lock.release()
+        finally:
+            with self._lock:
+                entry.refs -= 1
+                if entry.refs == 0:
+                    self._entries.pop(game_id, None)
+
+    def _record_wait(self, waited, acquired):
+        with self._lock:
+            if not acquired:
+                self._timeouts += 1
+                return
+            self._acquired += 1
+            if waited > 0.001:
+                self._contended += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def stats(self):
+        """잠금 대기 시간 통계"""
+        with self._lock:
+            return {
+                'active_games': len(self._entries),
+                'waiting': sum(max(entry.refs - 1, 0) for entry in self._entries.values()),
+                'acquired': self._acquired,
+                'contended': self._contended,
+                'timeouts': self._timeouts,
+                'wait_total_ms': round(self._wait_total * 1000, 3),
+                'wait_avg_ms': round(self._wait_total * 1000 / self._acquired, 3) if self._acquired else 0,
+                'wait_max_ms': round(self._wait_max * 1000, 3)
+            }
+
+
+game_locks = GameLockRegistry()
+
+
+def with_game_lock(f):
+    """
+    경기 변경 라우트 데코레이터
+
+    URL의 game_id로 경기 잠금을 잡은 상태에서 라우트를 실행합니다.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            with game_locks.hold(kwargs['game_id']):
+                return f(*args, **kwargs)
+        except GameLockTimeout:
+            return jsonify({
+                'success': False,
+                'error': 'Game is busy, please retry'
+            }), 503
+
+    return decorated_function
@@ -0,0 +1,127 @@
+"""
+경기 상태 캐시 (In-process)
+
+경기 조회(GET /api/game/<game_id>)와 request_game_state 이벤트는 매번
+Game / Lineup / Quarter 세 번의 쿼리를 실행하고 to_dict()로 전체 상태를 다시 만듭니다.
+관전자가 많은 경기에서는 이 조회가 DB 부하의 대부분을 차지하므로,
+직렬화가 끝난 경기 상태를 프로세스 메모리에 보관하고 변경 API가 커밋 후 무효화합니다.
+
+사용 규칙:
+    - 경기 데이터를 변경하는 엔드포인트는 db.session.commit() 직후
+      game_state_cache.invalidate(game_id)를 호출해야 합니다.
+    - get()이 반환한 딕셔너리는 캐시와 공유되므로 수정하지 않습니다.
+
+멀티 워커:
+    다른 워커의 변경은 invalidate()로 알 수 없으므로, 캐시 항목마다 만들 당시의
+    이벤트 순번(epoch, seq)을 기록해 두고 조회 시 현재 순번과 다르면 다시 만듭니다.
+    모든 변경 API는 커밋 후 emit_game_update로 순번을 올리기 때문에 가능합니다.
+"""
+import threading
+from collections import OrderedDict
+from app.models import Game, Lineup, Quarter
+from app.routes.game.event_log import game_event_log
+
+# 캐시에 보관할 최대 경기 수 (LRU 방식으로 오래된 경기부터 제거)
+MAX_CACHED_GAMES = 256
+
+
+def build_game_state(game_id):
+    """
+    DB에서 경기 전체 상태 조회 후 직렬화
+
+    Returns:
+        {'game': ..., 'lineups': {'home': [...], 'away': [...]}, 'roster': {...}, 'quarters': [...]}
+        (lineups는 도착한 선수, roster는 아직 도착하지 않은 명단 행)
+        경기가 없으면 None
+    """
+    game = Game.query.filter_by(game_id=game_id).first()
+
+    if not game:
+        return None
+
+    # 라인업 조회
+    lineups = Lineup.query.filter_by(game_id=game_id).order_by(Lineup.team, Lineup.number).all()
+    lineups_data = {
+        'home': [l.to_dict() for l in lineups if l.team == 'home' and l.arrived],
+        'away': [l.to_dict() for l in lineups if l.team == 'away' and l.arrived]
+    }
+    roster_data = {
+        'home': [l.to_dict() for l in lineups if l.team == 'home' and not l.arrived],
+        'away': [l.to_dict() for l in lineups if l.team == 'away' and not l.arrived]
+    }
+
+    # 쿼터 조회
+    quarters = Quarter.query.filter_by(game_id=game_id).order_by(Quarter.quarter_number).all()
+    quarters_data = [q.to_dict() for q in quarters]
+
+    return {
+        'game': game.to_dict(),
+        'lineups': lineups_data,
+        'roster': roster_data,
+        'quarters': quarters_data
+    }
+
+
+class GameStateCache:
+    """경기별 직렬화 상태 캐시 (LRU, 스레드 안전)"""
+
+    def __init__(self, max_size=MAX_CACHED_GAMES):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        # 조회 중인 경기별 토큰 (조회 도중 무효화되면 결과를 저장하지 않음)
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def get(self, game_id):
+        """
+        경기 상태 조회 (캐시 → DB 순서)
+
+        Returns:
+            직렬화된 경기 상태 + 기준 순번('epoch', 'seq'), 경기가 없으면 None
+        """
+        # 상태보다 순번을 먼저 읽어야 이후 이벤트를 놓치지 않음
+        epoch, seq = game_event_log.position(game_id)
+
+        with self._lock:
+            state = self._entries.get(game_id)
+            if state is not None and state['epoch'] == epoch and state['seq'] == seq:
+                self._entries.move_to_end(game_id)
+                return state
+
+            token = object()
+            self._loading[game_id] = token
+
+        state = build_game_state(game_id)
+        if state is not None:
+            state.update(epoch=epoch, seq=seq)
+
+        with self._lock:
+            # 조회하는 동안 invalidate()가 호출되었으면 오래된 상태이므로 저장하지 않음
+            # 이벤트 로그가 없는 경기(epoch None)는 순번으로 검증할 수 없으므로 저장하지 않음
+            # (Redis 키가 만료되면 다른 워커의 변경 후에도 다시 (None, 0)이 되므로)
+            if self._loading.get(game_id) is token:
+                del self._loading[game_id]
+                if state is not None and epoch is not None:
+                    self._entries[game_id] = state
+                    self._entries.move_to_end(game_id)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                else:
+                    self._entries.pop(game_id, None)
+
+        return state
+
+    def invalidate(self, game_id):
+        """경기 상태 캐시 무효화 (변경 API 커밋 후 호출)"""
+        with self._lock:
+            self._entries.pop(game_id, None)
+            self._loading.pop(game_id, None)
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
+
+
+game_state_cache = GameStateCache()
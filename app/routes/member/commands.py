@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
-from app.models import db, Room, Member, Team
-from app.utils import generate_member_id
+from app.models import db, Member
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+from app.utils import generate_member_id, query_members_with_team
 from app.routes.admin.auth import require_admin
 from datetime import datetime
 
@@ -17,8 +19,8 @@ def member_get_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=query_room).first()
-        if not room:
+        room_id = room_resolver.resolve(query_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'data': {
@@ -27,26 +29,20 @@ def member_get_command():
                 }
             }), 404
 
+        # 방 명단 스냅샷 (메모리 조회)
+        roster = roster_cache.get(room_id)
+
         # member_id가 제공된 경우 ID로 조회
         if query_member_id:
-            member = Member.query.filter_by(
-                member_id=query_member_id,
-                room_id=room.room_id
-            ).first()
+            member = roster.members_by_id.get(query_member_id)
 
             if member:
-                team_name = None
-                if member.team_id:
-                    team = Team.query.filter_by(team_id=member.team_id).first()
-                    if team:
-                        team_name = team.name
-
                 return jsonify({
                     'success': True,
                     'data': {
                         'member': member.name,
                         'member_id': member.member_id,
-                        'team': team_name,
+                        'team': member.team_name,
                         'team_id': member.team_id,
                         'exists': True,
                         'is_unique': True
@@ -62,10 +58,7 @@ def member_get_command():
                 }), 404
 
         # 이름으로 조회 (동명이인 체크)
-        members = Member.query.filter_by(
-            room_id=room.room_id,
-            name=query_member
-        ).all()
+        members = roster.members_by_name.get(query_member, ())
 
         if len(members) == 0:
             return jsonify({
@@ -78,18 +71,13 @@ def member_get_command():
         elif len(members) == 1:
             # 동명이인 없음
             member = members[0]
-            team_name = None
-            if member.team_id:
-                team = Team.query.filter_by(team_id=member.team_id).first()
-                if team:
-                    team_name = team.name
 
             return jsonify({
                 'success': True,
                 'data': {
                     'member': query_member,
                     'member_id': member.member_id,
-                    'team': team_name,
+                    'team': member.team_name,
                     'team_id': member.team_id,
                     'exists': True,
                     'is_unique': True
@@ -99,15 +87,9 @@ def member_get_command():
             # 동명이인 있음
             duplicates = []
             for member in members:
-                team_name = None
-                if member.team_id:
-                    team = Team.query.filter_by(team_id=member.team_id).first()
-                    if team:
-                        team_name = team.name
-
                 duplicates.append({
                     'member_id': member.member_id,
-                    'team': team_name,
+                    'team': member.team_name,
                     'team_id': member.team_id
                 })
 
@@ -140,8 +122,8 @@ def member_post_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'message': f'Room not found: {request_room}'
@@ -152,12 +134,13 @@ def member_post_command():
 
         new_member = Member(
             member_id=member_id,
-            room_id=room.room_id,
+            room_id=room_id,
             name=request_member,
             team_id=None
         )
         db.session.add(new_member)
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         print(f"[MEMBER POST] Created member: {member_id} ({request_member})")
 
@@ -191,8 +174,8 @@ def member_delete_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'message': f'Room not found: {request_room}'
@@ -202,12 +185,13 @@ def member_delete_command():
         if request_member_id:
             member = Member.query.filter_by(
                 member_id=request_member_id,
-                room_id=room.room_id
+                room_id=room_id
             ).first()
 
             if member:
                 db.session.delete(member)
                 db.session.commit()
+                roster_cache.invalidate(room_id)
 
                 return jsonify({
                     'success': True,
@@ -223,10 +207,9 @@ def member_delete_command():
                     'message': '멤버를 찾을 수 없습니다.'
                 }), 404
 
-        # 이름만 제공된 경우 - 동명이인 체크
-        members = Member.query.filter_by(
-            room_id=room.room_id,
-            name=request_member
+        # 이름만 제공된 경우 - 동명이인 체크 (팀 이름 포함)
+        members = query_members_with_team(room_id).filter(
+            Member.name == request_member
         ).all()
 
         if len(members) == 0:
@@ -241,13 +224,7 @@ def member_delete_command():
         elif len(members) > 1:
             # 동명이인 있음
             duplicates = []
-            for member in members:
-                team_name = None
-                if member.team_id:
-                    team = Team.query.filter_by(team_id=member.team_id).first()
-                    if team:
-                        team_name = team.name
-
+            for member, team_name in members:
                 duplicates.append({
                     'member_id': member.member_id,
                     'team': team_name
@@ -265,9 +242,10 @@ def member_delete_command():
             }), 409
 
         # 동명이인 없음 - 삭제
-        member = members[0]
+        member = members[0][0]
         db.session.delete(member)
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         return jsonify({
             'success': True,
@@ -302,8 +280,8 @@ def member_list_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=query_room).first()
-        if not room:
+        room_id = room_resolver.resolve(query_room)
+        if not room_id:
             return jsonify({
                 'success': True,
                 'data': {
@@ -313,22 +291,16 @@ def member_list_command():
                 }
             }), 200
 
-        # 해당 방의 모든 멤버 조회
-        members = Member.query.filter_by(room_id=room.room_id).all()
+        # 해당 방의 모든 멤버 조회 (명단 스냅샷)
+        members = roster_cache.get(room_id).members
 
         members_data = []
         for member in members:
-            team_name = None
-            if member.team_id:
-                team = Team.query.filter_by(team_id=member.team_id).first()
-                if team:
-                    team_name = team.name
-
             members_data.append({
                 'name': member.name,
                 'member_id': member.member_id,
                 'room': query_room,
-                'team': team_name,
+                'team': member.team_name,
                 'team_id': member.team_id
             })
 
@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
-from app.models import db, Room, Member, Team
+from app.models import db, Member, Team
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+from app.utils import query_members_with_team
 from app.routes.admin.auth import require_admin
 
 bp = Blueprint('member_team_commands', __name__, url_prefix='/api/commands/member_team')
@@ -16,8 +19,8 @@ def member_team_get_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'data': {
@@ -26,26 +29,20 @@ def member_team_get_command():
                 }
             }), 404
 
+        # 방 명단 스냅샷 (메모리 조회)
+        roster = roster_cache.get(room_id)
+
         # member_id가 제공된 경우 ID로 직접 조회
         if request_member_id:
-            member = Member.query.filter_by(
-                member_id=request_member_id,
-                room_id=room.room_id
-            ).first()
+            member = roster.members_by_id.get(request_member_id)
 
             if member:
-                team_name = None
-                if member.team_id:
-                    team = Team.query.filter_by(team_id=member.team_id).first()
-                    if team:
-                        team_name = team.name
-
                 return jsonify({
                     'success': True,
                     'data': {
                         'member': member.name,
                         'member_id': member.member_id,
-                        'team': team_name,
+                        'team': member.team_name,
                         'is_member': True,
                         'is_unique': True
                     }
@@ -60,10 +57,7 @@ def member_team_get_command():
                 }), 404
 
         # 이름으로 조회 (동명이인 체크)
-        members = Member.query.filter_by(
-            room_id=room.room_id,
-            name=request_member
-        ).all()
+        members = roster.members_by_name.get(request_member, ())
 
         if len(members) == 0:
             return jsonify({
@@ -76,18 +70,13 @@ def member_team_get_command():
         elif len(members) == 1:
             # 동명이인 없음
             member = members[0]
-            team_name = None
-            if member.team_id:
-                team = Team.query.filter_by(team_id=member.team_id).first()
-                if team:
-                    team_name = team.name
 
             return jsonify({
                 'success': True,
                 'data': {
                     'member': request_member,
                     'member_id': member.member_id,
-                    'team': team_name,
+                    'team': member.team_name,
                     'is_member': True,
                     'is_unique': True
                 }
@@ -96,15 +85,9 @@ def member_team_get_command():
             # 동명이인 있음
             duplicates = []
             for member in members:
-                team_name = None
-                if member.team_id:
-                    team = Team.query.filter_by(team_id=member.team_id).first()
-                    if team:
-                        team_name = team.name
-
                 duplicates.append({
                     'member_id': member.member_id,
-                    'team': team_name
+                    'team': member.team_name
                 })
 
             return jsonify({
@@ -145,8 +128,8 @@ def member_team_post_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'message': f'Room not found: {request_room}'
@@ -157,7 +140,7 @@ def member_team_post_command():
         if request_member_id:
             member = Member.query.filter_by(
                 member_id=request_member_id,
-                room_id=room.room_id
+                room_id=room_id
             ).first()
 
             if not member:
@@ -172,10 +155,9 @@ def member_team_post_command():
                     }
                 }), 404
         else:
-            # 이름으로 조회 - 동명이인 체크
-            members = Member.query.filter_by(
-                room_id=room.room_id,
-                name=request_member
+            # 이름으로 조회 - 동명이인 체크 (팀 이름 포함)
+            members = query_members_with_team(room_id).filter(
+                Member.name == request_member
             ).all()
 
             if len(members) == 0:
@@ -191,13 +173,7 @@ def member_team_post_command():
             elif len(members) > 1:
                 # 동명이인 있음
                 duplicates = []
-                for m in members:
-                    team_name = None
-                    if m.team_id:
-                        t = Team.query.filter_by(team_id=m.team_id).first()
-                        if t:
-                            team_name = t.name
-
+                for m, team_name in members:
                     duplicates.append({
                         'member_id': m.member_id,
                         'team': team_name
@@ -216,11 +192,11 @@ def member_team_post_command():
                     }
                 }), 409
 
-            member = members[0]
+            member = members[0][0]
 
         # 팀 존재 확인
         team = Team.query.filter_by(
-            room_id=room.room_id,
+            room_id=room_id,
             name=request_team
         ).first()
 
@@ -238,6 +214,7 @@ def member_team_post_command():
         # 멤버의 team_id 업데이트
         member.team_id = team.team_id
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         print(f"[MEMBER_TEAM POST] Assigned {request_member} to team {request_team} (ID: {team.team_id})")
 
@@ -273,22 +250,24 @@ def member_team_delete_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'message': f'Room not found: {request_room}'
             }), 404
 
-        # 멤버 조회
+        # 멤버 조회 (이전 팀 이름 포함)
         member = None
+        previous_team_name = None
         if request_member_id:
-            member = Member.query.filter_by(
-                member_id=request_member_id,
-                room_id=room.room_id
+            row = query_members_with_team(room_id).filter(
+                Member.member_id == request_member_id
             ).first()
 
-            if not member:
+            if row:
+                member, previous_team_name = row
+            else:
                 return jsonify({
                     'success': False,
                     'data': {
@@ -299,10 +278,9 @@ def member_team_delete_command():
                     }
                 }), 404
         else:
-            # 이름으로 조회 - 동명이인 체크
-            members = Member.query.filter_by(
-                room_id=room.room_id,
-                name=request_member
+            # 이름으로 조회 - 동명이인 체크 (팀 이름 포함)
+            members = query_members_with_team(room_id).filter(
+                Member.name == request_member
             ).all()
 
             if len(members) == 0:
@@ -317,13 +295,7 @@ def member_team_delete_command():
             elif len(members) > 1:
                 # 동명이인 있음
                 duplicates = []
-                for m in members:
-                    team_name = None
-                    if m.team_id:
-                        t = Team.query.filter_by(team_id=m.team_id).first()
-                        if t:
-                            team_name = t.name
-
+                for m, team_name in members:
                     duplicates.append({
                         'member_id': m.member_id,
                         'team': team_name
@@ -341,18 +313,12 @@ def member_team_delete_command():
                     }
                 }), 409
 
-            member = members[0]
-
-        # 이전 팀 정보 저장
-        previous_team_name = None
-        if member.team_id:
-            team = Team.query.filter_by(team_id=member.team_id).first()
-            if team:
-                previous_team_name = team.name
+            member, previous_team_name = members[0]
 
         # 팀 배정 해제
         member.team_id = None
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         return jsonify({
             'success': True,
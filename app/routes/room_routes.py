@@ -4,6 +4,8 @@
 import uuid
 from flask import Blueprint, jsonify, request
 from app.models import db, Room, Game
+from app.utils import paginate_games_by_cursor
+from app.room_resolver import room_resolver
 
 bp = Blueprint('room', __name__, url_prefix='/api/room')
 
@@ -44,6 +46,8 @@ def get_room_games(room_id):
     - limit: 페이지당 항목 수 (기본값: 10)
     - from_date: 시작 날짜 (YYYY-MM-DD)
     - to_date: 종료 날짜 (YYYY-MM-DD)
+    - cursor: 커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor 값 전달)
+    - with_total: 커서 모드에서 전체 항목 수 포함 여부 (기본값: false)
     """
     room = Room.query.filter_by(room_id=room_id).first()
 
@@ -67,6 +71,24 @@ def get_room_games(room_id):
     if to_date:
         query = query.filter(Game.date <= to_date)
 
+    # 커서 페이지네이션 (OFFSET 스캔 없음, COUNT는 with_total일 때만)
+    cursor = request.args.get('cursor')
+    if cursor is not None:
+        with_total = request.args.get('with_total', 'false').lower() == 'true'
+        try:
+            games, pagination_data = paginate_games_by_cursor(query, limit, cursor, with_total)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'room': room.to_dict(),
+                'games': [game.to_dict() for game in games],
+                'pagination': pagination_data
+            }
+        }), 200
+
     # 정렬 및 페이지네이션
     pagination = query.order_by(Game.created_at.desc())\
         .paginate(page=page, per_page=limit, error_out=False)
@@ -141,6 +163,7 @@ def create_room():
 
         db.session.add(room)
         db.session.commit()
+        room_resolver.invalidate(name)
 
         return jsonify({
             'success': True,
@@ -1,8 +1,13 @@
 """
 예약 메시지 관리 API
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import select
 from app.models import db, ScheduledMessage, Room
+from app.room_resolver import room_resolver
+from app.schedule_index import schedule_index
+from app.outbox import outbox_registry, MAX_POLL_TIMEOUT
+from app.delivery_ledger import delivery_ledger, occurrence_of, occurrence_date
 from app.routes.admin.auth import require_admin
 from datetime import datetime, time
 
@@ -21,8 +26,8 @@ def get_scheduled_messages():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=room_name).first()
-        if not room:
+        room_id = room_resolver.resolve(room_name)
+        if not room_id:
             return jsonify({
                 'success': True,
                 'data': {'scheduled_messages': [], 'count': 0}
@@ -30,7 +35,7 @@ def get_scheduled_messages():
 
         # 예약 메시지 조회
         messages = ScheduledMessage.query.filter_by(
-            room_id=room.room_id
+            room_id=room_id
         ).order_by(
             ScheduledMessage.scheduled_time,
             ScheduledMessage.created_at.desc()
@@ -93,8 +98,8 @@ def create_scheduled_message():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=room_name).first()
-        if not room:
+        room_id = room_resolver.resolve(room_name)
+        if not room_id:
             return jsonify({'success': False, 'error': f'Room not found: {room_name}'}), 404
 
         # 시간 파싱 (HH:MM)
@@ -109,7 +114,7 @@ def create_scheduled_message():
 
         # 예약 메시지 생성
         new_message = ScheduledMessage(
-            room_id=room.room_id,
+            room_id=room_id,
             message=message,
             scheduled_time=scheduled_time,
             days_of_week=days_of_week,
@@ -120,9 +125,12 @@ def create_scheduled_message():
         db.session.add(new_message)
         db.session.commit()
 
+        message_data = new_message.to_dict()
+        schedule_index.upsert(message_data)
+
         return jsonify({
             'success': True,
-            'data': new_message.to_dict()
+            'data': message_data
         }), 201
 
     except Exception as e:
@@ -179,9 +187,12 @@ def update_scheduled_message(message_id):
 
         db.session.commit()
 
+        message_data = scheduled_msg.to_dict()
+        schedule_index.upsert(message_data)
+
         return jsonify({
             'success': True,
-            'data': scheduled_msg.to_dict()
+            'data': message_data
         }), 200
 
     except Exception as e:
@@ -203,6 +214,7 @@ def delete_scheduled_message(message_id):
 
         db.session.delete(scheduled_msg)
         db.session.commit()
+        schedule_index.remove(message_id)
 
         return jsonify({'success': True}), 200
 
@@ -212,13 +224,67 @@ def delete_scheduled_message(message_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def parse_pending_clock(current_time_str, current_day_str):
+    """
+    pending 조회 기준 시각/요일 파싱 (제공되지 않으면 서버 시각 사용)
+
+    Returns:
+        (current_time, current_day)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    if current_time_str:
+        try:
+            hour, minute = map(int, current_time_str.split(':'))
+            current_time = time(hour, minute)
+        except ValueError:
+            raise ValueError('Invalid time format')
+    else:
+        now = datetime.now()
+        current_time = time(now.hour, now.minute)
+
+    if current_day_str:
+        try:
+            current_day = int(current_day_str)
+        except ValueError:
+            raise ValueError('current_day must be 1-7')
+        if not 1 <= current_day <= 7:
+            raise ValueError('current_day must be 1-7')
+    else:
+        # Python weekday(): 0=월요일, 6=일요일 -> 1=월요일, 7=일요일로 변환
+        current_day = datetime.now().weekday() + 1
+
+    return current_time, current_day
+
+
+def claim_pending(messages, current_time, current_day):
+    """
+    이번 회차(조회 요일의 날짜 + 조회 시각)에 아직 전달하지 않은 메시지만 선점하여 반환
+
+    같은 분에 다시 조회하거나 다른 봇이 먼저 가져간 메시지는 제외됩니다.
+    Query: peek=true 이면 선점하지 않고 그대로 반환 (관리자 확인용)
+    """
+    if request.args.get('peek', '').lower() == 'true':
+        return messages
+
+    delivery_ledger.start_flusher(current_app._get_current_object())
+    claimed = delivery_ledger.claim_many(
+        occurrence_of(occurrence_date(current_day), current_time),
+        [message['id'] for message in messages],
+        claimed_by=request.args.get('bot_id')
+    )
+    return [message for message in messages if message['id'] in claimed]
+
+
 @bp.route('/pending', methods=['GET'])
 def get_pending_messages():
     """
     봇이 전송할 예약 메시지 조회
-    Query: room={room_name}, current_time={HH:MM}, current_day={1-7}
+    Query: room={room_name}, current_time={HH:MM}, current_day={1-7}, bot_id={봇 식별자, 선택}, peek={true|false}
 
     현재 시각과 요일에 해당하는 활성화된 예약 메시지를 반환합니다.
+    같은 회차의 메시지는 한 번만 반환하므로 재시도하거나 봇을 여러 개 띄워도 중복 전송되지 않습니다.
     """
     room_name = request.args.get('room')
     current_time_str = request.args.get('current_time')
@@ -229,44 +295,22 @@ def get_pending_messages():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=room_name).first()
-        if not room:
+        room_id = room_resolver.resolve(room_name)
+        if not room_id:
             return jsonify({
                 'success': True,
                 'data': {'pending_messages': []}
             }), 200
 
         # 현재 시각과 요일 (제공되지 않으면 서버 시각 사용)
-        if current_time_str:
-            try:
-                hour, minute = map(int, current_time_str.split(':'))
-                current_time = time(hour, minute)
-            except ValueError:
-                return jsonify({'success': False, 'error': 'Invalid time format'}), 400
-        else:
-            now = datetime.now()
-            current_time = now.time()
-
-        if current_day_str:
-            current_day = int(current_day_str)
-            if not 1 <= current_day <= 7:
-                return jsonify({'success': False, 'error': 'current_day must be 1-7'}), 400
-        else:
-            # Python weekday(): 0=월요일, 6=일요일 -> 1=월요일, 7=일요일로 변환
-            current_day = datetime.now().weekday() + 1
-
-        # 해당 시각과 요일에 맞는 예약 메시지 조회
-        messages = ScheduledMessage.query.filter(
-            ScheduledMessage.room_id == room.room_id,
-            ScheduledMessage.is_active == True,
-            ScheduledMessage.scheduled_time == current_time
-        ).all()
+        try:
+            current_time, current_day = parse_pending_clock(current_time_str, current_day_str)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
 
-        # 오늘 요일이 포함된 메시지만 필터링
-        pending_messages = [
-            msg.to_dict() for msg in messages
-            if current_day in msg.days_of_week
-        ]
+        # 해당 시각과 요일에 맞는 예약 메시지 조회 (시간 인덱스, DB 조회 없음)
+        pending_messages = schedule_index.pending(room_id, current_day, current_time.strftime('%H:%M'))
+        pending_messages = claim_pending(pending_messages, current_time, current_day)
 
         return jsonify({
             'success': True,
@@ -280,3 +324,157 @@ def get_pending_messages():
     except Exception as e:
         print(f"[GET /scheduled-message/pending] Error: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/pending/all', methods=['GET'])
+def get_pending_messages_all():
+    """
+    여러 방의 전송할 예약 메시지를 한 번에 조회
+    Query: rooms={방1,방2,...} 또는 room={방1}&room={방2} (생략 시 모든 방),
+           current_time={HH:MM}, current_day={1-7}, bot_id={봇 식별자, 선택}, peek={true|false}
+
+    봇 하나가 여러 방을 맡을 때 방마다 pending을 호출하지 않고 1분에 한 번만 호출합니다.
+    /pending과 같이 같은 회차의 메시지는 한 번만 반환합니다.
+    결과는 방 이름별로 묶어 반환합니다. (방을 지정하면 메시지가 없는 방도 빈 배열로 포함)
+    """
+    room_names = request.args.getlist('room')
+    if request.args.get('rooms'):
+        room_names += [name.strip() for name in request.args['rooms'].split(',') if name.strip()]
+
+    try:
+        try:
+            current_time, current_day = parse_pending_clock(
+                request.args.get('current_time'),
+                request.args.get('current_day')
+            )
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        hhmm = current_time.strftime('%H:%M')
+
+        if room_names:
+            # 지정한 방만 조회 (room_id 변환은 캐시 사용)
+            pending_messages = {}
+            for room_name in dict.fromkeys(room_names):
+                room_id = room_resolver.resolve(room_name)
+                if room_id:
+                    pending_messages[room_name] = schedule_index.pending(room_id, current_day, hhmm)
+        else:
+            # 모든 방 조회 (메시지가 있는 방만, 방 이름은 한 번에 조회)
+            by_room_id = schedule_index.pending_all(current_day, hhmm)
+            room_names_by_id = {}
+            if by_room_id:
+                room_names_by_id = dict(db.session.execute(
+                    select(Room.room_id, Room.name).where(Room.room_id.in_(by_room_id.keys()))
+                ).all())
+            pending_messages = {
+                room_names_by_id[room_id]: messages
+                for room_id, messages in by_room_id.items()
+                if room_id in room_names_by_id
+            }
+
+        # 회차 선점 (모든 방의 메시지를 한 번에)
+        claimed_ids = {
+            message['id']
+            for message in claim_pending(
+                [message for messages in pending_messages.values() for message in messages],
+                current_time,
+                current_day
+            )
+        }
+        pending_messages = {
+            room_name: [message for message in messages if message['id'] in claimed_ids]
+            for room_name, messages in pending_messages.items()
+        }
+        if not room_names:
+            # 모든 방 조회는 메시지가 있는 방만 포함
+            pending_messages = {name: messages for name, messages in pending_messages.items() if messages}
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'pending_messages': pending_messages,
+                'room_count': len(pending_messages),
+                'current_time': hhmm,
+                'current_day': current_day
+            }
+        }), 200
+
+    except Exception as e:
+        print(f"[GET /scheduled-message/pending/all] Error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/outbox', methods=['GET'])
+def poll_outbox():
+    """
+    봇 전송함 long-poll (예약 메시지가 생길 때까지 대기)
+    Query: bot_id={봇 식별자}, rooms={방1,방2,...} 또는 room={방} 반복 (생략 시 모든 방),
+           timeout={대기 초, 기본 30, 최대 55}
+
+    전달받은 메시지는 전송 후 POST /outbox/ack 로 delivery_id를 확인해야 합니다.
+    확인하지 않으면 1분 뒤 다시 전달합니다.
+    """
+    bot_id = request.args.get('bot_id')
+    if not bot_id:
+        return jsonify({'success': False, 'error': 'bot_id parameter required'}), 400
+
+    room_names = request.args.getlist('room')
+    if request.args.get('rooms'):
+        room_names += [name.strip() for name in request.args['rooms'].split(',') if name.strip()]
+
+    timeout = request.args.get('timeout', 30, type=float)
+    timeout = min(max(timeout, 0), MAX_POLL_TIMEOUT)
+
+    try:
+        outbox_registry.start_dispatcher(current_app._get_current_object())
+        delivery_ledger.start_flusher(current_app._get_current_object())
+
+        # 처음 등록된 봇은 이번 분에 이미 지난 메시지도 받을 수 있도록 바로 채움
+        if outbox_registry.register(bot_id, room_names):
+            print(f"[Outbox] Registered bot: {bot_id} (rooms: {room_names or 'all'})")
+            outbox_registry.dispatch(datetime.now(), bot_ids={bot_id})
+
+        # 대기하는 동안 DB 연결을 붙잡지 않도록 세션 반환
+        db.session.close()
+
+        deliveries = outbox_registry.poll(bot_id, timeout)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'deliveries': deliveries,
+                'count': len(deliveries)
+            }
+        }), 200
+
+    except Exception as e:
+        print(f"[GET /scheduled-message/outbox] Error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@bp.route('/outbox/ack', methods=['POST'])
+def ack_outbox():
+    """
+    전송함 메시지 전달 확인
+    Body: {
+        bot_id: "봇 식별자",
+        delivery_ids: ["...", "..."]
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    bot_id = data.get('bot_id')
+    delivery_ids = data.get('delivery_ids')
+
+    if not bot_id or not isinstance(delivery_ids, list):
+        return jsonify({
+            'success': False,
+            'error': 'bot_id and delivery_ids (array) are required'
+        }), 400
+
+    acked = outbox_registry.ack(bot_id, delivery_ids)
+
+    return jsonify({
+        'success': True,
+        'data': {'acked': acked}
+    }), 200
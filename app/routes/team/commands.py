@@ -1,5 +1,7 @@
 from flask import Blueprint, request, jsonify
-from app.models import db, Room, Team, Member
+from app.models import db, Team, Member
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
 from app.utils import generate_team_id
 from app.routes.admin.auth import require_admin
 from datetime import datetime
@@ -16,8 +18,8 @@ def team_get_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=query_room).first()
-        if not room:
+        room_id = room_resolver.resolve(query_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'data': {
@@ -26,18 +28,13 @@ def team_get_command():
                 }
             }), 404
 
-        # 팀 조회
-        team = Team.query.filter_by(
-            room_id=room.room_id,
-            name=query_team
-        ).first()
+        # 팀 조회 (명단 스냅샷)
+        roster = roster_cache.get(room_id)
+        team = roster.teams_by_name.get(query_team)
 
         if team:
             # 팀에 속한 멤버들 조회
-            members = Member.query.filter_by(
-                room_id=room.room_id,
-                team_id=team.team_id
-            ).all()
+            members = roster.members_by_team.get(team.team_id, ())
 
             members_data = []
             for member in members:
@@ -84,8 +81,8 @@ def team_post_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'message': f'Room not found: {request_room}'
@@ -93,7 +90,7 @@ def team_post_command():
 
         # 중복 체크
         existing_team = Team.query.filter_by(
-            room_id=room.room_id,
+            room_id=room_id,
             name=request_team
         ).first()
 
@@ -112,11 +109,12 @@ def team_post_command():
         team_id = generate_team_id()
         new_team = Team(
             team_id=team_id,
-            room_id=room.room_id,
+            room_id=room_id,
             name=request_team
         )
         db.session.add(new_team)
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         print(f"[TEAM POST] Created team: {team_id} ({request_team})")
 
@@ -149,8 +147,8 @@ def team_delete_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=request_room).first()
-        if not room:
+        room_id = room_resolver.resolve(request_room)
+        if not room_id:
             return jsonify({
                 'success': False,
                 'data': {
@@ -162,7 +160,7 @@ def team_delete_command():
 
         # 팀 조회
         team = Team.query.filter_by(
-            room_id=room.room_id,
+            room_id=room_id,
             name=request_team
         ).first()
 
@@ -178,7 +176,7 @@ def team_delete_command():
 
         # 팀에 배정된 멤버가 있는지 확인
         member_count = Member.query.filter_by(
-            room_id=room.room_id,
+            room_id=room_id,
             team_id=team.team_id
         ).count()
 
@@ -197,6 +195,7 @@ def team_delete_command():
         # 멤버가 없으면 팀 삭제
         db.session.delete(team)
         db.session.commit()
+        roster_cache.invalidate(room_id)
 
         return jsonify({
             'success': True,
@@ -231,8 +230,8 @@ def team_list_command():
 
     try:
         # room_id 가져오기
-        room = Room.query.filter_by(name=query_room).first()
-        if not room:
+        room_id = room_resolver.resolve(query_room)
+        if not room_id:
             return jsonify({
                 'success': True,
                 'data': {
@@ -242,22 +241,16 @@ def team_list_command():
                 }
             }), 200
 
-        # 해당 방의 모든 팀 조회
-        teams = Team.query.filter_by(room_id=room.room_id).all()
+        # 해당 방의 모든 팀 조회 (명단 스냅샷)
+        roster = roster_cache.get(room_id)
 
         teams_data = []
-        for team in teams:
-            # 팀 멤버 수 계산
-            member_count = Member.query.filter_by(
-                room_id=room.room_id,
-                team_id=team.team_id
-            ).count()
-
+        for team in roster.teams:
             teams_data.append({
                 'name': team.name,
                 'team_id': team.team_id,
                 'room': query_room,
-                'member_count': member_count
+                'member_count': len(roster.members_by_team.get(team.team_id, ()))
             })
 
         print(f"[TEAM LIST] Found {len(teams_data)} teams in room '{query_room}'")
@@ -0,0 +1,178 @@
+"""
+예약 메시지 시간 인덱스
+
+활성 예약 메시지를 (요일, 'HH:MM') → room_id → 메시지들 형태로 메모리에 보관하여
+pending 조회를 DB 접근 없이 처리합니다. 생성/수정하면 커밋 후 upsert(msg.to_dict()),
+삭제하면 remove(message_id), 여러 메시지가 바뀌면 invalidate()를 호출합니다.
+다른 워커의 변경은 REBUILD_INTERVAL마다 전체를 다시 만들어 반영합니다.
+"""
+import threading
+import time
+from app.models import ScheduledMessage
+
+# 인덱스 전체 재생성 주기 (초, 다른 워커의 변경 반영용)
+REBUILD_INTERVAL = 60
+
+
+def _slot_keys(message):
+    """메시지가 들어갈 (요일, HH:MM) 칸 목록"""
+    return [(day, message['scheduled_time']) for day in set(message['days_of_week'] or [])]
+
+
+class ScheduleIndex:
+    """(요일, HH:MM)별 활성 예약 메시지 인덱스 (스레드 안전)"""
+
+    def __init__(self, rebuild_interval=REBUILD_INTERVAL):
+        self.rebuild_interval = rebuild_interval
+        self._slots = {}
+        self._messages = {}
+        self._built_at = None
+        # 변경 횟수 (다시 만드는 도중 변경이 있었으면 결과를 버림)
+        self._changes = 0
+        # invalidate() 횟수 (조회 도중 호출되면 다시 조회)
+        self._generation = 0
+        # 처음 만드는 중인 요청 수와 그동안 들어온 변경 (만든 뒤 다시 반영)
+        self._building = 0
+        self._queued = []
+        self._lock = threading.Lock()
+
+    def pending(self, room_id, day, hhmm):
+        """
+        방의 해당 요일/시각 예약 메시지 조회
+
+        Args:
+            room_id: 방 ID
+            day: 요일 (1=월요일, 7=일요일)
+            hhmm: 'HH:MM'
+
+        Returns:
+            활성화된 메시지 딕셔너리 리스트 (id 순)
+        """
+        self._ensure_built()
+
+        with self._lock:
+            return list(self._slots.get((day, hhmm), {}).get(room_id, ()))
+
+    def pending_all(self, day, hhmm):
+        """
+        모든 방의 해당 요일/시각 예약 메시지 조회
+
+        Returns:
+            room_id → 메시지 딕셔너리 리스트 (메시지가 있는 방만)
+        """
+        self._ensure_built()
+
+        with self._lock:
+            return {room_id: list(items) for room_id, items in self._slots.get((day, hhmm), {}).items()}
+
+    def upsert(self, message):
+        """메시지 추가/수정 반영 (to_dict() 결과, 비활성이면 인덱스에서 제거)"""
+        with self._lock:
+            self._changes += 1
+            if self._built_at is None:
+                if self._building:
+                    self._queued.append(message)
+                return
+            self._apply(message)
+
+    def remove(self, message_id):
+        """메시지 삭제 반영"""
+        with self._lock:
+            self._changes += 1
+            if self._built_at is None:
+                if self._building:
+                    self._queued.append(message_id)
+                return
+            self._discard(message_id)
+
+    def invalidate(self):
+        """인덱스 폐기 (다음 조회에서 다시 만듦)"""
+        with self._lock:
+            self._changes += 1
+            self._generation += 1
+            self._slots = {}
+            self._messages = {}
+            self._built_at = None
+            self._queued = []
+
+    def _ensure_built(self):
+        while True:
+            with self._lock:
+                if self._built_at is not None and time.monotonic() - self._built_at < self.rebuild_interval:
+                    return
+                changes = self._changes
+                generation = self._generation
+                first_build = self._built_at is None
+                if first_build:
+                    self._building += 1
+
+            try:
+                # 요일 비트마스크가 빈 메시지는 SQL에서 제외
+                messages = ScheduledMessage.query_pending().order_by(ScheduledMessage.id).all()
+                messages = [message.to_dict() for message in messages]
+            finally:
+                if first_build:
+                    with self._lock:
+                        self._building -= 1
+
+            with self._lock:
+                # 조회하는 동안 invalidate()가 호출되었으면 조회 결과가 그 전 상태일 수 있으므로 다시 조회
+                if self._generation != generation:
+                    continue
+
+                if self._built_at is not None:
+                    # 이미 만들어진 인덱스는 변경이 반영되어 있으므로 조회 도중 변경이 있었으면 이 결과를 버림
+                    # (재생성 시각을 갱신하지 않으므로 다음 조회에서 다시 시도)
+                    if self._changes != changes:
+                        return
+                    queued = []
+                else:
+                    # 처음 만드는 경우 결과를 버리면 이번 조회가 빈 목록이 되므로
+                    # 조회 도중 들어온 변경을 위에 다시 반영
+                    queued = self._queued
+
+                self._slots = {}
+                self._messages = {}
+                for message in messages:
+                    self._add(message)
+                for change in queued:
+                    if isinstance(change, dict):
+                        self._apply(change)
+                    else:
+                        self._discard(change)
+                self._queued = []
+                self._built_at = time.monotonic()
+                return
+
+    def _apply(self, message):
+        self._discard(message['id'])
+        if message['is_active']:
+            self._add(message)
+
+    def _add(self, message):
+        self._messages[message['id']] = message
+        for key in _slot_keys(message):
+            rooms = self._slots.setdefault(key, {})
+            items = [item for item in rooms.get(message['room_id'], ()) if item['id'] != message['id']]
+            items.append(message)
+            items.sort(key=lambda item: item['id'])
+            rooms[message['room_id']] = tuple(items)
+
+    def _discard(self, message_id):
+        message = self._messages.pop(message_id, None)
+        if message is None:
+            return
+        for key in _slot_keys(message):
+            rooms = self._slots.get(key)
+            if not rooms:
+                continue
+            items = tuple(item for item in rooms.get(message['room_id'], ()) if item['id'] != message_id)
+            if items:
+                rooms[message['room_id']] = items
+            else:
+                rooms.pop(message['room_id'], None)
+                if not rooms:
+                    del self._slots[key]
+
+
+schedule_index = ScheduleIndex()
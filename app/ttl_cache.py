@@ -0,0 +1,203 @@
+"""
+TTL + LRU 인메모리 캐시 (room_resolver, roster_cache 공용)
+
+캐시는 워커마다 따로 있으므로 SOCKETIO_MESSAGE_QUEUE가 Redis면 invalidate()/clear()를
+Redis 채널로 다른 워커에도 전달합니다. (전달되지 못한 무효화는 TTL이 지나면 반영)
+"""
+import contextvars
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# 워커 간 무효화 전달 채널
+INVALIDATION_CHANNEL = 'ttl_cache_invalidations'
+
+# defer_invalidations() 블록 안에서 모아 둔 (캐시, 키) 목록
+_deferred = contextvars.ContextVar('ttl_cache_deferred', default=None)
+
+# clear()를 나타내는 키
+_ALL = object()
+
+# 이름 → 캐시 (다른 워커에서 받은 무효화 반영용)
+_caches = {}
+
+# 무효화 전달용 Redis 클라이언트 (init_app 전에는 None, 이 워커에서만 무효화)
+_publisher = None
+
+# 자기가 보낸 무효화를 다시 반영하지 않기 위한 워커 식별자
+_worker_id = uuid.uuid4().hex
+
+
+def init_app(app):
+    """SOCKETIO_MESSAGE_QUEUE가 Redis면 무효화를 다른 워커와 주고받음 (처음 한 번만)"""
+    global _publisher
+
+    message_queue = app.config.get('SOCKETIO_MESSAGE_QUEUE')
+    if _publisher is not None or not (message_queue and message_queue.startswith(('redis://', 'rediss://'))):
+        return
+
+    import redis
+    from app import socketio
+
+    _publisher = redis.Redis.from_url(message_queue, decode_responses=True)
+    socketio.start_background_task(_listen, _publisher)
+    print('[TTLCache] Sharing invalidations across workers via Redis')
+
+
+def _publish(cache, key):
+    if _publisher is None or cache.name is None:
+        return
+
+    try:
+        _publisher.publish(INVALIDATION_CHANNEL, json.dumps({
+            'worker': _worker_id,
+            'cache': cache.name,
+            'all': key is _ALL,
+            'key': None if key is _ALL else key
+        }))
+    except Exception as e:
+        # 다른 워커는 TTL이 지나면 반영
+        print(f"[TTLCache] Failed to publish invalidation: {e}")
+
+
+def _listen(client):
+    from app import socketio
+
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                _receive(message['data'])
+        except Exception as e:
+            print(f"[TTLCache] Invalidation listener error: {e}")
+            # 연결이 끊긴 동안의 무효화를 놓쳤을 수 있으므로 전부 비움
+            for cache in _caches.values():
+                cache._drop_all()
+            socketio.sleep(1)
+
+
+def _receive(data):
+    """다른 워커에서 받은 무효화 반영 (다시 전달하지 않음)"""
+    message = json.loads(data)
+    cache = _caches.get(message['cache'])
+    if cache is None or message['worker'] == _worker_id:
+        return
+
+    if message['all']:
+        cache._drop_all()
+    else:
+        cache._drop(message['key'])
+
+
+@contextmanager
+def defer_invalidations():
+    """
+    블록 안의 invalidate()/clear()를 바로 반영하지 않고 모아 둠 (블록 안의 get()은 캐시를 거치지 않음)
+
+    바깥 트랜잭션이 커밋된 뒤 apply_invalidations()로 반영합니다.
+    (커밋 전에 무효화하면 그 사이 다른 요청이 커밋 전 값을 다시 캐시할 수 있음)
+    """
+    pending = []
+    token = _deferred.set(pending)
+    try:
+        yield pending
+    finally:
+        _deferred.reset(token)
+
+
+def apply_invalidations(pending):
+    """defer_invalidations()로 모아 둔 무효화 반영"""
+    for cache, key in pending:
+        if key is _ALL:
+            cache.clear()
+        else:
+            cache.invalidate(key)
+
+
+class TTLCache:
+    """
+    키별로 loader 결과를 보관하는 캐시 (스레드 안전)
+
+    조회하는 동안 invalidate()가 호출되면 오래된 값이므로 저장하지 않습니다.
+    cache_none=False면 loader가 None을 반환한 키는 저장하지 않습니다.
+    name을 지정하면 무효화를 다른 워커에도 전달합니다. (키는 JSON으로 직렬화 가능해야 함)
+    """
+
+    def __init__(self, loader, ttl, max_size, cache_none=True, name=None):
+        self.loader = loader
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self.cache_none = cache_none
+        self._entries = OrderedDict()
+        # 조회 중인 키별 토큰
+        self._loading = {}
+        self._lock = threading.Lock()
+        if name is not None:
+            _caches[name] = self
+
+    def get(self, key):
+        """캐시 → loader 순서로 조회"""
+        # 무효화를 미루는 동안에는 커밋 전 변경이 보이므로 캐시를 읽지도 저장하지도 않음
+        if _deferred.get() is not None:
+            return self.loader(key)
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+            token = object()
+            self._loading[key] = token
+
+        value = self.loader(key)
+
+        with self._lock:
+            if self._loading.get(key) is token:
+                del self._loading[key]
+                if value is not None or self.cache_none:
+                    self._entries[key] = (value, now + self.ttl)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                else:
+                    self._entries.pop(key, None)
+
+        return value
+
+    def invalidate(self, key):
+        """키 하나 무효화 (변경 커밋 후 호출)"""
+        pending = _deferred.get()
+        if pending is not None:
+            pending.append((self, key))
+            return
+
+        self._drop(key)
+        _publish(self, key)
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        pending = _deferred.get()
+        if pending is not None:
+            pending.append((self, _ALL))
+            return
+
+        self._drop_all()
+        _publish(self, _ALL)
+
+    def _drop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._loading.pop(key, None)
+
+    def _drop_all(self):
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
@@ -1,6 +1,8 @@
 """
 유틸리티 함수 모음
 """
+import base64
+import json
 import uuid
 from datetime import datetime
 
@@ -32,3 +34,107 @@ def generate_member_id():
 def generate_guest_id():
     """게스트 ID 생성"""
     return generate_id('GST')
+
+
+def encode_cursor(created_at, game_id):
+    """
+    목록 페이지 커서 생성 (created_at, game_id 기준, created_at이 없으면 null)
+
+    Returns:
+        URL에 그대로 쓸 수 있는 불투명 문자열
+    """
+    payload = json.dumps(
+        [created_at.isoformat() if created_at else None, game_id],
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    목록 페이지 커서 해석
+
+    Returns:
+        (created_at 또는 None, game_id)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, game_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at) if created_at is not None else None, str(game_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def paginate_games_by_cursor(query, limit, cursor=None, with_total=False):
+    """
+    경기 목록 커서(keyset) 페이지네이션
+
+    (created_at, game_id) 내림차순으로 정렬하고 커서 이후 항목만 조회합니다.
+    OFFSET 스캔 없이 인덱스를 따라 읽으며, 전체 개수(COUNT)는 with_total일 때만 조회합니다.
+    created_at이 없는 경기는 맨 앞에 옵니다. (PostgreSQL 내림차순 기본값과 같은 NULLS FIRST)
+
+    Args:
+        query: 필터가 적용된 Game 쿼리 (정렬 전)
+        limit: 페이지당 항목 수
+        cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+        with_total: 전체 항목 수 포함 여부
+
+    Returns:
+        (games, pagination)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 커서
+    """
+    from sqlalchemy import tuple_, and_, or_
+    from app.models import Game
+
+    limit = max(limit, 1)
+    total = query.order_by(None).count() if with_total else None
+
+    if cursor:
+        created_at, game_id = decode_cursor(cursor)
+        if created_at is None:
+            # created_at이 없는 경기 중 남은 것 + created_at이 있는 경기 전체
+            query = query.filter(or_(
+                and_(Game.created_at.is_(None), Game.game_id < game_id),
+                Game.created_at.isnot(None)
+            ))
+        else:
+            query = query.filter(tuple_(Game.created_at, Game.game_id) < tuple_(created_at, game_id))
+
+    # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+    games = query.order_by(
+        Game.created_at.desc().nulls_first(),
+        Game.game_id.desc()
+    ).limit(limit + 1).all()
+    has_next = len(games) > limit
+    games = games[:limit]
+
+    pagination = {
+        'limit': limit,
+        'next_cursor': encode_cursor(games[-1].created_at, games[-1].game_id) if has_next else None,
+        'has_next': has_next
+    }
+    if with_total:
+        pagination['total_items'] = total
+
+    return games, pagination
+
+
+def query_members_with_team(room_id):
+    """
+    방 멤버와 소속 팀 이름 조회 쿼리
+
+    Team을 outer join 하므로 멤버마다 팀을 다시 조회하지 않습니다.
+
+    Returns:
+        (Member, 팀 이름 또는 None) 행을 반환하는 쿼리 (필터 추가 가능)
+    """
+    from app.models import db, Member, Team
+
+    return db.session.query(Member, Team.name)\
+        .outerjoin(Team, Team.team_id == Member.team_id)\
+        .filter(Member.room_id == room_id)
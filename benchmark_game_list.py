@@ -0,0 +1,114 @@
+"""
+경기 목록 방 필터 벤치마크
+
+임시 SQLite DB에 합성 경기 데이터(기본 10만 건)를 만들고
+방 필터 조회 방식별 응답 시간을 비교합니다.
+
+    - room (legacy): Game.room 문자열 필터 (인덱스 없음, 전체 스캔)
+    - room_id:       방 이름 → room_id 변환 후 (room_id, created_at, game_id) 인덱스 조회
+    - room_id+cursor: room_id 필터 + 커서 페이지네이션 (COUNT 없음)
+
+사용법:
+    python benchmark_game_list.py [경기 수] [방 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+from flask import Flask
+from sqlalchemy import select
+
+from app.models import db, Room, Game
+from app.utils import paginate_games_by_cursor
+
+GAME_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+ROOM_COUNT = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+PAGE_SIZE = 10
+REPEAT = 50
+
+
+def short_id():
+    return str(uuid.uuid4())[:8].upper()
+
+
+def seed():
+    """합성 방/경기 데이터 생성"""
+    rooms = [{'room_id': short_id(), 'name': f'방{i}', 'created_at': datetime.utcnow()} for i in range(ROOM_COUNT)]
+    db.session.execute(Room.__table__.insert(), rooms)
+
+    started = datetime(2020, 1, 1)
+    games = []
+    for i in range(GAME_COUNT):
+        room = random.choice(rooms)
+        created_at = started + timedelta(minutes=i * 7)
+        games.append({
+            'game_id': short_id(),
+            'room_id': room['room_id'],
+            'room': room['name'],
+            'alias': created_at.date().isoformat(),
+            'date': created_at.date(),
+            'created_at': created_at,
+            'status': '종료',
+            'current_quarter': 4,
+            'version': 1
+        })
+    db.session.execute(Game.__table__.insert(), games)
+    db.session.commit()
+    return rooms
+
+
+def measure(label, fn):
+    """REPEAT회 실행 평균 시간 출력 (ms)"""
+    fn()
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    elapsed = (time.perf_counter() - started) * 1000 / REPEAT
+    print(f"  {label:<16} {elapsed:8.3f} ms")
+    return elapsed
+
+
+def main():
+    db_path = os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[Room.__table__, Game.__table__])
+
+        print(f"[Benchmark] 경기 {GAME_COUNT}건 / 방 {ROOM_COUNT}개 생성 중...")
+        rooms = seed()
+        room_name = random.choice(rooms)['name']
+
+        def legacy():
+            Game.query.filter(Game.room == room_name)\
+                .order_by(Game.created_at.desc())\
+                .paginate(page=5, per_page=PAGE_SIZE, error_out=False).items
+
+        def by_room_id():
+            room_id = db.session.execute(select(Room.room_id).where(Room.name == room_name)).scalar_one()
+            Game.query.filter(Game.room_id == room_id)\
+                .order_by(Game.created_at.desc())\
+                .paginate(page=5, per_page=PAGE_SIZE, error_out=False).items
+
+        def by_room_id_cursor():
+            room_id = db.session.execute(select(Room.room_id).where(Room.name == room_name)).scalar_one()
+            paginate_games_by_cursor(Game.query.filter(Game.room_id == room_id), PAGE_SIZE)
+
+        print(f"[Benchmark] '{room_name}' 방 경기 목록 (페이지당 {PAGE_SIZE}건, {REPEAT}회 평균)")
+        legacy_ms = measure('room (legacy)', legacy)
+        room_id_ms = measure('room_id', by_room_id)
+        cursor_ms = measure('room_id+cursor', by_room_id_cursor)
+
+        print(f"[Benchmark] room_id: {legacy_ms / room_id_ms:.1f}x, room_id+cursor: {legacy_ms / cursor_ms:.1f}x 빠름")
+
+    os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,11 @@ class Config:
     # Frontend URL
     FRONTEND_URL = os.environ.get('FRONTEND_URL') or 'http://localhost:3000'
 
+    # Socket.IO Message Queue (멀티 워커/멀티 인스턴스 모드)
+    # 설정하지 않으면 단일 프로세스 내에서만 브로드캐스트 (gunicorn -w 1)
+    # 예: redis://localhost:6379/0
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+
     # PostgreSQL (모든 데이터: 방/팀/멤버/경기)
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///basketball_games.db'  # 로컬 개발용 SQLite
@@ -0,0 +1,5 @@
+-- Migration: Add composite indexes for game list cursor pagination
+-- Description: 경기 목록을 (created_at, game_id) 내림차순 커서로 조회할 때 OFFSET/정렬 없이 인덱스를 따라 읽습니다.
+
+CREATE INDEX IF NOT EXISTS idx_game_created_at_id ON games(created_at, game_id);
+CREATE INDEX IF NOT EXISTS idx_game_room_created_at_id ON games(room_id, created_at, game_id);
@@ -0,0 +1,24 @@
+-- Migration: Replace scheduled_messages.days_of_week array with an integer bitmask
+-- Description: 요일을 비트마스크(bit 0=월요일 ... bit 6=일요일)로 저장해 pending 조회의 요일 필터를 SQL에서 처리합니다.
+--              (SQLite에서도 동일하게 동작, 기존 days_of_week 배열 컬럼은 남겨두고 더 이상 쓰지 않음)
+
+-- 1. 비트마스크 컬럼 추가
+ALTER TABLE scheduled_messages ADD COLUMN IF NOT EXISTS days_mask INTEGER NOT NULL DEFAULT 0;
+
+-- 2. 기존 배열 값으로 백필
+UPDATE scheduled_messages
+SET days_mask = COALESCE((
+    SELECT bit_or(1 << (day - 1))
+    FROM unnest(days_of_week) AS day
+    WHERE day BETWEEN 1 AND 7
+), 0)
+WHERE days_of_week IS NOT NULL;
+
+-- 3. 새로 생성하는 메시지는 배열 컬럼을 채우지 않음
+ALTER TABLE scheduled_messages ALTER COLUMN days_of_week DROP NOT NULL;
+
+-- 4. pending 조회용 복합 인덱스 (is_active 단일 인덱스는 대체)
+CREATE INDEX IF NOT EXISTS idx_scheduled_message_active_time ON scheduled_messages(is_active, scheduled_time);
+DROP INDEX IF EXISTS idx_scheduled_message_active;
+
+COMMENT ON COLUMN scheduled_messages.days_mask IS 'Days to send as bitmask (bit 0=Monday, ..., bit 6=Sunday)';
@@ -0,0 +1,16 @@
+-- Migration: Add scheduled message delivery ledger
+-- Description: 예약 메시지 발송 회차(message_id + 날짜/시각)별로 한 번만 전달하기 위한 기록 테이블
+
+CREATE TABLE IF NOT EXISTS scheduled_message_deliveries (
+    id SERIAL PRIMARY KEY,
+    message_id INTEGER REFERENCES scheduled_messages(id) ON DELETE CASCADE NOT NULL,
+    occurrence TIMESTAMP NOT NULL,
+    claimed_by VARCHAR(100),
+    claimed_at TIMESTAMP DEFAULT NOW(),
+    CONSTRAINT unique_message_occurrence UNIQUE (message_id, occurrence)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_message_delivery_occurrence ON scheduled_message_deliveries(occurrence);
+
+COMMENT ON TABLE scheduled_message_deliveries IS 'Scheduled message occurrences already handed out to a bot';
+COMMENT ON COLUMN scheduled_message_deliveries.occurrence IS 'Date and scheduled time of the send (minute precision)';
@@ -0,0 +1,18 @@
+-- Migration: Add score_events table (append-only scoring play log)
+-- Description: 득점 기록을 쌓고 쿼터 누적 점수는 기록이 추가될 때마다 증가시킵니다.
+
+CREATE TABLE IF NOT EXISTS score_events (
+    id SERIAL PRIMARY KEY,
+    game_id VARCHAR(8) NOT NULL REFERENCES games(game_id) ON DELETE CASCADE,
+    quarter_number INTEGER NOT NULL,
+    team VARCHAR(10) NOT NULL,
+    points INTEGER NOT NULL,
+    lineup_id INTEGER REFERENCES lineups(id) ON DELETE SET NULL,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_score_event_game_quarter ON score_events(game_id, quarter_number);
+
+COMMENT ON TABLE score_events IS 'Append-only scoring play log';
+COMMENT ON COLUMN score_events.points IS 'Points scored (negative for corrections)';
+COMMENT ON COLUMN score_events.lineup_id IS 'Scoring player (optional)';
@@ -0,0 +1,11 @@
+-- Migration: Add version columns to games, lineups and quarters (optimistic concurrency control)
+-- Description: 변경할 때마다 version이 1씩 증가하며, 읽은 이후 다른 기기가 먼저 변경했으면
+--              UPDATE가 0건이 되어 409 Conflict로 응답합니다.
+
+ALTER TABLE games ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE lineups ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE quarters ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+COMMENT ON COLUMN games.version IS 'Row version for optimistic concurrency control';
+COMMENT ON COLUMN lineups.version IS 'Row version for optimistic concurrency control';
+COMMENT ON COLUMN quarters.version IS 'Row version for optimistic concurrency control';
@@ -0,0 +1,9 @@
+-- Migration: Make unique_lineup constraint deferrable
+-- Description: 순번 재정렬(선수 제거, 순번 교체)을 선수별 2단계 UPDATE 대신 한 번의 UPDATE로 처리합니다.
+--              DEFERRABLE INITIALLY IMMEDIATE 제약은 행마다가 아니라 문장이 끝날 때 검사하므로
+--              번호를 서로 바꾸는 UPDATE도 중간 충돌 없이 실행됩니다.
+
+ALTER TABLE lineups DROP CONSTRAINT IF EXISTS unique_lineup;
+
+ALTER TABLE lineups
+ADD CONSTRAINT unique_lineup UNIQUE (game_id, team, number) DEFERRABLE INITIALLY IMMEDIATE;
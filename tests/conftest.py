@@ -0,0 +1,93 @@
+"""
+pytest 공용 fixture
+
+기본은 테스트마다 임시 SQLite 파일을 사용합니다.
+TEST_DATABASE_URL을 설정하면 그 DB에서 실행합니다. (예: postgresql://localhost/test, 실행 전 비워 둠)
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from app import create_app
+from app.models import db
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+from app.schedule_index import schedule_index
+from app.routes.game.state_cache import game_state_cache
+from app.routes.admin.auth import generate_token
+
+
+@pytest.fixture
+def app(tmp_path):
+    database_url = os.environ.get('TEST_DATABASE_URL') or f"sqlite:///{tmp_path / 'test.db'}"
+
+    class TestConfig(Config):
+        TESTING = True
+        DEBUG = False
+        SOCKETIO_MESSAGE_QUEUE = None
+        SQLALCHEMY_DATABASE_URI = database_url
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_pre_ping': True,
+            # SQLite: 동시 쓰기 시 잠금을 기다림
+            'connect_args': {'timeout': 30} if database_url.startswith('sqlite') else {}
+        }
+
+    # 프로세스 전역 캐시는 테스트마다 비움
+    room_resolver.clear()
+    roster_cache.clear()
+    schedule_index.invalidate()
+    game_state_cache.clear()
+
+    app = create_app(config_class=TestConfig)
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        if os.environ.get('TEST_DATABASE_URL'):
+            db.drop_all()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_headers(app):
+    with app.app_context():
+        return {'Authorization': f'Bearer {generate_token()}'}
+
+
+@pytest.fixture
+def count_queries(app):
+    """
+    블록 안에서 실행된 SQL 문장 수집
+
+        with count_queries() as statements:
+            client.post(...)
+        assert len(statements) <= 5
+    """
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    return counter
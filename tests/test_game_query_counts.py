@@ -0,0 +1,72 @@
+"""
+경기 변경 API의 SQL 문장 수 회귀 테스트
+
+응답과 브로드캐스트 데이터는 커밋 전에 직렬화하므로 커밋 후 다시 조회하지 않습니다.
+엔드포인트별 문장 수가 예산을 넘으면 다시 조회하는 코드가 들어온 것입니다.
+(SAVEPOINT/RELEASE 포함, SQLite 기준)
+"""
+
+# 엔드포인트별 최대 SQL 문장 수
+BUDGETS = {
+    'create': 3,
+    'arrival': 5,
+    'start': 2,
+    'toggle': 5,
+    'swap': 5,
+    'remove': 5,
+    'quarter_start': 7,
+    'score': 5,
+    'quarter_end': 4,
+    'quarter_cancel': 5,
+    'end': 3,
+    # 조회 3 + 경기 INSERT 1 + 복사한 선수 11명 INSERT
+    'copy': 15,
+}
+
+PLAYERS_PER_TEAM = 6
+
+
+def test_game_mutation_query_budgets(client, admin_headers, count_queries):
+    counts = {}
+
+    def call(label, method, url, **kwargs):
+        with count_queries() as statements:
+            response = getattr(client, method)(url, **kwargs)
+        assert response.status_code < 300, (label, response.get_json())
+        counts[label] = max(counts.get(label, 0), len(statements))
+        assert len(statements) <= BUDGETS[label], (label, statements)
+        return response.get_json()
+
+    # 방 이름 캐시를 채워 두고 측정
+    client.post('/api/game/create', json={'room': '테스트방'}, headers=admin_headers)
+    game = call('create', 'post', '/api/game/create', json={'room': '테스트방'}, headers=admin_headers)['data']
+    game_id = game['game_id']
+
+    lineups = {'home': [], 'away': []}
+    for team in lineups:
+        for i in range(PLAYERS_PER_TEAM):
+            lineup = call(
+                'arrival', 'post', f'/api/game/{game_id}/lineup/arrival',
+                json={'team': team, 'member': f'{team}{i}'}
+            )['data']
+            lineups[team].append(lineup)
+
+    call('start', 'post', f'/api/game/{game_id}/start', json={'team_home': '1팀', 'team_away': '2팀'})
+    call('toggle', 'put', f"/api/game/{game_id}/lineup/{lineups['home'][5]['id']}/toggle-status")
+    call('swap', 'put', f'/api/game/{game_id}/lineup/swap', json={
+        'from_team': 'home', 'from_number': 1, 'to_team': 'home', 'to_number': 2
+    })
+    call('remove', 'delete', f"/api/game/{game_id}/lineup/{lineups['away'][5]['id']}")
+
+    quarter_body = {'playing_home': [1, 2, 3, 4, 5], 'playing_away': [1, 2, 3, 4, 5]}
+    call('quarter_start', 'post', f'/api/game/{game_id}/quarter/start', json=quarter_body)
+    call('score', 'put', f'/api/game/{game_id}/quarter/1/score', json={'score_home': 10, 'score_away': 8})
+    call('quarter_end', 'post', f'/api/game/{game_id}/quarter/1/end')
+
+    call('quarter_start', 'post', f'/api/game/{game_id}/quarter/start', json=quarter_body)
+    call('quarter_cancel', 'delete', f'/api/game/{game_id}/quarter/2/cancel')
+
+    call('end', 'post', f'/api/game/{game_id}/end')
+    call('copy', 'post', f'/api/game/{game_id}/copy', headers=admin_headers)
+
+    assert set(counts) == set(BUDGETS)
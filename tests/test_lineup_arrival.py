@@ -0,0 +1,74 @@
+"""
+동시 도착 처리 시 라인업 번호 배정 테스트
+
+번호는 INSERT 안에서 MAX + 1로 계산하고, 충돌하면 savepoint로 되돌린 뒤 재시도합니다.
+동시에 50명이 도착해도 번호가 1..50으로 중복 없이 배정되어야 합니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app.models import db, Lineup
+from app.routes.game.commands import insert_lineup_with_next_number
+
+PLAYERS = 50
+
+
+def create_game(client, admin_headers):
+    response = client.post('/api/game/create', json={'room': '테스트방'}, headers=admin_headers)
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['data']['game_id']
+
+
+def lineup_numbers(app, game_id, team):
+    with app.app_context():
+        return sorted(
+            number for (number,) in db.session.query(Lineup.number).filter_by(game_id=game_id, team=team)
+        )
+
+
+def test_concurrent_insert_assigns_unique_numbers(app, client, admin_headers):
+    game_id = create_game(client, admin_headers)
+    barrier = threading.Barrier(PLAYERS)
+
+    def arrive(i):
+        with app.app_context():
+            barrier.wait()
+            lineup = insert_lineup_with_next_number(
+                game_id=game_id,
+                team='home',
+                member_id=f'GUEST_{i:04d}',
+                is_guest=True,
+                member=f'선수{i}',
+                arrived=True,
+                arrived_at=datetime.utcnow()
+            )
+            number = lineup.number
+            db.session.commit()
+            return number
+
+    with ThreadPoolExecutor(max_workers=PLAYERS) as executor:
+        numbers = list(executor.map(arrive, range(PLAYERS)))
+
+    assert sorted(numbers) == list(range(1, PLAYERS + 1))
+    assert lineup_numbers(app, game_id, 'home') == list(range(1, PLAYERS + 1))
+
+
+def test_concurrent_player_arrival_requests(app, client, admin_headers):
+    game_id = create_game(client, admin_headers)
+    barrier = threading.Barrier(PLAYERS)
+
+    def arrive(i):
+        barrier.wait()
+        response = app.test_client().post(
+            f'/api/game/{game_id}/lineup/arrival',
+            json={'team': 'away', 'member': f'선수{i}'}
+        )
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['data']['number']
+
+    with ThreadPoolExecutor(max_workers=PLAYERS) as executor:
+        numbers = list(executor.map(arrive, range(PLAYERS)))
+
+    assert sorted(numbers) == list(range(1, PLAYERS + 1))
+    assert lineup_numbers(app, game_id, 'away') == list(range(1, PLAYERS + 1))
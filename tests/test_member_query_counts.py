@@ -0,0 +1,88 @@
+"""
+멤버/팀 목록·조회 API의 SQL 문장 수 회귀 테스트
+
+멤버의 팀 이름은 명단 스냅샷이나 query_members_with_team()의 outer join으로 함께 읽으므로
+문장 수가 멤버 수에 비례하면(N+1) 안 됩니다.
+캐시를 비운 상태에서 멤버 5명(동명이인 2명) 방과 30명(동명이인 10명) 방의 문장 수가 같은지 확인합니다.
+"""
+import pytest
+
+from app.room_resolver import room_resolver
+from app.roster_cache import roster_cache
+
+TEAMS = ['A', 'B', 'C']
+
+# 캐시를 비운 상태의 최대 SQL 문장 수 (방 이름 조회 1 + 명단 조회 최대 2)
+MAX_STATEMENTS = 3
+
+
+def create_room(client, admin_headers, room, member_count):
+    """팀 3개와 멤버를 만들고 팀에 고르게 배정 (앞쪽 1/3은 동명이인 'dup')"""
+    assert client.post('/api/room/create', json={'name': room}).status_code < 300
+    for team in TEAMS:
+        client.post('/api/commands/team/', json={'room': room, 'team': team}, headers=admin_headers)
+
+    duplicates = max(2, member_count // 3)
+    for i in range(member_count):
+        name = 'dup' if i < duplicates else f'm{i}'
+        response = client.post('/api/commands/member/', json={'room': room, 'member': name}, headers=admin_headers)
+        assert response.status_code < 300, response.get_json()
+
+    members = client.get(f'/api/commands/member/list?room={room}').get_json()['data']['members']
+    for i, member in enumerate(members):
+        response = client.post('/api/commands/member_team/', json={
+            'room': room,
+            'member': member['name'],
+            'member_id': member['member_id'],
+            'team': TEAMS[i % len(TEAMS)]
+        }, headers=admin_headers)
+        assert response.status_code < 300, response.get_json()
+
+    return members
+
+
+def endpoint_requests(room, members):
+    """엔드포인트별 (method, url, body, 기대 status)"""
+    single = next(m for m in members if m['name'] != 'dup')
+    return {
+        'member_list': ('get', f'/api/commands/member/list?room={room}', None, 200),
+        'team_list': ('get', f'/api/commands/team/list?room={room}', None, 200),
+        'team_get': ('get', f'/api/commands/team/?room={room}&team=A', None, 200),
+        'member_get': ('get', f"/api/commands/member/?room={room}&member={single['name']}", None, 200),
+        'member_get_by_id': ('get', f"/api/commands/member/?room={room}&member_id={single['member_id']}", None, 200),
+        'member_get_duplicate': ('get', f'/api/commands/member/?room={room}&member=dup', None, 200),
+        'member_team_get': ('get', f"/api/commands/member_team/?room={room}&member={single['name']}", None, 200),
+        'member_team_get_duplicate': ('get', f'/api/commands/member_team/?room={room}&member=dup', None, 200),
+        # 동명이인이면 변경하지 않고 후보 목록(팀 이름 포함)을 반환
+        'member_delete_duplicate': ('delete', '/api/commands/member/', {'room': room, 'member': 'dup'}, 409),
+        'member_team_post_duplicate': ('post', '/api/commands/member_team/', {'room': room, 'member': 'dup', 'team': 'A'}, 409),
+        'member_team_delete_duplicate': ('delete', '/api/commands/member_team/', {'room': room, 'member': 'dup'}, 409),
+    }
+
+
+ENDPOINTS = sorted(endpoint_requests('', [{'name': 'm', 'member_id': ''}]))
+
+
+@pytest.fixture
+def rooms(client, admin_headers):
+    return {
+        size: endpoint_requests(f'방{size}', create_room(client, admin_headers, f'방{size}', size))
+        for size in (5, 30)
+    }
+
+
+@pytest.mark.parametrize('endpoint', ENDPOINTS)
+def test_member_endpoints_do_not_query_per_member(client, admin_headers, count_queries, rooms, endpoint):
+    counts = {}
+    for size, requests in rooms.items():
+        method, url, body, status = requests[endpoint]
+        room_resolver.clear()
+        roster_cache.clear()
+
+        with count_queries() as statements:
+            response = getattr(client, method)(url, json=body, headers=admin_headers)
+        assert response.status_code == status, response.get_json()
+        counts[size] = len(statements)
+
+    assert counts[5] == counts[30], counts
+    assert counts[30] <= MAX_STATEMENTS, counts
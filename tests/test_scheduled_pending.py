@@ -0,0 +1,40 @@
+"""
+예약 메시지 pending 조회의 발송 회차 선점 테스트
+"""
+from datetime import date
+
+from app.delivery_ledger import occurrence_date
+
+
+def test_occurrence_date_uses_nearest_matching_weekday():
+    wednesday = date(2026, 10, 14)
+
+    assert occurrence_date(3, wednesday) == wednesday
+    assert occurrence_date(1, wednesday) == date(2026, 10, 12)
+    assert occurrence_date(6, wednesday) == date(2026, 10, 17)
+    assert occurrence_date(7, wednesday) == date(2026, 10, 11)
+
+
+def test_claims_are_per_requested_weekday(client, admin_headers):
+    client.post('/api/room/create', json={'name': '테스트방'})
+    response = client.post('/api/scheduled-messages', json={
+        'room': '테스트방',
+        'message': '공지',
+        'scheduled_time': '09:00',
+        'days_of_week': [1, 3]
+    }, headers=admin_headers)
+    assert response.status_code == 201, response.get_json()
+
+    def pending_all(day):
+        response = client.get(f'/api/scheduled-messages/pending/all?current_time=09:00&current_day={day}')
+        assert response.status_code == 200, response.get_json()
+        return response.get_json()['data']['pending_messages']
+
+    wednesday = client.get('/api/scheduled-messages/pending?room=테스트방&current_time=09:00&current_day=3')
+    assert [m['message'] for m in wednesday.get_json()['data']['pending_messages']] == ['공지']
+
+    # 다른 요일의 같은 시각은 다른 회차
+    assert [m['message'] for m in pending_all(1)['테스트방']] == ['공지']
+
+    # 같은 회차는 한 번만
+    assert pending_all(1) == {}